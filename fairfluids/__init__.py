@@ -3,44 +3,92 @@ FAIRFluids - A framework for creating FAIR fluid data documents.
 
 This package provides tools for creating, parsing, and manipulating
 FAIR-compliant fluid property data with standardized metadata.
+
+The public names below resolve lazily through a module-level ``__getattr__``:
+``import fairfluids`` itself loads no third-party package, and the data model,
+the I/O stack (pandas, requests, pubchem) and the plotting helpers are imported
+on first use. Short-lived CLI conversions and process-pool workers only pay for
+what they touch.
 """
 
+import sys
+from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 __author__ = "FAIRChemistry Team"
 __email__ = "contact@fairchemistry.org"
 
-# Import main classes for easy access
-from .core.lib import (
-    FAIRFluidsDocument,
-    Version,
-    Citation,
-    Author,
-    Compound,
-    Fluid,
-    Property,
-    PropertyValue,
-    Parameter,
-    ParameterValue,
-    Measurement,
-    UnitDefinition,
-    BaseUnit,
-    Method,
-    Properties,
-    Parameters,
-    LitType,
-)
-
-from .io import FluidIO, FAIRFluidsCMLParser, from_cml, from_csv, from_thermoml
-from .core.functionalities import filter_fluid_compounds_by_mole_fractions
-from .operations import (
-    combine_compounds,
-    calculate_ratio_of_solvent,
-    cleanup_orphaned_parameters,
-)
-from .core.visualization import filter_fluid_measurements
-from .core.plot_utils import save_plot_as_svg, reset_plot_counter
+# Public name -> module that defines it (imported on first attribute access).
+_LAZY_ATTRS = {
+    **dict.fromkeys(
+        (
+            "FAIRFluidsDocument",
+            "Version",
+            "Citation",
+            "Author",
+            "Compound",
+            "Fluid",
+            "Property",
+            "PropertyValue",
+            "Parameter",
+            "ParameterValue",
+            "Measurement",
+            "UnitDefinition",
+            "BaseUnit",
+            "Method",
+            "Properties",
+            "Parameters",
+            "LitType",
+        ),
+        ".core.lib",
+    ),
+    **dict.fromkeys(
+        ("FluidIO", "FAIRFluidsCMLParser", "from_cml", "from_csv", "from_thermoml"), ".io"
+    ),
+    "filter_fluid_compounds_by_mole_fractions": ".core.functionalities",
+    **dict.fromkeys(
+        ("combine_compounds", "calculate_ratio_of_solvent", "cleanup_orphaned_parameters"),
+        ".operations",
+    ),
+    "filter_fluid_measurements": ".core.visualization",
+    "save_plot_as_svg": ".core.plot_utils",
+    "reset_plot_counter": ".core.plot_utils",
+}
+
+# Subpackages that used to be bound as attributes by the eager imports.
+_SUBMODULES = ("analysis", "core", "inspection", "io", "operations", "visualization")
+
+if TYPE_CHECKING:
+    from .core.functionalities import filter_fluid_compounds_by_mole_fractions
+    from .core.lib import (
+        Author,
+        BaseUnit,
+        Citation,
+        Compound,
+        FAIRFluidsDocument,
+        Fluid,
+        LitType,
+        Measurement,
+        Method,
+        Parameter,
+        Parameters,
+        ParameterValue,
+        Properties,
+        Property,
+        PropertyValue,
+        UnitDefinition,
+        Version,
+    )
+    from .core.plot_utils import reset_plot_counter, save_plot_as_svg
+    from .core.visualization import filter_fluid_measurements
+    from .io import FAIRFluidsCMLParser, FluidIO, from_cml, from_csv, from_thermoml
+    from .operations import (
+        calculate_ratio_of_solvent,
+        cleanup_orphaned_parameters,
+        combine_compounds,
+    )
 
 
 def _save_to_json_compat(self: "FAIRFluidsDocument", filename: str = "fairfluids_document.json") -> None:
@@ -49,9 +97,62 @@ def _save_to_json_compat(self: "FAIRFluidsDocument", filename: str = "fairfluids
     out.write_text(self.model_dump_json(indent=4), encoding="utf-8")
 
 
-# Older workflows call `doc.save_to_json(...)`; reattach this helper method.
-if not hasattr(FAIRFluidsDocument, "save_to_json"):
-    FAIRFluidsDocument.save_to_json = _save_to_json_compat  # type: ignore[attr-defined]
+def _attach_save_to_json(document_cls: type) -> None:
+    """Older workflows call ``doc.save_to_json(...)``; reattach this helper method."""
+    if not hasattr(document_cls, "save_to_json"):
+        document_cls.save_to_json = _save_to_json_compat  # type: ignore[attr-defined]
+
+
+class _DataModelFinder:
+    """Attach the ``save_to_json`` shim whenever the generated data model loads.
+
+    The data model is no longer imported eagerly, and it is reached from several
+    places (``fairfluids.FAIRFluidsDocument``, ``fairfluids.core``, ``from
+    fairfluids.core.lib import ...``, the I/O converters). Hooking the import
+    of :mod:`fairfluids.core.lib` itself covers all of them.
+    """
+
+    name = f"{__name__}.core.lib"
+
+    @classmethod
+    def find_spec(cls, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if fullname != cls.name:
+            return None
+        from importlib.machinery import PathFinder
+
+        spec = PathFinder.find_spec(fullname, path)
+        if spec is None or spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_and_attach(module: Any) -> None:
+            exec_module(module)
+            _attach_save_to_json(module.FAIRFluidsDocument)
+
+        spec.loader.exec_module = exec_and_attach  # type: ignore[method-assign]
+        return spec
+
+
+if _DataModelFinder.name in sys.modules:
+    _attach_save_to_json(sys.modules[_DataModelFinder.name].FAIRFluidsDocument)
+elif _DataModelFinder not in sys.meta_path:
+    sys.meta_path.insert(0, _DataModelFinder)  # type: ignore[arg-type]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
+
 
 # Convenience imports
 __all__ = [
@@ -33,15 +33,27 @@ try:
 except ImportError as exc:
     raise ImportError(_BAYESIAN_EXTRA_HINT) from exc
 
+from .batched import PosteriorDraws
+from .cache import FitCache
+from .checkpoint import Checkpoint
 from .comparison import ModelComparison, compare_models, posterior_summary
 from .data import BayesianDataset, BayesianGroup
-from .inference import BayesianFit, GroupFit, fit_groups, predict, predict_averaged
+from .hierarchical import Hierarchical, PopulationFit
+from .inference import (
+    BayesianFit,
+    GroupFit,
+    clear_sampler_cache,
+    fit_groups,
+    predict,
+    predict_averaged,
+    sampler_cache_info,
+)
 from .models import BayesianModel, ModelRegistry, get_model, list_models
 
-# Synthesise and register a NumPyro model for every symbolic model on import.
+# Synthesise and register a NumPyro model for every symbolic model on first access.
 from . import bridge
 
-bridge.register_all()
+ModelRegistry.defer(bridge.register_all)
 
 from .priors import (
     HalfNormal,
@@ -55,7 +67,10 @@ from .priors import (
     prior_predictive_quantiles,
     sample_prior,
 )
+from .predictive import clear_predictive_cache, predictive_cache_info, predictive_draws
+from .profiling import CompileCounter, SamplerTiming
 from .setup import enable_x64, set_host_count, set_platform
+from .storage import StoragePolicy
 from .workflow import BayesianWorkflow
 from .writeback import fit_to_fairfluids_document, fit_to_fitted_models
 
@@ -70,16 +85,26 @@ __all__ = [
     "BayesianFit",
     "GroupFit",
     "BayesianWorkflow",
+    "Hierarchical",
+    "PopulationFit",
+    "Checkpoint",
+    "CompileCounter",
+    "FitCache",
     "ModelComparison",
     "ModelRegistry",
     "Prior",
+    "PosteriorDraws",
     "PriorSet",
     "PriorSpec",
+    "SamplerTiming",
+    "StoragePolicy",
     "Uniform",
     "Normal",
     "HalfNormal",
     "LogNormal",
     "TruncatedNormal",
+    "clear_predictive_cache",
+    "clear_sampler_cache",
     "compare_models",
     "enable_x64",
     "fit_groups",
@@ -91,8 +116,11 @@ __all__ = [
     "posterior_summary",
     "predict",
     "predict_averaged",
+    "predictive_cache_info",
+    "predictive_draws",
     "prior_predictive_quantiles",
     "sample_prior",
+    "sampler_cache_info",
     "set_host_count",
     "set_platform",
 ]
@@ -3,9 +3,9 @@
 Like :mod:`fairfluids.analysis.regression.bridge`, this module removes the need
 for a codegen pipeline: instead of rendering one ``BayesianModel`` subclass per
 model into ``_generated/`` (and hand-writing the reparametrised density variants
-in ``models_builtin``), it builds them *at import time* from the single source of
-truth — the :class:`~fairfluids.analysis.models.SymbolicModel` instances in
-:data:`fairfluids.analysis.models.registry`.
+in ``models_builtin``), it builds them *on first registry access* from the single
+source of truth — the :class:`~fairfluids.analysis.models.SymbolicModel`
+instances in :data:`fairfluids.analysis.models.registry`.
 
 A single generic base, :class:`_SymbolicBayesianModel`, implements every hook the
 inference / workflow / plotting machinery relies on:
@@ -56,22 +56,17 @@ def _feature_aliases(model: SymbolicModel) -> dict[str, str]:
     return {f: str(aliases.get(f, f)) for f in model.features}
 
 
-def _eval_bound_expr(expr: Any, t_array: "jax.Array") -> "jax.Array":
+def _eval_bound_expr(sm: SymbolicModel, expr: Any, t_array: "jax.Array") -> "jax.Array":
     """Evaluate a feature-dependent bound expression (e.g. ``"min(T) - 5.0"``).
 
-    The primary feature array is exposed as ``T``; ``min``/``max``/``mean`` are
-    the JAX reductions so the result stays traceable inside the NumPyro model.
+    The primary feature array is exposed as ``T``; the hint is compiled once per
+    model (see :meth:`SymbolicModel.compiled_hint`) and its ``min``/``max``/``mean``
+    resolve to the JAX reductions so the result stays traceable inside the
+    NumPyro model.
     """
     import jax.numpy as jnp
 
-    namespace = {
-        "min": lambda a: jnp.min(a),
-        "max": lambda a: jnp.max(a),
-        "mean": lambda a: jnp.mean(a),
-        "T": t_array,
-        "inf": float("inf"),
-    }
-    return eval(str(expr), {"__builtins__": {}}, namespace)  # noqa: S307
+    return sm.compiled_hint(expr)(t_array, xp=jnp)
 
 
 class _SymbolicBayesianModel(BayesianModel):
@@ -185,7 +180,8 @@ class _SymbolicBayesianModel(BayesianModel):
             if cfg and isinstance(spec, Uniform):
                 upper = spec.high
                 if "upper_expr" in cfg:
-                    upper = jnp.minimum(spec.high, _eval_bound_expr(cfg["upper_expr"], t_array))
+                    bound = _eval_bound_expr(sm, cfg["upper_expr"], t_array)
+                    upper = jnp.minimum(spec.high, bound)
                 lower = jnp.minimum(spec.low, upper - float(cfg.get("lower_margin", 1.0)))
                 params[pname] = numpyro.sample(pname, dist.Uniform(lower, upper))
             else:
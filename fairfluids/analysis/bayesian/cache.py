@@ -0,0 +1,263 @@
+"""Content-addressed on-disk cache of per-``(model, group)`` fits.
+
+:class:`FitCache` persists every :class:`~fairfluids.analysis.bayesian.inference.GroupFit`
+produced by :func:`~fairfluids.analysis.bayesian.inference.fit_groups` under a
+hash of everything its draws depend on:
+
+- the model definition (class path and source hash, or the serialised
+  :class:`SymbolicModel` fingerprint for bridge models) and its group-bound
+  instance state,
+- the priors (:class:`PriorSet`),
+- the group data (``group_id``, features, observation and uncertainty),
+- the sampler settings and sampling path,
+- the PRNG key of the job (which folds in ``seed`` and the job's position).
+
+Each entry is a directory holding the ``InferenceData`` (NetCDF or Zarr) and a
+``meta.json`` with the priors, ``model_kwargs`` and convergence diagnostics.
+Loaded fits carry a :class:`~fairfluids.analysis.bayesian.batched.PosteriorDraws`
+rebuilt from the stored posterior in place of the ``MCMC`` object::
+
+    cache = FitCache("~/.cache/fairfluids-fits")
+    fit = fit_groups(dataset, models, seed=0, cache=cache)  # samples, then stores
+    fit = fit_groups(dataset, models, seed=0, cache=cache)  # loads, samples nothing
+
+Changing any input changes the key, so stale entries are never returned; they
+are simply left behind (:meth:`FitCache.clear` removes everything).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from .batched import PosteriorDraws
+from .priors import PriorSet
+from .profiling import SamplerTiming
+from .storage import idata_group_names
+
+if TYPE_CHECKING:
+    import arviz as az
+
+    from .data import BayesianGroup
+    from .inference import GroupFit
+    from .models import BayesianModel
+
+_CACHE_VERSION = 1
+_META_FILE = "meta.json"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serialisable")
+
+
+def _model_definition(run_model: "BayesianModel") -> str:
+    """Identity of the model's mathematics.
+
+    The symbolic fingerprint for bridge models; otherwise the class path plus a
+    hash of the class source, so editing a hand-written model invalidates its
+    entries. The class path alone is used when the source is unavailable.
+    """
+    symbolic = getattr(type(run_model), "symbolic_model", None)
+    if symbolic is not None:
+        return symbolic.fingerprint
+    cls = type(run_model)
+    path = f"{cls.__module__}.{cls.__qualname__}"
+    try:
+        source = inspect.getsource(cls)
+    except (OSError, TypeError):
+        return path
+    return f"{path}:{hashlib.sha256(source.encode('utf-8')).hexdigest()}"
+
+
+def fit_key(
+    run_model: "BayesianModel",
+    group: "BayesianGroup",
+    priors: PriorSet,
+    run_key: Any,
+    *,
+    sampler: str,
+    **settings: Any,
+) -> str:
+    """Hash of every input that determines one ``(model, group)`` fit.
+
+    ``run_model`` is the group-bound model (:meth:`BayesianModel.bind_group`),
+    ``run_key`` the job's PRNG key and ``sampler`` the sampling path (``"mcmc"``
+    or ``"bucketed"``; the two draw different chains from the same key).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    header = {
+        "version": _CACHE_VERSION,
+        "model": run_model.name,
+        "definition": _model_definition(run_model),
+        "state": run_model.model_dump(mode="json"),
+        "priors": priors.model_dump(mode="json"),
+        "group_id": repr(group.group_id),
+        "log_observation": group.log_observation,
+        "sampler": sampler,
+        "settings": sorted(settings.items()),
+    }
+    h.update(json.dumps(header, sort_keys=True, default=_json_default).encode("utf-8"))
+    for name in sorted(group.features):
+        h.update(name.encode("utf-8"))
+        h.update(np.ascontiguousarray(group.features[name], dtype=float).tobytes())
+    for arr in (group.observation, group.observation_uncertainty):
+        if arr is None:
+            h.update(b"\x00none")
+        else:
+            h.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+    h.update(np.ascontiguousarray(np.asarray(run_key)).tobytes())
+    return h.hexdigest()
+
+
+class FitCache:
+    """Directory of persisted ``GroupFit`` results keyed by :func:`fit_key`.
+
+    Args:
+        directory: Cache root; created on first write.
+        format: ``"netcdf"`` (default, needs ``netCDF4``/``h5netcdf``/``scipy``)
+            or ``"zarr"`` (needs ``zarr``) for the stored ``InferenceData``.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        format: Literal["netcdf", "zarr"] = "netcdf",
+    ) -> None:
+        if format not in ("netcdf", "zarr"):
+            raise ValueError(f"Unknown cache format {format!r}; expected 'netcdf' or 'zarr'.")
+        self.directory = Path(directory).expanduser()
+        self.format = format
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def __contains__(self, key: str) -> bool:
+        return (self._entry(key) / _META_FILE).is_file()
+
+    def load(self, key: str, group: "BayesianGroup") -> "GroupFit | None":
+        """Return the fit stored under ``key`` (attached to ``group``), or ``None``."""
+        import arviz as az
+
+        from .inference import GroupFit
+
+        entry = self._entry(key)
+        meta_path = entry / _META_FILE
+        if not meta_path.is_file():
+            self.misses += 1
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        data_path = entry / meta["data_file"]
+        if meta["format"] == "zarr":
+            idata = az.from_zarr(str(data_path))
+        else:
+            idata = az.from_netcdf(str(data_path))
+        self.hits += 1
+        return GroupFit(
+            model_name=meta["model_name"],
+            group=group,
+            priors=PriorSet.model_validate(meta["priors"]),
+            mcmc=_draws_from_inference_data(idata),
+            inference_data=idata,
+            rhat=meta["rhat"],
+            ess_bulk=meta["ess_bulk"],
+            ess_tail=meta["ess_tail"],
+            num_divergences=int(meta["num_divergences"]),
+            model_kwargs=meta["model_kwargs"],
+            wall_seconds=meta.get("wall_seconds"),
+            timing=SamplerTiming(**meta["timing"]) if meta.get("timing") else None,
+        )
+
+    def save(self, key: str, gfit: "GroupFit") -> Path:
+        """Persist ``gfit`` under ``key`` and return the entry directory.
+
+        The entry is written to a temporary sibling and renamed into place, so
+        an interrupted write never leaves a half-populated entry behind.
+        """
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        data_file = "inference_data.zarr" if self.format == "zarr" else "inference_data.nc"
+        meta = {
+            "version": _CACHE_VERSION,
+            "format": self.format,
+            "data_file": data_file,
+            "model_name": gfit.model_name,
+            "group_id": repr(gfit.group_id),
+            "priors": gfit.priors.model_dump(mode="json"),
+            "model_kwargs": gfit.model_kwargs,
+            "rhat": gfit.rhat,
+            "ess_bulk": gfit.ess_bulk,
+            "ess_tail": gfit.ess_tail,
+            "num_divergences": gfit.num_divergences,
+            "wall_seconds": gfit.wall_seconds,
+            "timing": gfit.timing.as_dict() if gfit.timing is not None else None,
+        }
+        tmp = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=entry.parent))
+        try:
+            if self.format == "zarr":
+                gfit.inference_data.to_zarr(str(tmp / data_file))
+            else:
+                gfit.inference_data.to_netcdf(str(tmp / data_file))
+            (tmp / _META_FILE).write_text(
+                json.dumps(meta, indent=1, default=_json_default), encoding="utf-8"
+            )
+            if entry.exists():
+                shutil.rmtree(entry)
+            tmp.rename(entry)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        return entry
+
+    def clear(self) -> None:
+        """Delete every stored entry and reset the hit/miss counters."""
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        if not self.directory.exists():
+            return 0
+        return sum(1 for _ in self.directory.glob(f"*/*/{_META_FILE}"))
+
+    def __repr__(self) -> str:
+        return (
+            f"FitCache({str(self.directory)!r}, format={self.format!r}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+def _draws_from_inference_data(idata: "az.InferenceData") -> PosteriorDraws:
+    """Rebuild ``(chain, draw, ...)`` sample and sampler-stat arrays from ``idata``."""
+    posterior = idata["posterior"]
+    samples = {str(name): np.asarray(da.values) for name, da in posterior.data_vars.items()}
+    extra: dict[str, np.ndarray] = {}
+    if "sample_stats" in idata_group_names(idata):
+        stats = idata["sample_stats"]
+        extra = {str(name): np.asarray(da.values) for name, da in stats.data_vars.items()}
+    return PosteriorDraws(samples=samples, extra_fields=extra)
+
+
+def as_fit_cache(cache: "FitCache | str | os.PathLike[str] | None") -> FitCache | None:
+    """Accept a :class:`FitCache` or a directory path (``None`` disables caching)."""
+    if cache is None or isinstance(cache, FitCache):
+        return cache
+    return FitCache(cache)
+
+
+__all__ = ["FitCache", "as_fit_cache", "fit_key"]
@@ -0,0 +1,147 @@
+"""Checkpoint and resume for long :func:`fit_groups` runs.
+
+A :class:`Checkpoint` is a run directory. With ``fit_groups(..., checkpoint=...)``
+every completed :class:`~fairfluids.analysis.bayesian.inference.GroupFit` is
+written there as soon as it finishes. A restarted run with the same directory
+loads the completed ``(model, group)`` jobs and samples only the rest::
+
+    fit = fit_groups(dataset, models, seed=0, checkpoint="runs/viscosity")
+    # ... crash, kernel restart ...
+    fit = fit_groups(dataset, models, seed=0, checkpoint="runs/viscosity")  # resumes
+
+The directory holds
+
+- ``fits/``: a :class:`~fairfluids.analysis.bayesian.cache.FitCache`, so a job
+  is only resumed when its model, priors, data, sampler settings and PRNG key
+  are unchanged (:func:`~fairfluids.analysis.bayesian.cache.fit_key`);
+- ``manifest.jsonl``: one JSON line per completed job, appended and flushed on
+  completion, with its wall time and timing split
+  (:class:`~fairfluids.analysis.bayesian.profiling.SamplerTiming`), divergences,
+  minimum bulk ESS and ESS per second. :meth:`Checkpoint.manifest` reads it
+  back as a ``DataFrame``.
+
+``resume=False`` removes the stored fits and the manifest before the run
+starts; other files in the directory are kept.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import pandas as pd
+
+from .cache import FitCache, _json_default
+from .profiling import job_throughput
+
+if TYPE_CHECKING:
+    from .inference import GroupFit
+
+_MANIFEST_FILE = "manifest.jsonl"
+
+_THROUGHPUT_COLUMNS = [
+    "wall_seconds",
+    "compile_seconds",
+    "warmup_seconds",
+    "sampling_seconds",
+    "grad_evals",
+    "mean_tree_depth",
+    "ess_bulk_min",
+    "ess_per_second",
+]
+
+MANIFEST_COLUMNS = [
+    "key",
+    "model",
+    "group_id",
+    "group_label",
+    "n_points",
+    *_THROUGHPUT_COLUMNS,
+    "num_divergences",
+    "finished_at",
+]
+
+
+class Checkpoint:
+    """Run directory of completed fits plus a progress manifest.
+
+    Args:
+        directory: Run directory; created on the first completed job.
+        format: Storage format of the fits (see :class:`FitCache`).
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        format: Literal["netcdf", "zarr"] = "netcdf",
+    ) -> None:
+        self.directory = Path(directory).expanduser()
+        self.fits = FitCache(self.directory / "fits", format=format)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / _MANIFEST_FILE
+
+    def save(self, key: str, gfit: "GroupFit") -> None:
+        """Store ``gfit`` under ``key`` and append its manifest line."""
+        self.fits.save(key, gfit)
+        throughput = job_throughput(gfit)
+        row = {
+            "key": key,
+            "model": gfit.model_name,
+            "group_id": repr(gfit.group_id),
+            "group_label": gfit.group.group_label,
+            "n_points": gfit.group.n_points,
+            **{col: throughput[col] for col in _THROUGHPUT_COLUMNS},
+            "num_divergences": gfit.num_divergences,
+            "finished_at": _dt.datetime.now(_dt.timezone.utc).isoformat(timespec="seconds"),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(row, default=_json_default) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def manifest(self) -> pd.DataFrame:
+        """Completed jobs, one row per job (the latest line wins for repeated keys).
+
+        A line cut short by a crash is skipped.
+        """
+        rows: list[dict[str, Any]] = []
+        if self.manifest_path.is_file():
+            for line in self.manifest_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        df = pd.DataFrame(rows, columns=MANIFEST_COLUMNS)
+        return df.drop_duplicates("key", keep="last").reset_index(drop=True)
+
+    def __len__(self) -> int:
+        return len(self.fits)
+
+    def clear(self) -> None:
+        """Delete every stored fit and the manifest.
+
+        Only ``fits/`` and ``manifest.jsonl`` are removed; any other file in the
+        run directory is left alone.
+        """
+        self.fits.clear()
+        self.manifest_path.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        return f"Checkpoint({str(self.directory)!r}, completed={len(self)})"
+
+
+def as_checkpoint(checkpoint: "Checkpoint | str | os.PathLike[str] | None") -> Checkpoint | None:
+    """Accept a :class:`Checkpoint` or a directory path (``None`` disables checkpointing)."""
+    if checkpoint is None or isinstance(checkpoint, Checkpoint):
+        return checkpoint
+    return Checkpoint(checkpoint)
+
+
+__all__ = ["Checkpoint", "MANIFEST_COLUMNS", "as_checkpoint"]
@@ -62,6 +62,7 @@ def compare_models(
     *,
     pareto_k_thresholds: tuple[float, ...] = (0.7, 1.0),
     method: str = "stacking",
+    max_workers: int | None = None,
 ) -> ModelComparison:
     """Per-group ArviZ comparison plus aggregated diagnostics.
 
@@ -71,29 +72,28 @@ def compare_models(
             ``pareto_k > threshold`` will be added as columns.
         method: Weighting method forwarded to :func:`arviz.compare`
             (``"stacking"``, ``"BB-pseudo-BMA"`` or ``"pseudo-BMA"``).
+        max_workers: Threads used to compute the per-fit PSIS-LOO results that
+            are not memoised yet (see :meth:`BayesianFit.loo`). ``az.compare``
+            reuses them instead of recomputing LOO.
     """
     import arviz as az
 
     per_group_best_rows: list[dict[str, Any]] = []
     per_group_model_rows: list[dict[str, Any]] = []
 
+    all_loo = fit.loo(max_workers=max_workers)
     for gid in fit.group_ids:
-        model_to_idata: dict[str, "az.InferenceData"] = {}
-        loo_per_model: dict[str, "az.ELPDData"] = {}
-        for m_name in fit.model_names:
-            try:
-                gfit = fit.get(m_name, gid)
-            except KeyError:
-                continue
-            model_to_idata[m_name] = gfit.inference_data
-            loo_per_model[m_name] = az.loo(gfit.inference_data, pointwise=True)
-
-        if not model_to_idata:
+        loo_per_model: dict[str, "az.ELPDData"] = {
+            m_name: all_loo[(m_name, gid)]
+            for m_name in fit.model_names
+            if (m_name, gid) in all_loo
+        }
+        if not loo_per_model:
             continue
 
-        comp_df = az.compare(model_to_idata, method=method)
+        comp_df = az.compare(loo_per_model, method=method)
         best_model = str(comp_df.index[0])
-        group_label = fit.get(next(iter(model_to_idata)), gid).group.group_label
+        group_label = fit.get(next(iter(loo_per_model)), gid).group.group_label
         elpd_col = "elpd" if "elpd" in comp_df.columns else "elpd_loo"
         per_group_best_rows.append(
             {
@@ -104,8 +104,7 @@ def compare_models(
             }
         )
 
-        for m_name in model_to_idata:
-            loo = loo_per_model[m_name]
+        for m_name, loo in loo_per_model.items():
             k = _pareto_k(loo)
             comp_row = comp_df.loc[m_name] if m_name in comp_df.index else None
             row: dict[str, Any] = {
@@ -10,11 +10,20 @@ The grouping schema (``group_by``) and the feature columns (``features``) are
 fully user-configurable: this is what makes the framework generic across
 ``viscosity-vs-T``, ``density-vs-composition`` and similar workflows without
 re-writing the data pipeline.
+
+Groups are cut from one sorted array per column (:meth:`BayesianDataset.from_columns`,
+which :meth:`~BayesianDataset.from_documents` also uses), so their arrays are
+views rather than per-group copies. :meth:`BayesianDataset.save` /
+:meth:`~BayesianDataset.load` persist a prepared dataset to ``.npz`` so large
+corpora are extracted once rather than in every sampling session.
 """
 
 from __future__ import annotations
 
+import json
+import os
 import warnings
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
 
 import numpy as np
@@ -34,6 +43,23 @@ def _to_jax_array(arr: np.ndarray) -> "jax.Array":
     return jnp.asarray(arr)
 
 
+_DATASET_FORMAT_VERSION = 1
+
+
+def bucket_size(n_points: int) -> int:
+    """Smallest power of two ``>= n_points``: the padded length of a shape bucket.
+
+    Padding every group up to one of a few power-of-two lengths lets a compiled
+    sampler be reused across groups (JAX retraces on every new array shape).
+    """
+    return 1 << max(int(n_points) - 1, 0).bit_length()
+
+
+def _pad_edge(arr: np.ndarray, size: int) -> np.ndarray:
+    arr = np.asarray(arr, dtype=float)
+    return np.pad(arr, (0, size - arr.shape[0]), mode="edge")
+
+
 def _group_key_to_str(key: tuple[Any, ...]) -> str:
     return " | ".join(
         f"{x:.6g}" if isinstance(x, float) else str(x) for x in key
@@ -59,7 +85,8 @@ class BayesianGroup(BaseModel):
     raw_observation: np.ndarray
     raw_observation_uncertainty: np.ndarray | None = None
     log_observation: bool = True
-    dataframe: pd.DataFrame
+    # Source rows of the group; ``None`` once detached by a lean StoragePolicy.
+    dataframe: pd.DataFrame | None = None
 
     @property
     def n_points(self) -> int:
@@ -76,6 +103,41 @@ class BayesianGroup(BaseModel):
             return None
         return _to_jax_array(self.observation_uncertainty)
 
+    def padded(self, size: int | None = None) -> dict[str, Any]:
+        """Feature/observation arrays padded to ``size`` plus a boolean ``mask``.
+
+        ``size`` defaults to :func:`bucket_size` of :attr:`n_points`. Arrays are
+        *edge*-padded (the last point is repeated) so ``min``/``max``-style
+        feature-dependent prior bounds are unaffected; ``mask`` is ``True`` for
+        the real points and is passed to ``BayesianModel.numpyro_model`` to drop
+        the padding from the likelihood. A missing ``observation_uncertainty``
+        becomes zeros (the same likelihood) so every group has the same structure.
+        The keys match the ``numpyro_model`` keyword arguments.
+        """
+        size = bucket_size(self.n_points) if size is None else int(size)
+        if size < self.n_points:
+            raise ValueError(
+                f"Cannot pad group {self.group_label!r} with {self.n_points} points "
+                f"to size {size}."
+            )
+        unc = (
+            self.observation_uncertainty
+            if self.observation_uncertainty is not None
+            else np.zeros(self.n_points)
+        )
+        return {
+            "features": {name: _pad_edge(arr, size) for name, arr in self.features.items()},
+            "observation": _pad_edge(self.observation, size),
+            "observation_uncertainty": _pad_edge(unc, size),
+            "mask": np.arange(size) < self.n_points,
+        }
+
+    def padded_jax(self, size: int | None = None) -> dict[str, Any]:
+        """:meth:`padded` with every array converted to JAX."""
+        import jax
+
+        return jax.tree_util.tree_map(_to_jax_array, self.padded(size))
+
     def __repr__(self) -> str:
         return (
             f"BayesianGroup(label={self.group_label!r}, n={self.n_points}, "
@@ -83,6 +145,180 @@ class BayesianGroup(BaseModel):
         )
 
 
+def _scalar(value: Any) -> Any:
+    # Plain Python scalars keep group ids and metadata identical after a
+    # save/load round trip (``repr`` of ``np.float64`` differs from ``float``).
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    # Metadata may hold arbitrary objects; they are stored as text.
+    return str(value)
+
+
+def _check_columns(
+    available: Iterable[str],
+    property_value_col: str,
+    feature_names: tuple[str, ...],
+    group_by_cols: tuple[str, ...],
+) -> None:
+    available = list(available)
+    if property_value_col not in available:
+        raise KeyError(
+            f"Extracted DataFrame is missing {property_value_col!r}. "
+            f"Available columns: {available}"
+        )
+    missing_features = [c for c in feature_names if c not in available]
+    if missing_features:
+        raise KeyError(
+            f"Extracted DataFrame is missing requested feature columns: {missing_features}. "
+            f"Available: {available}"
+        )
+    missing_group = [c for c in group_by_cols if c not in available]
+    if missing_group:
+        raise KeyError(
+            f"Extracted DataFrame is missing group_by columns: {missing_group}. "
+            f"Available: {available}"
+        )
+    if not group_by_cols:
+        raise ValueError("group_by must name at least one column.")
+
+
+def _build_groups(
+    columns: pd.DataFrame | Mapping[str, Any],
+    *,
+    property: str,
+    feature_names: tuple[str, ...],
+    group_by_cols: tuple[str, ...],
+    min_points: int,
+    log_observation: bool,
+    keep_dataframes: bool,
+) -> tuple[list[BayesianGroup], list[dict[str, Any]]]:
+    """Sort the rows once and cut them into groups at the ``group_by`` boundaries.
+
+    Every group's feature, observation and uncertainty arrays are slices of one
+    sorted array per column; metadata comes from each group's first row.
+    """
+    if isinstance(columns, pd.DataFrame):
+        frame: pd.DataFrame | None = columns
+        cols = {str(name): columns[name].to_numpy() for name in columns.columns}
+    else:
+        frame = None
+        cols = {str(name): np.asarray(values) for name, values in columns.items()}
+    lengths = {arr.shape[0] for arr in cols.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}.")
+
+    property_value_col = f"{property}_value"
+    property_unc_col = f"{property}_uncertainty"
+    _check_columns(cols, property_value_col, feature_names, group_by_cols)
+
+    # Drop rows with NaN in critical columns
+    raw_obs_all = np.asarray(cols[property_value_col], dtype=float)
+    feats_all = {f: np.asarray(cols[f], dtype=float) for f in feature_names}
+    keep = ~np.isnan(raw_obs_all)
+    for arr in feats_all.values():
+        keep &= ~np.isnan(arr)
+    rows = np.flatnonzero(keep)
+    if rows.size == 0:
+        return [], []
+
+    # Sort by the group keys (dictionary-encoded in sorted order, missing values
+    # last, like ``sort_values``) and then by the features.
+    codes = [
+        pd.factorize(cols[c][rows], sort=True, use_na_sentinel=False)[0] for c in group_by_cols
+    ]
+    sort_keys = [feats_all[f][rows] for f in reversed(feature_names)] + codes[::-1]
+    perm = np.lexsort(sort_keys)
+    order = rows[perm]
+    n = order.size
+    boundary = np.zeros(n, dtype=bool)
+    boundary[0] = True
+    for code in codes:
+        code = code[perm]
+        boundary[1:] |= code[1:] != code[:-1]
+    starts = np.flatnonzero(boundary)
+    stops = np.append(starts[1:], n)
+
+    features = {f: feats_all[f][order] for f in feature_names}
+    raw_obs = raw_obs_all[order]
+    obs = np.log(np.clip(raw_obs, 1e-300, None)) if log_observation else raw_obs
+
+    raw_unc: np.ndarray | None = None
+    obs_unc: np.ndarray | None = None
+    has_raw_unc = np.zeros(starts.size, dtype=bool)
+    has_obs_unc = np.zeros(starts.size, dtype=bool)
+    if property_unc_col in cols:
+        unc_col = pd.Series(cols[property_unc_col][order])
+        raw_unc = pd.to_numeric(unc_col, errors="coerce").to_numpy(dtype=float)
+        has_raw_unc = np.logical_or.reduceat(~np.isnan(raw_unc), starts)
+        if log_observation:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                obs_unc = raw_unc / np.where(raw_obs > 0, raw_obs, np.nan)
+            has_obs_unc = has_raw_unc & np.logical_or.reduceat(~np.isnan(obs_unc), starts)
+        else:
+            obs_unc = raw_unc
+            has_obs_unc = has_raw_unc
+
+    first = order[starts]
+    meta_cols = [c for c in cols if c not in feature_names]
+    meta_first = {c: cols[c][first] for c in meta_cols}
+    key_first = {c: cols[c][first] for c in group_by_cols}
+    sorted_frame = None
+    if keep_dataframes:
+        base = frame if frame is not None else pd.DataFrame(cols)
+        sorted_frame = base.take(order).reset_index(drop=True)
+
+    groups: list[BayesianGroup] = []
+    dropped: list[dict[str, Any]] = []
+    for k, (a, b) in enumerate(zip(starts.tolist(), stops.tolist())):
+        key = tuple(_scalar(key_first[c][k]) for c in group_by_cols)
+        n_points = b - a
+        if n_points < min_points:
+            dropped.append({"group_id": key, "n_points": n_points, "reason": "min_points"})
+            continue
+        metadata = {c: _scalar(meta_first[c][k]) for c in meta_cols}
+        metadata["group_by"] = dict(zip(group_by_cols, key))
+        groups.append(
+            BayesianGroup(
+                group_id=key,
+                group_label=_group_key_to_str(key),
+                metadata=metadata,
+                features={f: arr[a:b] for f, arr in features.items()},
+                observation=obs[a:b],
+                observation_uncertainty=obs_unc[a:b] if has_obs_unc[k] else None,
+                raw_observation=raw_obs[a:b],
+                raw_observation_uncertainty=raw_unc[a:b] if has_raw_unc[k] else None,
+                log_observation=log_observation,
+                dataframe=(
+                    sorted_frame.iloc[a:b].reset_index(drop=True)
+                    if sorted_frame is not None
+                    else None
+                ),
+            )
+        )
+    return groups, dropped
+
+
+def _warn_missing_uncertainty(groups: list[BayesianGroup], property: str) -> None:
+    n_with_unc = sum(1 for g in groups if g.observation_uncertainty is not None)
+    coverage = n_with_unc / len(groups)
+    if coverage < 1.0:
+        missing = len(groups) - n_with_unc
+        warnings.warn(
+            f"Measurement uncertainty missing for {missing}/{len(groups)} groups "
+            f"({100 * (1 - coverage):.0f} %). Those groups will rely solely on "
+            f"model_sigma. Check whether {property!r}_uncertainty is present in the "
+            f"source documents if you expected per-point sigmas.",
+            UserWarning,
+            stacklevel=3,
+        )
+
+
 class BayesianDataset(BaseModel):
     """Collection of :class:`BayesianGroup` objects with shared schema.
 
@@ -122,6 +358,7 @@ class BayesianDataset(BaseModel):
         composition_filter: Mapping[str, tuple[float, float]] | None = None,
         row_filter: Callable[[pd.DataFrame], Any] | None = None,
         system_label_key: str = "system_name",
+        keep_dataframes: bool = True,
     ) -> "BayesianDataset":
         """Build a dataset from one or more FAIRFluids documents.
 
@@ -149,6 +386,9 @@ class BayesianDataset(BaseModel):
                 algebra that plugs in directly here.
             system_label_key: Column name to use for the per-document label when
                 ``documents`` is a mapping.
+            keep_dataframes: Attach each group's source rows as
+                :attr:`BayesianGroup.dataframe`. ``False`` skips the per-group
+                DataFrame copies (see :meth:`from_columns`).
         """
         feature_names = tuple(features)
         group_by_cols = tuple(group_by)
@@ -161,29 +401,16 @@ class BayesianDataset(BaseModel):
         if row_filter is not None:
             extra.setdefault("keep_only_relevant_columns", False)
 
-        if isinstance(documents, Mapping):
-            doc_iter = list(documents.items())
-        else:
-            doc_iter = [(None, doc) for doc in documents]
-
-        frames: list[pd.DataFrame] = []
-        for label, doc in doc_iter:
-            df = extract_property_dataframe(
-                doc, property_type=property, **extra
-            )
-            if df.empty:
-                continue
-            if label is not None:
-                df = df.copy()
-                df[system_label_key] = label
-            frames.append(df)
-
-        if not frames:
+        # One extraction call over all documents: it labels mapping entries with
+        # ``system_label_key`` and concatenates once.
+        docs = dict(documents) if isinstance(documents, Mapping) else list(documents)
+        extra["document_label_key"] = system_label_key
+        df_all = extract_property_dataframe(docs, property_type=property, **extra)
+        if df_all.empty:
             raise ValueError(
                 f"No data extracted for property={property!r} from supplied documents."
             )
-
-        df_all = pd.concat(frames, ignore_index=True)
+        df_all = df_all.reset_index(drop=True)
 
         if composition_filter:
             for col, (low, high) in composition_filter.items():
@@ -207,106 +434,73 @@ class BayesianDataset(BaseModel):
             if df_all.empty:
                 raise ValueError("row_filter removed all rows; nothing left to fit.")
 
-        property_value_col = f"{property}_value"
-        property_unc_col = f"{property}_uncertainty"
-        if property_value_col not in df_all.columns:
-            raise KeyError(
-                f"Extracted DataFrame is missing {property_value_col!r}. "
-                f"Available columns: {list(df_all.columns)}"
-            )
-        missing_features = [c for c in feature_names if c not in df_all.columns]
-        if missing_features:
-            raise KeyError(
-                f"Extracted DataFrame is missing requested feature columns: {missing_features}. "
-                f"Available: {list(df_all.columns)}"
-            )
-        missing_group = [c for c in group_by_cols if c not in df_all.columns]
-        if missing_group:
-            raise KeyError(
-                f"Extracted DataFrame is missing group_by columns: {missing_group}. "
-                f"Available: {list(df_all.columns)}"
+        groups, dropped = _build_groups(
+            df_all,
+            property=property,
+            feature_names=feature_names,
+            group_by_cols=group_by_cols,
+            min_points=min_points,
+            log_observation=log_observation,
+            keep_dataframes=keep_dataframes,
+        )
+        if not groups:
+            raise ValueError(
+                f"No groups passed min_points={min_points}; dropped {len(dropped)} groups."
             )
+        _warn_missing_uncertainty(groups, property)
+        return cls(
+            property=property,
+            feature_names=feature_names,
+            group_by=group_by_cols,
+            log_observation=log_observation,
+            groups=groups,
+            dropped_groups=dropped,
+        )
 
-        # Drop rows with NaN in critical columns
-        critical_cols = [property_value_col, *feature_names]
-        df_all = df_all.dropna(subset=critical_cols).reset_index(drop=True)
-
-        sort_cols = [c for c in (*group_by_cols, *feature_names) if c in df_all.columns]
-        if sort_cols:
-            df_all = df_all.sort_values(sort_cols).reset_index(drop=True)
-
-        groups: list[BayesianGroup] = []
-        dropped: list[dict[str, Any]] = []
-        for raw_key, sub in df_all.groupby(list(group_by_cols), dropna=False, sort=False):
-            key = raw_key if isinstance(raw_key, tuple) else (raw_key,)
-            n_points = len(sub)
-            if n_points < min_points:
-                dropped.append({"group_id": key, "n_points": n_points, "reason": "min_points"})
-                continue
-
-            features_arrays = {
-                col: np.asarray(sub[col].to_numpy(), dtype=float) for col in feature_names
-            }
-            raw_obs = np.asarray(sub[property_value_col].to_numpy(), dtype=float)
-            if log_observation:
-                obs = np.log(np.clip(raw_obs, 1e-300, None))
-            else:
-                obs = raw_obs
-
-            raw_unc: np.ndarray | None = None
-            obs_unc: np.ndarray | None = None
-            if property_unc_col in sub.columns:
-                raw_unc_arr = pd.to_numeric(sub[property_unc_col], errors="coerce").to_numpy(
-                    dtype=float
-                )
-                if np.any(~np.isnan(raw_unc_arr)):
-                    raw_unc = raw_unc_arr
-                    if log_observation:
-                        with np.errstate(divide="ignore", invalid="ignore"):
-                            propagated = raw_unc_arr / np.where(raw_obs > 0, raw_obs, np.nan)
-                        if np.all(np.isnan(propagated)):
-                            obs_unc = None
-                        else:
-                            obs_unc = propagated
-                    else:
-                        obs_unc = raw_unc_arr
-
-            metadata = {col: sub[col].iloc[0] for col in sub.columns if col not in feature_names}
-            metadata["group_by"] = dict(zip(group_by_cols, key))
+    @classmethod
+    def from_columns(
+        cls,
+        columns: pd.DataFrame | Mapping[str, Any],
+        *,
+        property: str,
+        features: Iterable[str] = ("temperature",),
+        group_by: Iterable[str] = ("source_doi",),
+        min_points: int = 3,
+        log_observation: bool = True,
+        keep_dataframes: bool = False,
+    ) -> "BayesianDataset":
+        """Build a dataset straight from columnar extraction output.
 
-            groups.append(
-                BayesianGroup(
-                    group_id=key,
-                    group_label=_group_key_to_str(key),
-                    metadata=metadata,
-                    features=features_arrays,
-                    observation=obs,
-                    observation_uncertainty=obs_unc,
-                    raw_observation=raw_obs,
-                    raw_observation_uncertainty=raw_unc,
-                    log_observation=log_observation,
-                    dataframe=sub.reset_index(drop=True),
-                )
-            )
+        ``columns`` is a DataFrame or a mapping ``column -> 1-D array`` with the
+        same columns :func:`extract_property_dataframe` produces (already
+        concatenated and filtered). Rows are sorted once and every group's arrays
+        are views into one shared array per column, so no per-group copies or
+        DataFrames are made unless ``keep_dataframes=True``.
+        :meth:`from_documents` goes through the same path.
 
+        Args:
+            columns: The extracted rows.
+            property, features, group_by, min_points, log_observation: As in
+                :meth:`from_documents`.
+            keep_dataframes: Attach each group's source rows as
+                :attr:`BayesianGroup.dataframe` (off by default).
+        """
+        feature_names = tuple(features)
+        group_by_cols = tuple(group_by)
+        groups, dropped = _build_groups(
+            columns,
+            property=property,
+            feature_names=feature_names,
+            group_by_cols=group_by_cols,
+            min_points=min_points,
+            log_observation=log_observation,
+            keep_dataframes=keep_dataframes,
+        )
         if not groups:
             raise ValueError(
                 f"No groups passed min_points={min_points}; dropped {len(dropped)} groups."
             )
-
-        n_with_unc = sum(1 for g in groups if g.observation_uncertainty is not None)
-        coverage = n_with_unc / len(groups)
-        if coverage < 1.0:
-            missing = len(groups) - n_with_unc
-            warnings.warn(
-                f"Measurement uncertainty missing for {missing}/{len(groups)} groups "
-                f"({100 * (1 - coverage):.0f} %). Those groups will rely solely on "
-                f"model_sigma. Check whether {property!r}_uncertainty is present in the "
-                f"source documents if you expected per-point sigmas.",
-                UserWarning,
-                stacklevel=2,
-            )
-
+        _warn_missing_uncertainty(groups, property)
         return cls(
             property=property,
             feature_names=feature_names,
@@ -351,6 +545,127 @@ class BayesianDataset(BaseModel):
             rows.append(row)
         return pd.DataFrame(rows)
 
+    def buckets(self) -> dict[int, list[int]]:
+        """Group indices keyed by padded length (:func:`bucket_size`), smallest first.
+
+        Groups in one bucket share array shapes after :meth:`BayesianGroup.padded`,
+        so a sampler compiled for the bucket can be reused for all of them.
+        """
+        out: dict[int, list[int]] = {}
+        for idx, grp in enumerate(self.groups):
+            out.setdefault(bucket_size(grp.n_points), []).append(idx)
+        return dict(sorted(out.items()))
+
+    def save(self, path: str | os.PathLike[str]) -> Path:
+        """Persist the prepared groups to ``.npz`` so later sessions skip extraction.
+
+        Group arrays are stored concatenated with one offset per group; ids,
+        labels, metadata and the dropped-group log go into a JSON header
+        (metadata values JSON cannot hold are stored as text). Per-group
+        DataFrames are not stored. Nothing beyond numpy is needed.
+        """
+        path = Path(path)
+        if path.suffix.lower() != ".npz":
+            raise ValueError(
+                f"Unsupported BayesianDataset file suffix {path.suffix!r}; use '.npz'."
+            )
+
+        def concat(arrays: list[np.ndarray]) -> np.ndarray:
+            return np.concatenate(arrays).astype(float) if arrays else np.empty(0)
+
+        def concat_optional(name: str) -> tuple[np.ndarray, np.ndarray]:
+            parts = [getattr(g, name) for g in self.groups]
+            present = np.array([p is not None for p in parts], dtype=bool)
+            filled = [
+                np.full(g.n_points, np.nan) if p is None else p
+                for g, p in zip(self.groups, parts)
+            ]
+            return concat(filled), present
+
+        header = {
+            "version": _DATASET_FORMAT_VERSION,
+            "property": self.property,
+            "feature_names": list(self.feature_names),
+            "group_by": list(self.group_by),
+            "log_observation": self.log_observation,
+            "group_ids": [list(g.group_id) for g in self.groups],
+            "group_labels": [g.group_label for g in self.groups],
+            "group_log_observation": [g.log_observation for g in self.groups],
+            "metadata": [g.metadata for g in self.groups],
+            "dropped_groups": self.dropped_groups,
+        }
+        obs_unc, has_obs_unc = concat_optional("observation_uncertainty")
+        raw_unc, has_raw_unc = concat_optional("raw_observation_uncertainty")
+        arrays: dict[str, np.ndarray] = {
+            "header": np.asarray(json.dumps(header, default=_json_default)),
+            "offsets": np.concatenate(
+                ([0], np.cumsum([g.n_points for g in self.groups]))
+            ).astype(np.int64),
+            "observation": concat([g.observation for g in self.groups]),
+            "raw_observation": concat([g.raw_observation for g in self.groups]),
+            "observation_uncertainty": obs_unc,
+            "has_observation_uncertainty": has_obs_unc,
+            "raw_observation_uncertainty": raw_unc,
+            "has_raw_observation_uncertainty": has_raw_unc,
+        }
+        for i, feat in enumerate(self.feature_names):
+            arrays[f"feature_{i}"] = concat([g.features[feat] for g in self.groups])
+        np.savez(path, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> "BayesianDataset":
+        """Load a dataset written by :meth:`save`; group arrays are views into shared arrays."""
+        path = Path(path)
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            if header.get("version") != _DATASET_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported BayesianDataset file version {header.get('version')!r}; "
+                    f"expected {_DATASET_FORMAT_VERSION}."
+                )
+            arrays = {name: data[name] for name in data.files if name != "header"}
+
+        feature_names = tuple(header["feature_names"])
+        offsets = arrays["offsets"].tolist()
+        groups: list[BayesianGroup] = []
+        for k, (a, b) in enumerate(zip(offsets[:-1], offsets[1:])):
+            key = tuple(header["group_ids"][k])
+            groups.append(
+                BayesianGroup(
+                    group_id=key,
+                    group_label=header["group_labels"][k],
+                    metadata=header["metadata"][k],
+                    features={
+                        f: arrays[f"feature_{i}"][a:b] for i, f in enumerate(feature_names)
+                    },
+                    observation=arrays["observation"][a:b],
+                    observation_uncertainty=(
+                        arrays["observation_uncertainty"][a:b]
+                        if arrays["has_observation_uncertainty"][k]
+                        else None
+                    ),
+                    raw_observation=arrays["raw_observation"][a:b],
+                    raw_observation_uncertainty=(
+                        arrays["raw_observation_uncertainty"][a:b]
+                        if arrays["has_raw_observation_uncertainty"][k]
+                        else None
+                    ),
+                    log_observation=header["group_log_observation"][k],
+                )
+            )
+        dropped = [
+            {**entry, "group_id": tuple(entry["group_id"])} for entry in header["dropped_groups"]
+        ]
+        return cls(
+            property=header["property"],
+            feature_names=feature_names,
+            group_by=tuple(header["group_by"]),
+            log_observation=header["log_observation"],
+            groups=groups,
+            dropped_groups=dropped,
+        )
+
     def iter_groups(self) -> Iterable[BayesianGroup]:
         return iter(self.groups)
 
@@ -358,4 +673,4 @@ class BayesianDataset(BaseModel):
         return len(self.groups)
 
 
-__all__ = ["BayesianDataset", "BayesianGroup"]
+__all__ = ["BayesianDataset", "BayesianGroup", "bucket_size"]
@@ -0,0 +1,177 @@
+"""Process-pool distribution of ``(model, group)`` MCMC jobs.
+
+:func:`~fairfluids.analysis.bayesian.inference.fit_groups` with
+``executor="process"`` ships each ``(model, group)`` job to a worker process
+started with the ``spawn`` method, so every worker owns an independent JAX
+runtime and CPU device (``set_host_count`` only parallelises the chains *within*
+one job). Finished :class:`GroupFit` objects stream back through
+:func:`concurrent.futures.as_completed` and feed the parent's progress bar.
+
+Reproducibility does not depend on the number of workers: the per-job PRNG keys
+are derived in the parent with the usual fold-in scheme and shipped with the
+job, and the worker mirrors the parent's ``jax_enable_x64`` setting.
+
+Models are not pickled as instances (the bridge synthesises their classes at
+import time). A job carries the model name, its pydantic state (priors,
+likelihood, ...) and, for symbolic models, the serialised
+:class:`~fairfluids.analysis.models.SymbolicModel`; the worker rebuilds the
+model from those, registering user-defined symbolic models on the fly.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .data import BayesianDataset
+    from .inference import GroupFit
+    from .models import BayesianModel
+    from .priors import PriorSet
+
+
+def model_payload(model: "BayesianModel") -> dict[str, Any]:
+    """Everything a worker needs to rebuild ``model`` (see :func:`rebuild_model`)."""
+    symbolic = getattr(type(model), "symbolic_model", None)
+    payload: dict[str, Any] = {"name": model.name, "state": model.model_dump(), "symbolic": None}
+    if symbolic is not None:
+        from ..models.io import to_dict
+
+        payload["symbolic"] = to_dict(symbolic)
+    return payload
+
+
+def rebuild_model(payload: dict[str, Any]) -> "BayesianModel":
+    """Instantiate the model described by :func:`model_payload` in this process."""
+    from ..models.io import from_dict
+    from .bridge import build_model
+    from .models import ModelRegistry, get_model
+
+    name = payload["name"]
+    symbolic = payload["symbolic"]
+    if name not in ModelRegistry.names():
+        if symbolic is None:
+            raise KeyError(
+                f"Bayesian model {name!r} is not registered in the worker process. "
+                "Define custom BayesianModel subclasses in an importable module "
+                "(not in __main__ or a notebook) to use executor='process'."
+            )
+        build_model(from_dict(symbolic))
+    elif symbolic is not None:
+        registered = getattr(ModelRegistry.get(name), "symbolic_model", None)
+        if registered is not None and registered.fingerprint != from_dict(symbolic).fingerprint:
+            raise ValueError(
+                f"Bayesian model {name!r} is registered differently in the worker "
+                "process than in the parent."
+            )
+    return get_model(name, **payload["state"])
+
+
+def _init_worker(enable_x64: bool) -> None:
+    """Pin the worker's JAX runtime to the CPU and mirror the parent's precision."""
+    from .setup import enable_x64 as _enable_x64
+    from .setup import set_platform
+
+    set_platform("cpu")
+    _enable_x64(enable_x64)
+
+
+def run_job(job: dict[str, Any]) -> tuple[int, int, "GroupFit"]:
+    """Worker entry point: fit one ``(model, group)`` job and return its ``GroupFit``.
+
+    ``GroupFit.mcmc`` is a :class:`~fairfluids.analysis.bayesian.batched.PosteriorDraws`
+    (an ``MCMC`` object holds compiled functions and cannot be sent back).
+    """
+    import jax
+    import jax.numpy as jnp
+
+    from .batched import PosteriorDraws
+    from .inference import _build_group_fit, _fit_model_bucketed, _sample_group
+
+    model = rebuild_model(job["model"])
+    dataset: BayesianDataset = job["dataset"]
+    group = dataset.groups[0]
+    priors: PriorSet = job["priors"]
+    key = jnp.asarray(job["key"])
+    settings = job["settings"]
+
+    started = time.perf_counter()
+    fits: list[GroupFit] = []
+    pending = [0]
+    if job["bucketed"]:
+        pending = _fit_model_bucketed(
+            model, dataset, [key], priors, fits.append, vectorize=False, **settings
+        )
+    if pending:
+        run_model = model.bind_group(group)
+        mcmc, idata, timing = _sample_group(run_model, group, key, priors, **settings)
+        draws = PosteriorDraws(
+            samples=jax.device_get(mcmc.get_samples(group_by_chain=True)),
+            extra_fields=jax.device_get(mcmc.get_extra_fields(group_by_chain=True)),
+        )
+        fits.append(_build_group_fit(model.name, group, priors, draws, idata, run_model, timing))
+        fits[0].wall_seconds = time.perf_counter() - started
+    return job["m_idx"], job["g_idx"], fits[0]
+
+
+def run_process_jobs(
+    models: list["BayesianModel"],
+    dataset: "BayesianDataset",
+    keys: dict[tuple[int, int], Any],
+    priors_for: dict[str, "PriorSet"],
+    record: Callable[["GroupFit"], None],
+    *,
+    max_workers: int | None,
+    bucketed: bool,
+    settings: dict[str, Any],
+) -> None:
+    """Fit every ``(model, group)`` pair on a spawned process pool.
+
+    ``keys`` maps ``(model index, group index)`` to the PRNG key of every job to
+    run (jobs absent from ``keys`` are skipped). Each
+    completed fit is passed to ``record`` (with the parent's own group and
+    prior objects re-attached) as soon as its worker finishes.
+    """
+    import dataclasses
+
+    import jax
+
+    payloads = [model_payload(m) for m in models]
+    jobs: Iterable[dict[str, Any]] = (
+        {
+            "m_idx": m_idx,
+            "g_idx": g_idx,
+            "model": payloads[m_idx],
+            "dataset": dataset.model_copy(
+                update={"groups": [dataset.groups[g_idx]], "dropped_groups": []}
+            ),
+            "priors": priors_for[models[m_idx].name],
+            "key": np.asarray(run_key),
+            "bucketed": bucketed,
+            "settings": settings,
+        }
+        for (m_idx, g_idx), run_key in keys.items()
+    )
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(bool(jax.config.jax_enable_x64),),
+    ) as pool:
+        futures = [pool.submit(run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            m_idx, g_idx, gfit = future.result()
+            record(
+                dataclasses.replace(
+                    gfit,
+                    group=dataset.groups[g_idx],
+                    priors=priors_for[models[m_idx].name],
+                )
+            )
+
+
+__all__ = ["model_payload", "rebuild_model", "run_job", "run_process_jobs"]
@@ -0,0 +1,522 @@
+"""Hierarchical (partially pooled) fits: one NUTS program per system.
+
+:func:`~fairfluids.analysis.bayesian.inference.fit_groups` normally fits every
+``(model, group)`` independently, so the 50 composition groups of one binary
+mixture give 50 unrelated Arrhenius posteriors from 50 sampler runs. With
+``fit_groups(..., hierarchical=Hierarchical(...))`` (or ``hierarchical=True``)
+the groups of a *system* are instead fitted jointly by one sampler call. Each
+pooled parameter ``p`` of the model is drawn per group from a population
+distribution::
+
+    p_g = T_p(T_p^-1(p_loc) + p_coef . phi(x_g) + p_scale * p_z_g),   p_z_g ~ Normal(0, 1)
+
+- ``T_p`` maps the real line onto the support of ``p``'s prior (the identity
+  for a Normal prior, ``exp`` for HalfNormal / LogNormal, a scaled logistic for
+  Uniform / TruncatedNormal), so the population is formed on the unconstrained
+  scale and every group's ``p_g`` stays inside the prior's support;
+- ``p_loc`` has the model's own prior for ``p`` (the prior on the population
+  location rather than on each group);
+- ``p_scale ~ HalfNormal(s_p)`` is the between-group spread on the
+  unconstrained scale, with ``s_p`` an eighth of the prior's plotting window
+  mapped through ``T_p^-1`` (``sigma`` for a Normal or LogNormal prior; 1 when
+  the window touches a bound of the support) unless set via
+  ``Hierarchical.scale``;
+- ``phi(x_g)`` is an optional polynomial of degree ``degree`` in the group's
+  standardised composition ``x_g`` (``Hierarchical.composition``, a metadata
+  column such as ``mole_fraction_water``), with ``p_coef ~ Normal(0, s_p)``, so
+  the population location varies smoothly with composition.
+
+The parametrisation is non-centred (``p_z``), which NUTS handles well when a
+group has few points. Parameters not listed in ``Hierarchical.pooled`` get an
+independent draw per group from their prior, and every group keeps its own
+``model_sigma``. Group-bound model state (data-anchored constants) is threaded
+through as stacked arrays, as in :mod:`~fairfluids.analysis.bayesian.batched`.
+
+The joint posterior is split back into one :class:`GroupFit` per group, each
+holding that group's parameters, ``model_sigma``, ``mu`` and pointwise
+log-likelihood, so diagnostics, ``compare_models``, ``predict`` and the plot
+helpers work unchanged. The population-level draws of each system are kept in
+:attr:`BayesianFit.populations` as :class:`PopulationFit` objects.
+
+Groups fitted jointly share one chain, so their R-hat, ESS and divergences are
+those of the joint run. Prior bounds that depend on the features
+(``metadata.feature_dependent_bounds``) cannot be applied to a population
+distribution; such models are rejected.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
+
+import numpy as np
+
+from .data import BayesianDataset, BayesianGroup
+from .priors import PriorSet
+from .profiling import CompileCounter, SamplerTiming, tree_statistics
+
+if TYPE_CHECKING:
+    import arviz as az
+
+    from .inference import BayesianFit, GroupFit
+    from .models import BayesianModel
+    from .storage import StoragePolicy
+
+
+@dataclass(frozen=True)
+class Hierarchical:
+    """Population structure of a hierarchical fit (see the module docstring).
+
+    Args:
+        system_by: Group metadata columns whose values identify a system; the
+            groups of each system are fitted jointly. Empty (default): the whole
+            dataset is one system.
+        pooled: Parameters drawn from a population distribution (default:
+            all of the model's parameters).
+        composition: Group metadata column giving each group's composition
+            (e.g. ``"mole_fraction_water"``). ``None`` (default): the population
+            location is a constant.
+        degree: Degree of the composition polynomial.
+        scale: Scale ``s_p`` of the between-group spread and composition
+            coefficients on the unconstrained scale, one value for all
+            parameters or a mapping per parameter. Defaults are derived from
+            each parameter's prior.
+    """
+
+    system_by: tuple[str, ...] = ()
+    pooled: tuple[str, ...] | None = None
+    composition: str | None = None
+    degree: int = 1
+    scale: float | Mapping[str, float] | None = None
+
+    def __post_init__(self) -> None:
+        if int(self.degree) < 1:
+            raise ValueError(f"Hierarchical.degree must be >= 1, got {self.degree}.")
+        object.__setattr__(self, "system_by", tuple(self.system_by))
+        if self.pooled is not None:
+            object.__setattr__(self, "pooled", tuple(self.pooled))
+
+
+def as_hierarchical(hierarchical: "Hierarchical | bool | None") -> Hierarchical | None:
+    """Accept a :class:`Hierarchical`, ``True`` (the defaults) or ``None``/``False``."""
+    if hierarchical is None or hierarchical is False:
+        return None
+    if hierarchical is True:
+        return Hierarchical()
+    if isinstance(hierarchical, Hierarchical):
+        return hierarchical
+    raise TypeError(
+        f"hierarchical must be a Hierarchical, a bool or None, got {type(hierarchical).__name__}."
+    )
+
+
+@dataclass
+class PopulationFit:
+    """Population-level posterior of one ``(model, system)`` hierarchical fit.
+
+    ``inference_data`` holds the population sites (``<p>_loc``, ``<p>_scale``,
+    ``<p>_coef``) and the group-level parameters with a trailing group axis in
+    the order of :attr:`group_ids`. ``priors`` keeps the prior of each pooled
+    parameter, whose support fixes the scale the trend is formed on.
+    """
+
+    model_name: str
+    system: tuple[Any, ...]
+    group_ids: tuple[tuple[Any, ...], ...]
+    pooled: tuple[str, ...]
+    inference_data: "az.InferenceData"
+    rhat: dict[str, float]
+    ess_bulk: dict[str, float]
+    num_divergences: int
+    composition: str | None = None
+    # Standardisation of the composition: phi(x) = ((x - center) / spread) ** k.
+    composition_center: float = 0.0
+    composition_spread: float = 1.0
+    wall_seconds: float | None = None
+    timing: SamplerTiming | None = None
+    priors: dict[str, Any] = field(default_factory=dict)
+
+    def location(self, parameter: str, composition: Any = None) -> np.ndarray:
+        """Draws of the population location of ``parameter``.
+
+        Returns an array ``(draws,)`` or, with a composition grid, ``(draws,
+        n_grid)``: the posterior of the smooth composition trend.
+        """
+        from .storage import _arrays
+
+        if parameter not in self.pooled:
+            raise KeyError(
+                f"Parameter {parameter!r} is not pooled. Pooled: {list(self.pooled)}."
+            )
+        posterior = _arrays(self.inference_data, "posterior")
+        loc = posterior[f"{parameter}_loc"].reshape(-1)
+        if composition is None:
+            return loc
+        if self.composition is None:
+            raise ValueError("This fit has no composition trend; call location(parameter).")
+        x = np.atleast_1d(np.asarray(composition, dtype=float)) - self.composition_center
+        coef = posterior[f"{parameter}_coef"].reshape(loc.shape[0], -1)
+        phi = _polynomial(x / self.composition_spread, coef.shape[1])
+        transform = _support_transform(self.priors[parameter])
+        trend = transform.inv(loc)[:, None] + coef @ phi.T
+        return np.asarray(transform(trend))
+
+
+def _polynomial(x: np.ndarray, degree: int) -> np.ndarray:
+    """Design matrix ``(n, degree)`` with columns ``x, x**2, ..., x**degree``."""
+    return np.stack([x**k for k in range(1, degree + 1)], axis=-1)
+
+
+def _support_transform(spec: Any) -> Any:
+    """Bijection from the real line onto the support of prior ``spec``."""
+    from numpyro.distributions.transforms import biject_to
+
+    return biject_to(spec.to_numpyro().support)
+
+
+def _population_scale(spec: Any, scale: float | Mapping[str, float] | None, name: str) -> float:
+    if isinstance(scale, Mapping):
+        scale = scale.get(name)
+    if scale is not None:
+        return float(scale)
+    transform = _support_transform(spec)
+    low, high = (float(transform.inv(v)) for v in spec.support())
+    if not (np.isfinite(low) and np.isfinite(high)):
+        return 1.0
+    return (high - low) / 8.0
+
+
+def _check_model(model: "BayesianModel", pooled: Sequence[str]) -> None:
+    unknown = [p for p in pooled if p not in model.param_names]
+    if unknown:
+        raise KeyError(
+            f"Hierarchical.pooled names unknown parameter(s) {unknown} of model "
+            f"{model.name!r}. Parameters: {list(model.param_names)}."
+        )
+    symbolic = getattr(type(model), "symbolic_model", None)
+    meta = getattr(symbolic, "metadata", None)
+    if isinstance(meta, Mapping) and meta.get("feature_dependent_bounds"):
+        raise ValueError(
+            f"Model {model.name!r} has feature-dependent prior bounds, which a population "
+            "distribution cannot honour; fit it per group instead."
+        )
+
+
+def make_population_model(
+    model: "BayesianModel",
+    priors: PriorSet,
+    *,
+    pooled: Sequence[str],
+    scales: Mapping[str, float],
+    degree: int | None,
+) -> Callable[..., None]:
+    """NumPyro model of all groups of one system (padded to a common length).
+
+    The returned callable takes ``features`` and ``observation`` /
+    ``observation_uncertainty`` / ``mask`` arrays of shape ``(n_groups, size)``
+    (see :func:`~fairfluids.analysis.bayesian.batched.pad_groups`), the stacked
+    group-bound state and the ``(n_groups, degree)`` composition design.
+    """
+    import jax
+    import jax.numpy as jnp
+    import numpyro
+    import numpyro.distributions as dist
+
+    transforms = {p: _support_transform(priors.parameters[p]) for p in pooled}
+
+    def group_mean(features: Any, params: Any, bound: Any) -> Any:
+        run_model = model.model_copy(update=bound) if bound else model
+        return run_model.mean(features, params)
+
+    def population_model(
+        features: Mapping[str, Any],
+        observation: Any = None,
+        observation_uncertainty: Any = None,
+        *,
+        mask: Any,
+        bound: Mapping[str, Any],
+        design: Any = None,
+    ) -> None:
+        n_groups = mask.shape[0]
+        params: dict[str, Any] = {}
+        for pname in model.param_names:
+            spec = priors.parameters[pname]
+            if pname not in pooled:
+                with numpyro.plate("groups", n_groups):
+                    params[pname] = numpyro.sample(pname, spec.to_numpyro())
+                continue
+            transform = transforms[pname]
+            loc = transform.inv(numpyro.sample(f"{pname}_loc", spec.to_numpyro()))
+            if degree is not None:
+                coef = numpyro.sample(
+                    f"{pname}_coef",
+                    dist.Normal(0.0, scales[pname]).expand([degree]).to_event(1),
+                )
+                loc = loc + design @ coef
+            spread = numpyro.sample(f"{pname}_scale", dist.HalfNormal(scales[pname]))
+            with numpyro.plate("groups", n_groups):
+                z = numpyro.sample(f"{pname}_z", dist.Normal(0.0, 1.0))
+            params[pname] = numpyro.deterministic(pname, transform(loc + spread * z))
+        with numpyro.plate("groups", n_groups):
+            model_sigma = numpyro.sample("model_sigma", dist.HalfNormal(priors.sigma_scale))
+
+        mu = jax.vmap(group_mean)(features, params, bound)
+        numpyro.deterministic("mu", mu)
+        total_sigma = jnp.sqrt(model_sigma[:, None] ** 2 + observation_uncertainty**2)
+        if priors.likelihood == "student_t":
+            obs_dist = dist.StudentT(priors.student_t_df, mu, total_sigma)
+        else:
+            obs_dist = dist.Normal(mu, total_sigma)
+        numpyro.sample("obs", obs_dist.mask(mask), obs=observation)
+
+    return population_model
+
+
+def _split_systems(
+    groups: Sequence[BayesianGroup], system_by: tuple[str, ...]
+) -> dict[tuple[Any, ...], list[int]]:
+    systems: dict[tuple[Any, ...], list[int]] = {}
+    for idx, grp in enumerate(groups):
+        missing = [c for c in system_by if c not in grp.metadata]
+        if missing:
+            raise KeyError(
+                f"Group {grp.group_label!r} has no metadata column(s) {missing} "
+                f"for Hierarchical.system_by. Available: {sorted(grp.metadata)}"
+            )
+        key = tuple(
+            tuple(v) if isinstance(v, list) else v
+            for v in (grp.metadata[c] for c in system_by)
+        )
+        systems.setdefault(key, []).append(idx)
+    return systems
+
+
+def _composition_design(
+    groups: Sequence[BayesianGroup], spec: Hierarchical
+) -> tuple[np.ndarray | None, float, float]:
+    if spec.composition is None:
+        return None, 0.0, 1.0
+    x = []
+    for grp in groups:
+        if spec.composition not in grp.metadata:
+            raise KeyError(
+                f"Group {grp.group_label!r} has no metadata column {spec.composition!r} "
+                f"for Hierarchical.composition. Available: {sorted(grp.metadata)}"
+            )
+        x.append(float(grp.metadata[spec.composition]))
+    x_arr = np.asarray(x)
+    center = float(x_arr.mean())
+    spread = float(x_arr.std()) or 1.0
+    return _polynomial((x_arr - center) / spread, spec.degree), center, spread
+
+
+def _fit_system(
+    model: "BayesianModel",
+    groups: Sequence[BayesianGroup],
+    priors: PriorSet,
+    spec: Hierarchical,
+    run_key: Any,
+    *,
+    num_warmup: int,
+    num_samples: int,
+    num_chains: int,
+    target_accept_prob: float,
+) -> tuple[list["GroupFit"], dict[str, Any]]:
+    """Sample one system jointly; return its per-group fits and population summary."""
+    import jax
+    import jax.numpy as jnp
+    from numpyro.infer import MCMC, NUTS
+    from numpyro.infer.util import log_likelihood
+
+    from .batched import PosteriorDraws, pad_groups, stack_bound_state
+    from .inference import _build_group_fit, _count_divergences, _ess_dict, _rhat_dict
+    from .storage import _assemble, from_dict
+
+    pooled = tuple(model.param_names if spec.pooled is None else spec.pooled)
+    bound_models = [model.bind_group(g) for g in groups]
+    bound = stack_bound_state([b.reconstruction_kwargs() for b in bound_models])
+    if bound is None:
+        raise ValueError(
+            f"The group-bound state of model {model.name!r} cannot be stacked across "
+            "groups, so its groups cannot be fitted jointly."
+        )
+    design, center, spread = _composition_design(groups, spec)
+    scales = {p: _population_scale(priors.parameters[p], spec.scale, p) for p in pooled}
+    population_model = make_population_model(
+        model,
+        priors,
+        pooled=pooled,
+        scales=scales,
+        degree=spec.degree if design is not None else None,
+    )
+
+    size = max(g.n_points for g in groups)
+    data = jax.tree_util.tree_map(jnp.asarray, pad_groups(groups, size))
+    model_kwargs = {
+        "features": data["features"],
+        "observation": data["observation"],
+        "observation_uncertainty": data["observation_uncertainty"],
+        "mask": data["mask"],
+        "bound": jax.tree_util.tree_map(jnp.asarray, bound),
+        "design": None if design is None else jnp.asarray(design),
+    }
+    kernel_kwargs = model.nuts_kernel_kwargs(target_accept_prob=target_accept_prob)
+    mcmc = MCMC(
+        NUTS(population_model, **kernel_kwargs),
+        num_warmup=num_warmup,
+        num_samples=num_samples,
+        num_chains=num_chains,
+        progress_bar=False,
+    )
+    with CompileCounter() as compiles:
+        started = time.perf_counter()
+        mcmc.run(run_key, extra_fields=("energy", "num_steps"), **model_kwargs)
+        jax.block_until_ready(mcmc.last_state)
+        seconds = time.perf_counter() - started
+    samples = mcmc.get_samples(group_by_chain=True)
+    log_lik = log_likelihood(population_model, samples, batch_ndims=2, **model_kwargs)["obs"]
+    samples, extra, log_lik = jax.tree_util.tree_map(
+        np.asarray,
+        jax.device_get((samples, mcmc.get_extra_fields(group_by_chain=True), log_lik)),
+    )
+    grad_evals, tree_depth = tree_statistics(extra["num_steps"])
+    timing = SamplerTiming(
+        compile_seconds=compiles.seconds,
+        sampling_seconds=max(seconds - compiles.seconds, 0.0),
+        grad_evals=grad_evals,
+        mean_tree_depth=tree_depth,
+    )
+    stats = {"diverging": extra["diverging"], "energy": extra["energy"]}
+
+    n_groups = len(groups)
+    share = SamplerTiming(
+        compile_seconds=timing.compile_seconds / n_groups,
+        sampling_seconds=timing.sampling_seconds / n_groups,
+        grad_evals=grad_evals,
+        mean_tree_depth=tree_depth,
+    )
+    gfits: list["GroupFit"] = []
+    for g, (group, run_model) in enumerate(zip(groups, bound_models)):
+        n = group.n_points
+        posterior = {p: samples[p][:, :, g] for p in model.param_names}
+        posterior["model_sigma"] = samples["model_sigma"][:, :, g]
+        posterior["mu"] = samples["mu"][:, :, g, :n]
+        idata = _assemble(posterior, stats, {"obs": log_lik[:, :, g, :n]}, group.observation)
+        draws = PosteriorDraws(samples=posterior, extra_fields=dict(extra))
+        gfit = _build_group_fit(model.name, group, priors, draws, idata, run_model, share)
+        gfit.wall_seconds = seconds / n_groups
+        gfits.append(gfit)
+
+    population_sites = {
+        k: v for k, v in samples.items() if k != "mu" and not k.endswith("_z")
+    }
+    population_idata = from_dict({"posterior": population_sites, "sample_stats": stats})
+    population = {
+        "pooled": pooled,
+        "inference_data": population_idata,
+        "rhat": _rhat_dict(population_idata),
+        "ess_bulk": _ess_dict(population_idata, method="bulk"),
+        "num_divergences": _count_divergences(population_idata),
+        "composition": spec.composition,
+        "composition_center": center,
+        "composition_spread": spread,
+        "wall_seconds": seconds,
+        "timing": timing,
+        "priors": {p: priors.parameters[p] for p in pooled},
+    }
+    return gfits, population
+
+
+def fit_hierarchical(
+    dataset: BayesianDataset,
+    models: Sequence["BayesianModel"],
+    spec: Hierarchical,
+    *,
+    num_warmup: int,
+    num_samples: int,
+    num_chains: int,
+    target_accept_prob: float,
+    seed: int,
+    policy: "StoragePolicy",
+    progress_bar: bool = False,
+) -> "BayesianFit":
+    """Fit every model to every system of ``dataset`` with one NUTS run each.
+
+    Called by :func:`~fairfluids.analysis.bayesian.inference.fit_groups` for
+    ``hierarchical=...``; the arguments have the same meaning there. The job
+    of ``(model, system)`` uses ``fold_in(fold_in(PRNGKey(seed), m + 1), s + 1)``.
+    """
+    from contextlib import nullcontext
+
+    import jax.random as random
+
+    from .inference import BayesianFit
+    from .progress import total_mcmc_steps, unified_mcmc_progress
+    from .storage import compact_group_fit
+
+    fit = BayesianFit(
+        model_names=tuple(m.name for m in models),
+        group_ids=tuple(g.group_id for g in dataset.groups),
+    )
+    systems = _split_systems(dataset.groups, spec.system_by)
+    for model in models:
+        _check_model(model, model.param_names if spec.pooled is None else spec.pooled)
+    base_key = random.PRNGKey(seed)
+    progress_ctx = (
+        unified_mcmc_progress(
+            total_steps=total_mcmc_steps(
+                num_jobs=len(models) * len(systems),
+                num_warmup=num_warmup,
+                num_samples=num_samples,
+                num_chains=num_chains,
+            ),
+            description="Hierarchical fit",
+        )
+        if progress_bar
+        else nullcontext()
+    )
+    with progress_ctx as progress, CompileCounter() as compiles:
+        if progress is not None:
+            progress.configure_job(steps_per_job=num_chains * (num_warmup + num_samples))
+        for m_idx, model in enumerate(models):
+            priors = model.prior_set()
+            for s_idx, (system, members) in enumerate(systems.items()):
+                groups = [dataset.groups[i] for i in members]
+                run_key = random.fold_in(random.fold_in(base_key, m_idx + 1), s_idx + 1)
+                gfits, population = _fit_system(
+                    model,
+                    groups,
+                    priors,
+                    spec,
+                    run_key,
+                    num_warmup=num_warmup,
+                    num_samples=num_samples,
+                    num_chains=num_chains,
+                    target_accept_prob=target_accept_prob,
+                )
+                for gfit in gfits:
+                    fit.fits[(model.name, gfit.group_id)] = compact_group_fit(gfit, policy)
+                fit.populations[(model.name, system)] = PopulationFit(
+                    model_name=model.name,
+                    system=system,
+                    group_ids=tuple(g.group_id for g in groups),
+                    **population,
+                )
+                if progress is not None:
+                    progress.complete_job(model=model.name, group=str(system)[:48])
+    # Systems interleave groups; keep the dataset's group order.
+    order = [(m.name, gid) for m in models for gid in fit.group_ids]
+    fit.fits = {key: fit.fits[key] for key in order if key in fit.fits}
+    fit.compile_count = compiles.count
+    fit.compile_seconds = compiles.seconds
+    return fit
+
+
+__all__ = [
+    "Hierarchical",
+    "PopulationFit",
+    "as_hierarchical",
+    "fit_hierarchical",
+    "make_population_model",
+]
@@ -4,26 +4,44 @@ The public entry point is :func:`fit_groups`, which runs NUTS once per
 ``(model, group)`` combination and packages the results into a
 :class:`BayesianFit` container. Posterior samples are exposed both as the
 underlying NumPyro ``MCMC`` object (for cheap posterior predictive draws) and
-as an :class:`arviz.InferenceData` (for diagnostics and comparison).
+as an :class:`arviz.InferenceData` (for diagnostics and comparison). With
+``batched=True`` the groups of each model share one vectorised sampler per
+shape bucket and ``GroupFit.mcmc`` is a lightweight :class:`PosteriorDraws`
+exposing the same ``get_samples`` / ``get_extra_fields`` accessors. With
+``backend="laplace"`` or ``"svi"`` each posterior is a Gaussian approximation
+instead (see :mod:`fairfluids.analysis.bayesian.approximate`). With
+``hierarchical=...`` the groups of each system are fitted jointly under a
+population distribution (see :mod:`fairfluids.analysis.bayesian.hierarchical`).
 """
 
 from __future__ import annotations
 
+import os
+import threading
+import time
+from collections import OrderedDict
 from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, Mapping
 
 import numpy as np
 import pandas as pd
 
+from ..models.compile import CacheInfo
 from .data import BayesianDataset, BayesianGroup
 from .priors import PriorSet
+from .profiling import CompileCounter, SamplerTiming, tree_statistics
 from .progress import total_mcmc_steps, unified_mcmc_progress
+from .storage import StoragePolicy, as_storage_policy, compact_group_fit, idata_group_names
 
 if TYPE_CHECKING:
     import arviz as az
     from numpyro.infer import MCMC
 
+    from .batched import PosteriorDraws
+    from .cache import FitCache
+    from .checkpoint import Checkpoint
+    from .hierarchical import Hierarchical, PopulationFit
     from .models import BayesianModel
 
 
@@ -42,7 +60,7 @@ class GroupFit:
     model_name: str
     group: BayesianGroup
     priors: PriorSet
-    mcmc: "MCMC"
+    mcmc: "MCMC | PosteriorDraws"
     inference_data: "az.InferenceData"
     rhat: dict[str, float]
     ess_bulk: dict[str, float]
@@ -50,6 +68,12 @@ class GroupFit:
     num_divergences: int
     # Extra kwargs for get_model(...) to rebuild the fitted model (group anchors).
     model_kwargs: dict[str, Any] = field(default_factory=dict)
+    # Wall time of the job that produced the draws (seconds; shared evenly within a batch).
+    wall_seconds: float | None = None
+    # Compile / warmup / sampling split, gradient evaluations and tree depth.
+    timing: SamplerTiming | None = None
+    # Memoised PSIS-LOO as (InferenceData it was computed from, ELPDData); see ``loo``.
+    _loo: tuple[Any, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def group_id(self) -> tuple[Any, ...]:
@@ -58,6 +82,42 @@ class GroupFit:
     def samples(self) -> dict[str, np.ndarray]:
         return {k: np.asarray(v) for k, v in self.mcmc.get_samples().items()}
 
+    def ensure_log_likelihood(self) -> "az.InferenceData":
+        """Return :attr:`inference_data`, recomputing the log-likelihood if it was dropped.
+
+        Fits stored under a :class:`~fairfluids.analysis.bayesian.storage.StoragePolicy`
+        with ``keep_log_likelihood=False`` carry no ``log_likelihood`` group; the
+        first LOO/WAIC consumer rebuilds it from the stored draws and keeps it.
+        """
+        from .storage import has_log_likelihood, with_log_likelihood
+
+        if not has_log_likelihood(self.inference_data):
+            self.inference_data = with_log_likelihood(self)
+        return self.inference_data
+
+    def loo(self) -> "az.ELPDData":
+        """Pointwise PSIS-LOO of this fit, computed once and then reused.
+
+        The result is tied to the current :attr:`inference_data` object: it is
+        recomputed only after that object is replaced (a new posterior, a
+        compaction or a recomputed log-likelihood).
+        """
+        import arviz as az
+
+        idata = self.ensure_log_likelihood()
+        cached = self._loo
+        if cached is not None and cached[0] is idata:
+            return cached[1]
+        result = az.loo(idata, pointwise=True)
+        self._loo = (idata, result)
+        return result
+
+    def nbytes(self) -> dict[str, int]:
+        """Array payload held by this fit (see :func:`~fairfluids.analysis.bayesian.storage.fit_nbytes`)."""
+        from .storage import fit_nbytes
+
+        return fit_nbytes(self)
+
 
 @dataclass
 class BayesianFit:
@@ -66,6 +126,13 @@ class BayesianFit:
     model_names: tuple[str, ...]
     group_ids: tuple[tuple[Any, ...], ...]
     fits: dict[tuple[str, tuple[Any, ...]], GroupFit] = field(default_factory=dict)
+    # Population-level posteriors of hierarchical fits, keyed by (model, system).
+    populations: dict[tuple[str, tuple[Any, ...]], "PopulationFit"] = field(
+        default_factory=dict
+    )
+    # XLA compilations observed while fitting (see ``profiling.CompileCounter``).
+    compile_count: int = 0
+    compile_seconds: float = 0.0
 
     def get(self, model_name: str, group_id: tuple[Any, ...]) -> GroupFit:
         try:
@@ -132,14 +199,23 @@ class BayesianFit:
         return self.get(model_name, gid).inference_data
 
     def diagnostics(self) -> pd.DataFrame:
-        """Return a per-(group, model, parameter) diagnostics DataFrame."""
+        """Return a per-(group, model, parameter) diagnostics DataFrame.
+
+        Besides R-hat and ESS, every row carries the job's timing (wall,
+        compile, warmup and sampling seconds), gradient evaluations, mean tree
+        depth and the parameter's ``ess_bulk_per_second`` (bulk ESS over wall
+        time). See :meth:`throughput` for a ranking of the slowest jobs.
+        """
         rows: list[dict[str, Any]] = []
         for (model_name, group_id), fit in self.fits.items():
+            timing = fit.timing if fit.timing is not None else SamplerTiming()
             base: dict[str, Any] = {
                 "model": model_name,
                 "group_label": fit.group.group_label,
                 "n_points": fit.group.n_points,
                 "num_divergences": fit.num_divergences,
+                "wall_seconds": fit.wall_seconds,
+                **timing.as_dict(),
             }
             for col, val in zip(("group_by_" + str(i) for i in range(len(group_id))), group_id):
                 base[col] = val
@@ -149,9 +225,65 @@ class BayesianFit:
                 row["rhat"] = value
                 row["ess_bulk"] = fit.ess_bulk.get(param, np.nan)
                 row["ess_tail"] = fit.ess_tail.get(param, np.nan)
+                row["ess_bulk_per_second"] = (
+                    row["ess_bulk"] / fit.wall_seconds if fit.wall_seconds else np.nan
+                )
                 rows.append(row)
         return pd.DataFrame(rows)
 
+    def throughput(
+        self,
+        *,
+        by: Literal["job", "model"] = "job",
+        slowest: int = 5,
+    ) -> pd.DataFrame:
+        """Jobs or models ranked by ESS per second, the ``slowest`` flagged ``slow``.
+
+        See :func:`~fairfluids.analysis.bayesian.profiling.throughput_table`.
+        """
+        from .profiling import throughput_table
+
+        return throughput_table(self, by=by, slowest=slowest)
+
+    def loo(
+        self,
+        *,
+        max_workers: int | None = None,
+        on_error: Literal["raise", "skip"] = "raise",
+    ) -> dict[tuple[str, tuple[Any, ...]], "az.ELPDData"]:
+        """PSIS-LOO of every fit, keyed like :attr:`fits`.
+
+        Results are memoised per :class:`GroupFit` (see :meth:`GroupFit.loo`);
+        missing ones are computed in parallel on ``max_workers`` threads. With
+        ``on_error="skip"`` fits whose LOO fails are left out of the result.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def compute(gfit: GroupFit) -> "az.ELPDData | None":
+            try:
+                return gfit.loo()
+            except Exception:
+                if on_error == "raise":
+                    raise
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(compute, self.fits.values()))
+        return {key: res for key, res in zip(self.fits, results) if res is not None}
+
+    def memory_usage(self) -> pd.DataFrame:
+        """Bytes held per ``(model, group)`` fit, split into MCMC, InferenceData and DataFrame."""
+        rows: list[dict[str, Any]] = []
+        for (model_name, _group_id), fit in self.fits.items():
+            row: dict[str, Any] = {
+                "model": model_name,
+                "group_label": fit.group.group_label,
+                "n_points": fit.group.n_points,
+            }
+            row.update({f"{k}_bytes": v for k, v in fit.nbytes().items()})
+            rows.append(row)
+        return pd.DataFrame(rows)
+
     def to_fitted_models(
         self,
         *,
@@ -241,10 +373,7 @@ def _densify_inference_data(idata: "az.InferenceData") -> "az.InferenceData":
     each variable to NumPy up front is lossless (these are already-sampled draws)
     and lets LOO/WAIC/compare run regardless of which array backend NumPyro used.
     """
-    groups = idata.groups
-    if callable(groups):  # arviz < 1.x exposes groups() as a method
-        groups = groups()
-    for group_name in groups:
+    for group_name in idata_group_names(idata):
         ds = idata[group_name]
         for var_name, da in ds.data_vars.items():
             data = da.data
@@ -262,6 +391,356 @@ def _collect_priors(models: list["BayesianModel"]) -> dict[str, PriorSet]:
     return {m.name: m.prior_set() for m in models}
 
 
+def _build_group_fit(
+    model_name: str,
+    group: BayesianGroup,
+    priors: PriorSet,
+    mcmc: "MCMC | PosteriorDraws",
+    idata: "az.InferenceData",
+    run_model: "BayesianModel",
+    timing: SamplerTiming | None = None,
+) -> GroupFit:
+    """Attach convergence diagnostics and package one ``(model, group)`` result."""
+    return GroupFit(
+        model_name=model_name,
+        group=group,
+        priors=priors,
+        mcmc=mcmc,
+        inference_data=idata,
+        rhat=_rhat_dict(idata),
+        ess_bulk=_ess_dict(idata, method="bulk"),
+        ess_tail=_ess_dict(idata, method="tail"),
+        num_divergences=_count_divergences(idata),
+        model_kwargs=run_model.reconstruction_kwargs(),
+        timing=timing,
+    )
+
+
+_SAMPLER_CACHE_MAXSIZE = 32
+_SAMPLER_CACHE: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+_SAMPLER_LOCK = threading.Lock()
+_SAMPLER_HITS = 0
+_SAMPLER_MISSES = 0
+
+
+def _sampler_key(
+    run_model: "BayesianModel",
+    size: int,
+    *,
+    exclude: Iterable[str] = (),
+    **settings: Any,
+) -> tuple[Any, ...] | None:
+    """Cache key of a compiled sampler, or ``None`` when the model cannot be keyed.
+
+    The key covers the model class (and thus its symbolic definition), every
+    instance field except ``exclude`` (priors, likelihood, group-bound constants),
+    the bucket size and the sampler settings.
+    """
+    try:
+        state = run_model.model_dump_json(exclude=set(exclude))
+    except Exception:  # arbitrary user fields that do not serialise
+        return None
+    return (type(run_model), state, int(size), tuple(sorted(settings.items())))
+
+
+def _cached_sampler(key: tuple[Any, ...] | None, build: Callable[[], Any]) -> Any:
+    """Return the sampler stored under ``key``, building (and caching) it on a miss."""
+    global _SAMPLER_HITS, _SAMPLER_MISSES
+
+    if key is None:
+        return build()
+    with _SAMPLER_LOCK:
+        sampler = _SAMPLER_CACHE.get(key)
+        if sampler is not None:
+            _SAMPLER_CACHE.move_to_end(key)
+            _SAMPLER_HITS += 1
+            return sampler
+        _SAMPLER_MISSES += 1
+    sampler = build()
+    with _SAMPLER_LOCK:
+        sampler = _SAMPLER_CACHE.setdefault(key, sampler)
+        _SAMPLER_CACHE.move_to_end(key)
+        while len(_SAMPLER_CACHE) > _SAMPLER_CACHE_MAXSIZE:
+            _SAMPLER_CACHE.popitem(last=False)
+    return sampler
+
+
+def sampler_cache_info() -> CacheInfo:
+    """Hit/miss counters of the per-``(model, shape bucket)`` sampler cache."""
+    with _SAMPLER_LOCK:
+        return CacheInfo(
+            _SAMPLER_HITS, _SAMPLER_MISSES, _SAMPLER_CACHE_MAXSIZE, len(_SAMPLER_CACHE)
+        )
+
+
+def clear_sampler_cache() -> None:
+    """Drop every cached sampler (and its compiled programs) and reset the counters."""
+    global _SAMPLER_HITS, _SAMPLER_MISSES
+
+    with _SAMPLER_LOCK:
+        _SAMPLER_CACHE.clear()
+        _SAMPLER_HITS = 0
+        _SAMPLER_MISSES = 0
+
+
+def _run_group(
+    run_model: "BayesianModel",
+    group: BayesianGroup,
+    run_key: Any,
+    priors: PriorSet,
+    *,
+    num_warmup: int,
+    num_samples: int,
+    num_chains: int,
+    target_accept_prob: float,
+    warm_start: Mapping[str, Any] | None = None,
+) -> tuple["MCMC", "az.InferenceData", SamplerTiming]:
+    """Sample one ``(model, group)`` with a fresh NUTS/``MCMC`` pair.
+
+    ``warm_start`` (see :func:`warm_start_state`) seeds the kernel with an
+    adapted step size and inverse mass matrix (only the step size is re-tuned
+    during warmup) and starts every chain from the given unconstrained state.
+    Warmup and sampling run as two timed calls (the chains are the same as a
+    single ``run``); compilation time is measured separately.
+    """
+    import arviz as az
+    import jax
+    from numpyro.infer import MCMC, NUTS
+
+    kernel_kwargs = run_model.nuts_kernel_kwargs(target_accept_prob=target_accept_prob)
+    init_params = None
+    if warm_start is not None:
+        kernel_kwargs.update(
+            step_size=warm_start["step_size"],
+            inverse_mass_matrix=warm_start["inverse_mass_matrix"],
+            adapt_mass_matrix=False,
+        )
+        init_params = warm_start["init_params"]
+    kernel = NUTS(run_model.numpyro_model, **kernel_kwargs)
+    mcmc = MCMC(
+        kernel,
+        num_warmup=num_warmup,
+        num_samples=num_samples,
+        num_chains=num_chains,
+        progress_bar=False,
+    )
+    model_kwargs = dict(
+        features=group.features_jax(),
+        observation=group.observation_jax(),
+        observation_uncertainty=group.observation_uncertainty_jax(),
+        priors=priors,
+    )
+    with CompileCounter() as warmup_compiles:
+        started = time.perf_counter()
+        mcmc.warmup(run_key, init_params=init_params, **model_kwargs)
+        jax.block_until_ready(mcmc.post_warmup_state)
+        warmup_seconds = time.perf_counter() - started
+    with CompileCounter() as sampling_compiles:
+        started = time.perf_counter()
+        # The post-warmup state carries its own PRNG key; ``run_key`` is not reused.
+        mcmc.run(run_key, extra_fields=("energy", "num_steps"), **model_kwargs)
+        jax.block_until_ready(mcmc.last_state)
+        sampling_seconds = time.perf_counter() - started
+    grad_evals, tree_depth = tree_statistics(mcmc.get_extra_fields()["num_steps"])
+    timing = SamplerTiming(
+        compile_seconds=warmup_compiles.seconds + sampling_compiles.seconds,
+        warmup_seconds=max(warmup_seconds - warmup_compiles.seconds, 0.0),
+        sampling_seconds=max(sampling_seconds - sampling_compiles.seconds, 0.0),
+        grad_evals=grad_evals,
+        mean_tree_depth=tree_depth,
+    )
+    # ``log_likelihood=True`` is required so ArviZ can later compute LOO/WAIC.
+    idata = _densify_inference_data(az.from_numpyro(mcmc, log_likelihood=True))
+    return mcmc, idata, timing
+
+
+def _sample_group(
+    run_model: "BayesianModel",
+    group: BayesianGroup,
+    run_key: Any,
+    priors: PriorSet,
+    *,
+    backend: Literal["nuts", "laplace", "svi"] = "nuts",
+    **settings: Any,
+) -> tuple["MCMC | PosteriorDraws", "az.InferenceData", SamplerTiming]:
+    """Run one ``(model, group)`` job with NUTS or an approximate backend."""
+    if backend == "nuts":
+        return _run_group(run_model, group, run_key, priors, **settings)
+    from .approximate import run_approximate
+
+    return run_approximate(run_model, group, run_key, priors, backend=backend, **settings)
+
+
+def warm_start_state(gfit: GroupFit, num_chains: int) -> dict[str, Any] | None:
+    """Adapted step size, inverse mass matrix and final chain states of a NUTS fit.
+
+    Read from ``gfit.mcmc.last_state``; step sizes and mass matrices are
+    averaged over the original chains and the final states are cycled to fill
+    ``num_chains`` chains. Returns ``None`` when the fit kept no ``MCMC`` object
+    (bucketed/batched runs, lean storage, cached fits).
+    """
+    import jax
+    from numpyro.infer import MCMC
+
+    mcmc = gfit.mcmc
+    if not isinstance(mcmc, MCMC) or getattr(mcmc, "last_state", None) is None:
+        return None
+    state = jax.device_get(mcmc.last_state)
+    old_chains = int(mcmc.num_chains)
+    adapt = state.adapt_state
+
+    def per_chain(leaf: Any) -> np.ndarray:
+        arr = np.asarray(leaf)
+        return arr if old_chains > 1 else arr[None]
+
+    inverse_mass_matrix = jax.tree_util.tree_map(
+        lambda leaf: per_chain(leaf).mean(axis=0), adapt.inverse_mass_matrix
+    )
+    chains = np.arange(num_chains) % old_chains
+    init_params = {name: per_chain(z)[chains] for name, z in state.z.items()}
+    if num_chains == 1:
+        init_params = {name: z[0] for name, z in init_params.items()}
+    return {
+        "step_size": float(per_chain(adapt.step_size).mean()),
+        "inverse_mass_matrix": inverse_mass_matrix,
+        "init_params": init_params,
+    }
+
+
+def _fit_model_bucketed(
+    model: "BayesianModel",
+    dataset: BayesianDataset,
+    run_keys: list[Any],
+    priors: PriorSet,
+    record: Callable[[GroupFit], None],
+    *,
+    vectorize: bool,
+    num_warmup: int,
+    num_samples: int,
+    num_chains: int,
+    target_accept_prob: float,
+) -> list[int]:
+    """Sample every group of ``model`` through a cached sampler per shape bucket.
+
+    Buckets come from :meth:`BayesianDataset.buckets`. The jitted sampler of a
+    ``(model, bucket)`` is cached (see :func:`sampler_cache_info`), so groups of
+    one bucket share a single compile. With ``vectorize`` a whole bucket runs as
+    one ``vmap``-ed call; otherwise groups run one at a time. Every group keeps
+    its own fold-in key. Finished fits are handed to ``record``. Returns the
+    indices of groups that could not be bucketed (group-bound state that does
+    not stack into arrays), which the caller samples one by one.
+    """
+    import jax
+    import jax.random as random
+
+    from .batched import (
+        draws_to_inference_data,
+        make_bucket_sampler,
+        pad_groups,
+        stack_bound_state,
+        unpack_group,
+    )
+
+    groups = dataset.groups
+    leftover: list[int] = []
+    for size, members in dataset.buckets().items():
+        bound_models = [model.bind_group(groups[i]) for i in members]
+        bound = stack_bound_state([b.reconstruction_kwargs() for b in bound_models])
+        if bound is None:
+            leftover.extend(members)
+            continue
+        key = _sampler_key(
+            bound_models[0],
+            size,
+            exclude=bound,
+            bound=str(jax.tree_util.tree_structure(bound)),
+            num_warmup=num_warmup,
+            num_samples=num_samples,
+            target_accept_prob=target_accept_prob,
+        )
+        sampler = _cached_sampler(
+            key,
+            lambda: make_bucket_sampler(
+                bound_models[0],
+                priors,
+                num_warmup=num_warmup,
+                num_samples=num_samples,
+                target_accept_prob=target_accept_prob,
+            ),
+        )
+        everything = list(range(len(members)))
+        for positions in [everything] if vectorize else [[p] for p in everything]:
+            chunk = [members[p] for p in positions]
+            chunk_bound = jax.tree_util.tree_map(lambda leaf: leaf[positions], bound)
+            data = pad_groups([groups[i] for i in chunk], size)
+            chain_keys = jax.numpy.stack([random.split(run_keys[i], num_chains) for i in chunk])
+            with CompileCounter() as compiles:
+                started = time.perf_counter()
+                samples, extra, log_lik = jax.device_get(sampler(chain_keys, data, chunk_bound))
+                seconds = (time.perf_counter() - started) / len(chunk)
+            compile_share = compiles.seconds / len(chunk)
+            for pos, g_idx in enumerate(chunk):
+                group = groups[g_idx]
+                draws, group_log_lik = unpack_group(
+                    samples, extra, log_lik, pos, group.n_points, size
+                )
+                idata = draws_to_inference_data(draws, group_log_lik, group)
+                run_model = bound_models[positions[pos]]
+                grad_evals, tree_depth = tree_statistics(draws.extra_fields["num_steps"])
+                timing = SamplerTiming(
+                    compile_seconds=compile_share,
+                    sampling_seconds=max(seconds - compile_share, 0.0),
+                    grad_evals=grad_evals,
+                    mean_tree_depth=tree_depth,
+                )
+                gfit = _build_group_fit(
+                    model.name, group, priors, draws, idata, run_model, timing
+                )
+                gfit.wall_seconds = seconds
+                record(gfit)
+    return sorted(leftover)
+
+
+def _load_cached_fits(
+    fit_cache: "FitCache",
+    models: list["BayesianModel"],
+    dataset: BayesianDataset,
+    keys: dict[tuple[int, int], Any],
+    priors_for: dict[str, PriorSet],
+    record: Callable[[GroupFit], None],
+    cache_keys: dict[tuple[str, tuple[Any, ...]], str],
+    *,
+    sampler: str,
+    **settings: Any,
+) -> dict[tuple[int, int], Any]:
+    """Record every job found in ``fit_cache``; return the PRNG keys of the rest.
+
+    The content hash of each job is stored in ``cache_keys`` under
+    ``(model name, group_id)`` so freshly sampled fits can be saved under it.
+    """
+    from .cache import fit_key
+
+    missing: dict[tuple[int, int], Any] = {}
+    for (m_idx, g_idx), run_key in keys.items():
+        model = models[m_idx]
+        group = dataset.groups[g_idx]
+        digest = fit_key(
+            model.bind_group(group),
+            group,
+            priors_for[model.name],
+            run_key,
+            sampler=sampler,
+            **settings,
+        )
+        cache_keys[(model.name, group.group_id)] = digest
+        cached = fit_cache.load(digest, group)
+        if cached is None:
+            missing[(m_idx, g_idx)] = run_key
+        else:
+            record(cached)
+    return missing
+
+
 def fit_groups(
     dataset: BayesianDataset,
     models: Iterable["BayesianModel"],
@@ -272,6 +751,18 @@ def fit_groups(
     target_accept_prob: float = 0.95,
     seed: int = 0,
     progress_bar: bool = False,
+    bucketed: bool = False,
+    batched: bool = False,
+    executor: Literal["serial", "process"] = "serial",
+    max_workers: int | None = None,
+    cache: "FitCache | str | os.PathLike[str] | None" = None,
+    storage: "StoragePolicy | Literal['full', 'lean']" = "full",
+    backend: Literal["nuts", "laplace", "svi"] = "nuts",
+    svi_steps: int = 2000,
+    svi_learning_rate: float = 0.01,
+    checkpoint: "Checkpoint | str | os.PathLike[str] | None" = None,
+    resume: bool = True,
+    hierarchical: "Hierarchical | bool | None" = None,
 ) -> BayesianFit:
     """Fit each ``(model, group)`` combination with NumPyro NUTS.
 
@@ -284,19 +775,119 @@ def fit_groups(
         seed: PRNG seed (each ``(model, group)`` gets a distinct fold-in).
         progress_bar: Show one unified tqdm bar across all ``(model, group)`` fits.
             Updates run on the main thread once per completed group (Jupyter-safe).
+        bucketed: Pad every group to its power-of-two shape bucket
+            (:meth:`BayesianGroup.padded`, with a likelihood ``mask``) and sample
+            it with a jitted NUTS program that is compiled once per
+            ``(model, bucket)`` and reused for every group of that bucket, rather
+            than recompiled per group. Compiled samplers persist across calls
+            (see :func:`sampler_cache_info` / :func:`clear_sampler_cache`).
+        batched: Like ``bucketed`` but sample each bucket's groups together in
+            one ``jax.vmap``-ed NUTS program (see
+            :mod:`fairfluids.analysis.bayesian.batched`).
+        executor: ``"serial"`` (default) runs every job on the calling thread;
+            ``"process"`` distributes the ``(model, group)`` jobs over a spawned
+            process pool of ``max_workers`` workers, each with its own JAX
+            runtime (see :mod:`fairfluids.analysis.bayesian.executor`). Results
+            are identical for a given ``seed`` whatever the worker count.
+            Combines with ``bucketed`` (each worker caches its own samplers) but
+            not with ``batched``.
+        max_workers: Worker processes for ``executor="process"`` (default: the
+            number of CPUs).
+        cache: A :class:`~fairfluids.analysis.bayesian.cache.FitCache` (or its
+            directory). Groups whose fit is already stored under the same
+            model definition, priors, group data, sampler settings and seed
+            are loaded instead of sampled; newly sampled groups are stored.
+            Loaded fits carry a ``PosteriorDraws`` in ``GroupFit.mcmc``.
+        storage: What each :class:`GroupFit` keeps in memory: ``"full"``
+            (default), ``"lean"`` or a
+            :class:`~fairfluids.analysis.bayesian.storage.StoragePolicy`. Fits
+            are compacted as they complete, after diagnostics are computed
+            and after they are written to ``cache``.
+        backend: ``"nuts"`` (default) samples the exact posterior. ``"laplace"``
+            and ``"svi"`` fit a Gaussian approximation per group in
+            ``svi_steps`` Adam steps (learning rate ``svi_learning_rate``) and
+            draw ``num_chains * num_samples`` independent samples from it (see
+            :mod:`fairfluids.analysis.bayesian.approximate`); ``num_warmup`` and
+            ``target_accept_prob`` are ignored. Meant for screening. Cannot be
+            combined with ``bucketed`` or ``batched``.
+        svi_steps, svi_learning_rate: Optimiser settings of the approximate
+            backends.
+        checkpoint: A :class:`~fairfluids.analysis.bayesian.checkpoint.Checkpoint`
+            (or its directory). Every completed fit is written there with a
+            line in the run's progress manifest (wall time, divergences,
+            ESS/s). With ``resume=True`` (default) jobs already completed in
+            the directory are loaded instead of sampled. ``resume=False``
+            clears it first.
+        resume: See ``checkpoint``.
+        hierarchical: A
+            :class:`~fairfluids.analysis.bayesian.hierarchical.Hierarchical`
+            (or ``True`` for its defaults) fits all groups of each system in
+            one NUTS run, with the model parameters drawn per group from a
+            population distribution (optionally a smooth function of
+            composition). Each group still gets its own :class:`GroupFit`; the
+            population draws land in :attr:`BayesianFit.populations`. Cannot be
+            combined with ``bucketed``, ``batched``, the process executor, an
+            approximate backend, ``cache`` or ``checkpoint``.
+
+        With ``bucketed``, ``batched`` or the process executor, seeding,
+        ``GroupFit`` and ``InferenceData`` layout match the default path and
+        ``GroupFit.mcmc`` is a
+        :class:`~fairfluids.analysis.bayesian.batched.PosteriorDraws`.
 
     Returns:
-        :class:`BayesianFit` with one :class:`GroupFit` per model and group.
+        :class:`BayesianFit` with one :class:`GroupFit` per model and group;
+        ``compile_count`` / ``compile_seconds`` record the XLA compilations of
+        the run in the calling process.
     """
-    import arviz as az
     import jax.random as random
-    from numpyro.infer import MCMC, NUTS
+
+    from .cache import as_fit_cache
+    from .checkpoint import as_checkpoint
+
+    if executor not in ("serial", "process"):
+        raise ValueError(f"Unknown executor {executor!r}; expected 'serial' or 'process'.")
+    if executor == "process" and batched:
+        raise ValueError("executor='process' cannot be combined with batched=True.")
+    if backend not in ("nuts", "laplace", "svi"):
+        raise ValueError(f"Unknown backend {backend!r}; expected 'nuts', 'laplace' or 'svi'.")
+    if backend != "nuts" and (bucketed or batched):
+        raise ValueError(f"backend={backend!r} cannot be combined with bucketed or batched.")
+
+    from .hierarchical import as_hierarchical, fit_hierarchical
+
+    population = as_hierarchical(hierarchical)
+    if population is not None:
+        if bucketed or batched or executor != "serial" or backend != "nuts":
+            raise ValueError(
+                "hierarchical fits cannot be combined with bucketed, batched, "
+                "executor='process' or an approximate backend."
+            )
+        if cache is not None or checkpoint is not None:
+            raise ValueError("hierarchical fits cannot be combined with cache or checkpoint.")
+        return fit_hierarchical(
+            dataset,
+            list(models),
+            population,
+            num_warmup=num_warmup,
+            num_samples=num_samples,
+            num_chains=num_chains,
+            target_accept_prob=target_accept_prob,
+            seed=seed,
+            policy=as_storage_policy(storage),
+            progress_bar=progress_bar,
+        )
 
     model_list = list(models)
     model_names = tuple(m.name for m in model_list)
     group_ids = tuple(grp.group_id for grp in dataset.groups)
 
     priors_for = _collect_priors(model_list)
+    fit_cache = as_fit_cache(cache)
+    run_checkpoint = as_checkpoint(checkpoint)
+    if run_checkpoint is not None and not resume:
+        run_checkpoint.clear()
+    policy = as_storage_policy(storage)
+    cache_keys: dict[tuple[str, tuple[Any, ...]], str] = {}
 
     base_key = random.PRNGKey(seed)
     fit = BayesianFit(model_names=model_names, group_ids=group_ids)
@@ -309,67 +900,120 @@ def fit_groups(
         num_chains=num_chains,
     )
     steps_per_job = num_chains * (num_warmup + num_samples)
+    if backend != "nuts":  # optimiser steps; drawing from the approximation is ~free
+        total_steps, steps_per_job = n_jobs * svi_steps, svi_steps
     progress_ctx = (
         unified_mcmc_progress(total_steps=total_steps, description="MCMC fit")
         if progress_bar
         else nullcontext()
     )
 
-    with progress_ctx as progress:
+    with progress_ctx as progress, CompileCounter() as compiles:
         if progress_bar and progress is not None:
             progress.configure_job(steps_per_job=steps_per_job)
-        for m_idx, model in enumerate(model_list):
-            run_priors = priors_for[model.name]
-            for g_idx, group in enumerate(dataset.groups):
-                run_model = model.bind_group(group)
-                run_key = random.fold_in(random.fold_in(base_key, m_idx + 1), g_idx + 1)
-                kernel = NUTS(
-                    run_model.numpyro_model,
-                    **run_model.nuts_kernel_kwargs(target_accept_prob=target_accept_prob),
-                )
-                mcmc = MCMC(
-                    kernel,
-                    num_warmup=num_warmup,
-                    num_samples=num_samples,
-                    num_chains=num_chains,
-                    progress_bar=False,
-                )
-                mcmc.run(
-                    run_key,
-                    features=group.features_jax(),
-                    observation=group.observation_jax(),
-                    observation_uncertainty=group.observation_uncertainty_jax(),
-                    priors=run_priors,
-                    extra_fields=("energy",),
-                )
 
-                # ``log_likelihood=True`` is required so ArviZ can later compute LOO/WAIC.
-                idata = _densify_inference_data(az.from_numpyro(mcmc, log_likelihood=True))
-                rhat = _rhat_dict(idata)
-                ess_bulk = _ess_dict(idata, method="bulk")
-                ess_tail = _ess_dict(idata, method="tail")
-                divergences = _count_divergences(idata)
-
-                gfit = GroupFit(
-                    model_name=model.name,
-                    group=group,
-                    priors=run_priors,
-                    mcmc=mcmc,
-                    inference_data=idata,
-                    rhat=rhat,
-                    ess_bulk=ess_bulk,
-                    ess_tail=ess_tail,
-                    num_divergences=divergences,
-                    model_kwargs=run_model.reconstruction_kwargs(),
+        def record(gfit: GroupFit) -> None:
+            gfit = compact_group_fit(gfit, policy)
+            fit.fits[(gfit.model_name, gfit.group_id)] = gfit
+            if progress_bar and progress is not None:
+                progress.complete_job(
+                    model=gfit.model_name,
+                    group=str(gfit.group.group_label)[:48],
                 )
-                fit.fits[(model.name, group.group_id)] = gfit
 
-                if progress_bar and progress is not None:
-                    progress.complete_job(
-                        model=model.name,
-                        group=str(group.group_label)[:48],
+        def store(gfit: GroupFit) -> None:
+            digest = cache_keys.get((gfit.model_name, gfit.group_id))
+            if fit_cache is not None:
+                fit_cache.save(digest, gfit)
+            if run_checkpoint is not None:
+                run_checkpoint.save(digest, gfit)
+            record(gfit)
+
+        settings: dict[str, Any] = dict(
+            num_warmup=num_warmup,
+            num_samples=num_samples,
+            num_chains=num_chains,
+            target_accept_prob=target_accept_prob,
+        )
+        if backend != "nuts":
+            settings = dict(
+                backend=backend,
+                num_samples=num_samples,
+                num_chains=num_chains,
+                svi_steps=svi_steps,
+                svi_learning_rate=svi_learning_rate,
+            )
+        # Keys are derived here, never in workers, so results depend only on ``seed``.
+        keys = {
+            (m_idx, g_idx): random.fold_in(random.fold_in(base_key, m_idx + 1), g_idx + 1)
+            for m_idx in range(len(model_list))
+            for g_idx in range(len(dataset.groups))
+        }
+        stores = [c for c in (fit_cache, getattr(run_checkpoint, "fits", None)) if c is not None]
+        for fit_store in stores:
+            keys = _load_cached_fits(
+                fit_store,
+                model_list,
+                dataset,
+                keys,
+                priors_for,
+                record,
+                cache_keys,
+                sampler=backend if backend != "nuts" else "bucketed" if bucketed or batched else "mcmc",
+                **settings,
+            )
+        if executor == "process":
+            from .executor import run_process_jobs
+
+            run_process_jobs(
+                model_list,
+                dataset,
+                keys,
+                priors_for,
+                store,
+                max_workers=max_workers,
+                bucketed=bucketed,
+                settings=settings,
+            )
+        else:
+            for m_idx, model in enumerate(model_list):
+                run_priors = priors_for[model.name]
+                pending = [g_idx for g_idx in range(len(dataset.groups)) if (m_idx, g_idx) in keys]
+                if pending and (bucketed or batched):
+                    subset = dataset
+                    if len(pending) < len(dataset.groups):
+                        subset = dataset.model_copy(
+                            update={"groups": [dataset.groups[g] for g in pending]}
+                        )
+                    leftover = _fit_model_bucketed(
+                        model,
+                        subset,
+                        [keys[(m_idx, g_idx)] for g_idx in pending],
+                        run_priors,
+                        store,
+                        vectorize=batched,
+                        **settings,
                     )
-
+                    pending = [pending[i] for i in leftover]
+                for g_idx in pending:
+                    group = dataset.groups[g_idx]
+                    run_model = model.bind_group(group)
+                    started = time.perf_counter()
+                    draws, idata, timing = _sample_group(
+                        run_model, group, keys[(m_idx, g_idx)], run_priors, **settings
+                    )
+                    gfit = _build_group_fit(
+                        model.name, group, run_priors, draws, idata, run_model, timing
+                    )
+                    gfit.wall_seconds = time.perf_counter() - started
+                    store(gfit)
+
+    if bucketed or batched or executor == "process" or stores:
+        # Buckets, workers and cache hits complete out of group order; keep the serial layout.
+        order = [(m, gid) for m in model_names for gid in group_ids]
+        fit.fits = {key: fit.fits[key] for key in order if key in fit.fits}
+    fit.compile_count = compiles.count
+    fit.compile_seconds = compiles.seconds
     return fit
 
 
@@ -407,45 +1051,33 @@ def predict(
         ``samples``. The arrays have shape ``(n_points,)`` (or ``(n_draws, n_points)``
         for ``samples``).
     """
-    import jax.numpy as jnp
-    import jax.random as random
-    from numpyro.infer import Predictive
-
     from .models import get_model
+    from .predictive import predictive_draws
 
     gid = fit.resolve_group(model_name, group_id)
     gfit = fit.get(model_name, gid)
     model = get_model(model_name, **gfit.model_kwargs)
-
-    n_points: int | None = None
-    features_jax: dict[str, Any] = {}
     for fname in model.feature_names:
         if fname not in features:
             raise KeyError(
                 f"predict() is missing feature {fname!r}. Provided: {list(features)}."
             )
-        arr = jnp.asarray(np.asarray(features[fname], dtype=float))
-        features_jax[fname] = arr
-        if n_points is None:
-            n_points = int(arr.shape[0])
-
-    obs_unc = (
-        jnp.asarray(np.asarray(observation_uncertainty, dtype=float))
-        if observation_uncertainty is not None
-        else None
-    )
 
-    samples_dict = gfit.mcmc.get_samples()
-    predictive = Predictive(model.numpyro_model, samples_dict)
-    key = random.fold_in(random.PRNGKey(seed), abs(hash(gid)) % (2**31))
-    pp = predictive(
-        key,
-        features=features_jax,
-        observation=None,
-        observation_uncertainty=obs_unc,
-        priors=gfit.priors,
-    )
-    obs = np.asarray(pp["obs"])
+    # The compiled ``Predictive`` is cached per model, so repeated calls do not retrace.
+    pp = predictive_draws(
+        fit,
+        model_name,
+        group_ids=[gid],
+        features={f: np.asarray(features[f], dtype=float) for f in model.feature_names},
+        observation_uncertainty=(
+            np.asarray(observation_uncertainty, dtype=float)
+            if observation_uncertainty is not None
+            else False
+        ),
+        sites=("obs",),
+        seed=seed,
+    )[gid]
+    obs = pp["obs"]
 
     out: dict[str, Any] = {
         "model": model_name,
@@ -533,7 +1165,9 @@ def predict_averaged(
 __all__ = [
     "GroupFit",
     "BayesianFit",
+    "clear_sampler_cache",
     "fit_groups",
     "predict",
     "predict_averaged",
+    "sampler_cache_info",
 ]
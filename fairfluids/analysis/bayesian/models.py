@@ -13,7 +13,7 @@ through :func:`get_model` / :func:`list_models`.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, Mapping
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, Mapping
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
@@ -30,8 +30,18 @@ class _ModelRegistry:
 
     def __init__(self) -> None:
         self._entries: dict[str, type["BayesianModel"]] = {}
+        self._pending: list[Callable[[], Any]] = []
+
+    def defer(self, loader: Callable[[], Any]) -> None:
+        """Run ``loader`` (which registers models) on the first registry access."""
+        self._pending.append(loader)
+
+    def _load_pending(self) -> None:
+        while self._pending:
+            self._pending.pop(0)()
 
     def register(self, cls: type["BayesianModel"]) -> None:
+        self._load_pending()
         name = cls.name
         if not name:
             return
@@ -43,6 +53,7 @@ class _ModelRegistry:
         self._entries[name] = cls
 
     def get(self, name: str) -> type["BayesianModel"]:
+        self._load_pending()
         if name not in self._entries:
             raise KeyError(
                 f"No Bayesian model registered under {name!r}. "
@@ -51,6 +62,7 @@ class _ModelRegistry:
         return self._entries[name]
 
     def names(self) -> list[str]:
+        self._load_pending()
         return sorted(self._entries)
 
 
@@ -390,6 +402,7 @@ class BayesianModel(BaseModel):
         observation_uncertainty: "jax.Array | None" = None,
         *,
         priors: PriorSet | None = None,
+        mask: "jax.Array | None" = None,
     ) -> None:
         """Generic NumPyro model used for both prior predictive and MCMC.
 
@@ -397,7 +410,9 @@ class BayesianModel(BaseModel):
         called via keyword arguments. ``priors`` provides the per-parameter prior
         specs, the ``model_sigma`` scale and the observation likelihood; when
         omitted it defaults to the model's own configured priors
-        (:meth:`prior_set`).
+        (:meth:`prior_set`). ``mask`` (boolean, one entry per point) drops padded
+        points from the likelihood; the batched sampler uses it to share one
+        compiled program across groups of different size.
         """
         import jax.numpy as jnp
         import numpyro
@@ -418,6 +433,8 @@ class BayesianModel(BaseModel):
             obs_dist = dist.StudentT(priors.student_t_df, mu, total_sigma)
         else:
             obs_dist = dist.Normal(mu, total_sigma)
+        if mask is not None:
+            obs_dist = obs_dist.mask(mask)
         numpyro.sample("obs", obs_dist, obs=observation)
 
 
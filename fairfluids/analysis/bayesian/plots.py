@@ -116,51 +116,67 @@ def _predictive_sample_array(
     return np.asarray(samples["obs"])
 
 
-def _posterior_predictive_bands(
+def _posterior_predictive_band_map(
     model: "BayesianModel",
     fit: BayesianFit,
-    group: BayesianGroup,
+    groups: list[BayesianGroup],
     *,
     feature: str,
     n_grid: int = 120,
     quantiles: tuple[float, float] = (0.05, 0.95),
     seed: int = 0,
     plot_scale: str | None = None,
-) -> dict[str, np.ndarray]:
-    """Predict the model's observation distribution on a dense feature grid."""
-    import jax.numpy as jnp
-    import jax.random as random
-    from numpyro.infer import Predictive
-
-    gfit = fit.get(model.name, group.group_id)
-    from .models import get_model
+) -> dict[Any, dict[str, np.ndarray]]:
+    """Predictive bands of every group on its own dense ``feature`` grid, in one batched call.
 
-    run_model = (
-        get_model(model.name, **gfit.model_kwargs) if gfit.model_kwargs else model
+    Each group's grid spans its observed ``feature`` range; any other model
+    feature is held at the group's median.
+    """
+    from .predictive import predictive_draws
+
+    grids: dict[str, list[np.ndarray]] = {f: [] for f in model.feature_names}
+    for group in groups:
+        f_arr = np.asarray(group.features[feature], dtype=float)
+        f_grid = np.linspace(float(np.min(f_arr)), float(np.max(f_arr)), n_grid)
+        for fname in model.feature_names:
+            grids[fname].append(
+                f_grid
+                if fname == feature
+                else np.full(n_grid, float(np.median(group.features[fname])))
+            )
+    draws = predictive_draws(
+        fit,
+        model.name,
+        group_ids=[g.group_id for g in groups],
+        features={f: np.stack(rows) for f, rows in grids.items()},
+        seed=seed,
+        model=model,
     )
 
-    f_arr = group.features[feature]
-    f_grid = np.linspace(float(np.min(f_arr)), float(np.max(f_arr)), n_grid)
-    features_jax = _predictive_feature_arrays(run_model, group, feature, f_grid)
+    bands: dict[Any, dict[str, np.ndarray]] = {}
+    for pos, group in enumerate(groups):
+        gfit = fit.get(model.name, group.group_id)
+        run_model = model.model_copy(update=gfit.model_kwargs) if gfit.model_kwargs else model
+        pred = _predictive_sample_array(draws[group.group_id], model=run_model)
+        if run_model.resolve_plot_scale(plot_scale) == "property" and run_model.log_observation:
+            pred = run_model.transform_mean_for_display(pred, plot_scale=plot_scale)
+        bands[group.group_id] = {
+            "grid": grids[feature][pos],
+            "mean": pred.mean(axis=0),
+            "lo": np.quantile(pred, quantiles[0], axis=0),
+            "hi": np.quantile(pred, quantiles[1], axis=0),
+        }
+    return bands
 
-    predictive = Predictive(run_model.numpyro_model, gfit.mcmc.get_samples())
-    key = random.fold_in(random.PRNGKey(seed), abs(hash(group.group_id)) % (2**31))
-    samples = predictive(
-        key,
-        features=features_jax,
-        observation=None,
-        observation_uncertainty=None,
-        priors=gfit.priors,
-    )
-    pred = _predictive_sample_array(samples, model=run_model)
-    if run_model.resolve_plot_scale(plot_scale) == "property" and run_model.log_observation:
-        pred = run_model.transform_mean_for_display(pred, plot_scale=plot_scale)
-    return {
-        "grid": f_grid,
-        "mean": pred.mean(axis=0),
-        "lo": np.quantile(pred, quantiles[0], axis=0),
-        "hi": np.quantile(pred, quantiles[1], axis=0),
-    }
+
+def _posterior_predictive_bands(
+    model: "BayesianModel",
+    fit: BayesianFit,
+    group: BayesianGroup,
+    **kwargs: Any,
+) -> dict[str, np.ndarray]:
+    """Predict the model's observation distribution on a dense feature grid."""
+    return _posterior_predictive_band_map(model, fit, [group], **kwargs)[group.group_id]
 
 
 def _resolve_feature_x_axis(
@@ -285,6 +301,9 @@ def plot_posterior_predictive(
     cmap = _composition_cmap(len(compositions) or 2)
     comp_to_idx = {c: i for i, c in enumerate(compositions)}
 
+    all_bands = _posterior_predictive_band_map(
+        model, fit, bayesian_groups, feature=feature, plot_scale=plot_scale
+    )
     axis_label: str | None = None
     for group in bayesian_groups:
         doi = _resolve_doi(group, doi_field)
@@ -296,9 +315,7 @@ def plot_posterior_predictive(
             color = _doi_color(doi, doi_styles)
         marker = _doi_marker(doi, doi_order)
 
-        bands = _posterior_predictive_bands(
-            model, fit, group, feature=feature, plot_scale=plot_scale
-        )
+        bands = all_bands[group.group_id]
         f_grid = bands["grid"]
         f_obs = group.features[feature]
         x_grid, axis_label = _resolve_feature_x_axis(
@@ -532,7 +549,6 @@ def plot_residuals_and_pareto_k(
     plot_scale: str | None = None,
 ) -> tuple["Figure", "np.ndarray"]:
     """One row per model: residual scatter (left) + Pareto-k scatter (right)."""
-    import arviz as az
     import matplotlib.pyplot as plt
 
     model_names = list(fit.model_names)
@@ -546,8 +562,12 @@ def plot_residuals_and_pareto_k(
         if d not in doi_order:
             doi_order.append(d)
 
+    from .predictive import predictive_draws
+
     for row, m_name in enumerate(model_names):
         ax_res, ax_k = axes[row]
+        # Mean prediction at the observed features, for all groups in one batched call.
+        predictions = predictive_draws(fit, m_name, sites=("mu", "obs"), seed=123)
         for gid in fit.group_ids:
             if (m_name, gid) not in fit.fits:
                 continue
@@ -555,26 +575,9 @@ def plot_residuals_and_pareto_k(
             doi = _resolve_doi(gfit.group, doi_field)
             color = _doi_color(doi)
             marker = _doi_marker(doi, doi_order)
-            loo = az.loo(gfit.inference_data, pointwise=True)
-            k = _pareto_k_safe(loo)
-            samples = gfit.mcmc.get_samples()
-            # Reconstruct mean prediction at observed features
-            import jax.numpy as jnp
-            from numpyro.infer import Predictive
-            import jax.random as random
-
+            k = _pareto_k_safe(gfit.loo())
             model = _get_model_for(m_name, gfit)
-            features_jax = {f: jnp.asarray(gfit.group.features[f]) for f in gfit.group.features}
-            pred = Predictive(model.numpyro_model, samples)
-            key = random.fold_in(random.PRNGKey(123), abs(hash(gid)) % (2**31))
-            pp = pred(
-                key,
-                features=features_jax,
-                observation=None,
-                observation_uncertainty=None,
-                priors=gfit.priors,
-            )
-            mean_on_likelihood = _predictive_sample_array(pp, model=model).mean(axis=0)
+            mean_on_likelihood = _predictive_sample_array(predictions[gid], model=model).mean(axis=0)
             mean_pred = model.transform_mean_for_display(
                 mean_on_likelihood, plot_scale=plot_scale
             )
@@ -0,0 +1,321 @@
+"""Batched posterior predictive draws across groups.
+
+Before this module, :func:`~fairfluids.analysis.bayesian.inference.predict`,
+:meth:`BayesianWorkflow.bayesian_p_values` and the plot helpers each built a
+fresh ``numpyro.infer.Predictive`` per ``(model, group)``, so every call traced
+and compiled the model again. :func:`predictive_draws` evaluates all requested
+groups of one model in a single jitted call instead:
+
+- the posterior draws of the groups are stacked on a leading group axis and the
+  ``Predictive`` is ``jax.vmap``-ed over it, with each group keeping its own
+  draws, group-bound model state (threaded through as arrays, as in
+  :mod:`~fairfluids.analysis.bayesian.batched`) and PRNG key;
+- features are either a grid shared by all groups (1-D arrays), one row per
+  group (2-D arrays), or each group's own observed points, edge-padded to a
+  common power-of-two length and trimmed afterwards;
+- the jitted function is cached per ``(model, priors, sites)``
+  (:func:`predictive_cache_info` / :func:`clear_predictive_cache`), so later calls
+  with the same shapes reuse the compiled program.
+
+Groups whose bound state cannot be stacked, or whose priors differ, are
+evaluated in separate batches.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from ..models.compile import CacheInfo
+from .data import _pad_edge, bucket_size
+
+if TYPE_CHECKING:
+    from .inference import BayesianFit, GroupFit
+    from .models import BayesianModel
+    from .priors import PriorSet
+
+DEFAULT_SITES = ("obs", "mu")
+
+_PREDICTIVE_CACHE_MAXSIZE = 32
+_PREDICTIVE_CACHE: OrderedDict[tuple[Any, ...], Callable[..., Any]] = OrderedDict()
+_PREDICTIVE_LOCK = threading.Lock()
+_PREDICTIVE_HITS = 0
+_PREDICTIVE_MISSES = 0
+
+
+def _build_predictive(
+    model: "BayesianModel", priors: "PriorSet", sites: tuple[str, ...]
+) -> Callable[..., Any]:
+    """Jitted ``(keys, samples, features, obs_unc, bound) -> {site: draws}`` over groups."""
+    import jax
+    from numpyro.infer import Predictive
+
+    def one_group(key: Any, samples: Any, features: Any, obs_unc: Any, bound: Any) -> Any:
+        run_model = model.model_copy(update=bound) if bound else model
+        predictive = Predictive(
+            run_model.numpyro_model,
+            posterior_samples=samples,
+            return_sites=sites,
+            parallel=True,
+        )
+        return predictive(
+            key,
+            features=features,
+            observation=None,
+            observation_uncertainty=obs_unc,
+            priors=priors,
+        )
+
+    return jax.jit(jax.vmap(one_group))
+
+
+def _cached_predictive(
+    model: "BayesianModel",
+    priors: "PriorSet",
+    sites: tuple[str, ...],
+    bound: Mapping[str, Any],
+) -> Callable[..., Any]:
+    global _PREDICTIVE_HITS, _PREDICTIVE_MISSES
+
+    try:
+        state = model.model_dump_json(exclude=set(bound))
+    except Exception:  # arbitrary user fields that do not serialise
+        return _build_predictive(model, priors, sites)
+    key = (type(model), state, priors.model_dump_json(), sites)
+    with _PREDICTIVE_LOCK:
+        fn = _PREDICTIVE_CACHE.get(key)
+        if fn is not None:
+            _PREDICTIVE_CACHE.move_to_end(key)
+            _PREDICTIVE_HITS += 1
+            return fn
+        _PREDICTIVE_MISSES += 1
+    fn = _build_predictive(model, priors, sites)
+    with _PREDICTIVE_LOCK:
+        fn = _PREDICTIVE_CACHE.setdefault(key, fn)
+        _PREDICTIVE_CACHE.move_to_end(key)
+        while len(_PREDICTIVE_CACHE) > _PREDICTIVE_CACHE_MAXSIZE:
+            _PREDICTIVE_CACHE.popitem(last=False)
+    return fn
+
+
+def predictive_cache_info() -> CacheInfo:
+    """Hit/miss counters of the per-model compiled ``Predictive`` cache."""
+    with _PREDICTIVE_LOCK:
+        return CacheInfo(
+            _PREDICTIVE_HITS, _PREDICTIVE_MISSES, _PREDICTIVE_CACHE_MAXSIZE, len(_PREDICTIVE_CACHE)
+        )
+
+
+def clear_predictive_cache() -> None:
+    """Drop every cached ``Predictive`` and reset the counters."""
+    global _PREDICTIVE_HITS, _PREDICTIVE_MISSES
+
+    with _PREDICTIVE_LOCK:
+        _PREDICTIVE_CACHE.clear()
+        _PREDICTIVE_HITS = 0
+        _PREDICTIVE_MISSES = 0
+
+
+def group_key(seed: int, group_id: Any) -> Any:
+    """PRNG key of one group's predictive draws (the fold-in used by ``predict``)."""
+    import jax.random as random
+
+    return random.fold_in(random.PRNGKey(seed), abs(hash(group_id)) % (2**31))
+
+
+def _draw_indices(total: int, num_draws: int) -> np.ndarray:
+    if num_draws >= total:
+        return np.arange(total)
+    # Evenly spaced over the flattened (chain, draw) axis, so every chain contributes.
+    return np.linspace(0, total - 1, num_draws).round().astype(int)
+
+
+def _batch_features(
+    gfits: Sequence["GroupFit"],
+    feature_names: Sequence[str],
+    features: Mapping[str, np.ndarray] | None,
+    observation_uncertainty: np.ndarray | bool,
+) -> tuple[dict[str, np.ndarray], np.ndarray, list[int]]:
+    """``(n_groups, size)`` feature and uncertainty arrays plus each group's true length."""
+    n = len(gfits)
+    if features is None:
+        lengths = [g.group.n_points for g in gfits]
+        size = bucket_size(max(lengths))
+        feats = {
+            f: np.stack([_pad_edge(g.group.features[f], size) for g in gfits])
+            for f in feature_names
+        }
+        unc = np.stack(
+            [
+                _pad_edge(
+                    g.group.observation_uncertainty
+                    if observation_uncertainty is True and g.group.observation_uncertainty is not None
+                    else np.zeros(g.group.n_points),
+                    size,
+                )
+                for g in gfits
+            ]
+        )
+        return feats, unc, lengths
+
+    feats = {}
+    for f in feature_names:
+        if f not in features:
+            raise KeyError(f"Predictive features are missing {f!r}. Provided: {list(features)}.")
+        arr = np.asarray(features[f], dtype=float)
+        if arr.ndim == 1:
+            arr = np.broadcast_to(arr, (n, arr.shape[0]))
+        elif arr.shape[0] != n:
+            raise ValueError(
+                f"Feature {f!r} has {arr.shape[0]} rows for {n} groups; pass a 1-D grid "
+                "shared by all groups or one row per group."
+            )
+        feats[f] = arr
+    size = next(iter(feats.values())).shape[1]
+    if isinstance(observation_uncertainty, bool):
+        unc = np.zeros((n, size))
+    else:
+        unc = np.broadcast_to(np.asarray(observation_uncertainty, dtype=float), (n, size))
+    return feats, unc, [size] * n
+
+
+def _derived_sites(model: "BayesianModel", gfit: "GroupFit") -> set[str]:
+    """Deterministic and observed sites of ``model``, traced once on ``gfit``'s group."""
+    from numpyro import handlers
+
+    group = gfit.group
+    trace = handlers.trace(handlers.seed(model.numpyro_model, 0)).get_trace(
+        features=group.features_jax(),
+        observation=group.observation_jax(),
+        observation_uncertainty=group.observation_uncertainty_jax(),
+        priors=gfit.priors,
+    )
+    return {
+        name
+        for name, site in trace.items()
+        if site["type"] == "deterministic"
+        or (site["type"] == "sample" and site.get("is_observed", False))
+    }
+
+
+def predictive_draws(
+    fit: "BayesianFit",
+    model_name: str,
+    *,
+    group_ids: Iterable[Any] | None = None,
+    features: Mapping[str, np.ndarray] | None = None,
+    observation_uncertainty: np.ndarray | bool = False,
+    num_draws: int | None = None,
+    sites: Sequence[str] = DEFAULT_SITES,
+    seed: int = 0,
+    model: "BayesianModel | None" = None,
+) -> dict[Any, dict[str, np.ndarray]]:
+    """Posterior predictive draws of ``model_name`` for many groups at once.
+
+    Args:
+        fit: The :class:`BayesianFit` holding the posteriors.
+        model_name: Model to predict with.
+        group_ids: Raw ``group_id`` tuples (default: every group fitted with
+            ``model_name``).
+        features: ``None`` predicts at each group's observed points. Otherwise a
+            mapping covering every model feature, with 1-D arrays (a grid shared
+            by all groups) or 2-D arrays with one row per group.
+        observation_uncertainty: With ``features=None``, ``True`` folds each
+            group's own ``observation_uncertainty`` into ``obs``. With explicit
+            ``features``, an array broadcast to the grid. ``False`` (default)
+            leaves it out.
+        num_draws: Posterior draws used per group (default: all; evenly spaced
+            over chains otherwise). Groups are cut to the smallest draw count.
+        sites: Sites to return (``"obs"`` and, where the model defines it, the
+            noise-free mean ``"mu"``).
+        seed: PRNG seed; group ``gid`` uses ``fold_in(PRNGKey(seed), hash(gid))``
+            like :func:`~fairfluids.analysis.bayesian.inference.predict`.
+        model: The model instance the groups were fitted with. Each group's
+            ``model_kwargs`` are applied on a copy of it. Defaults to the
+            registered ``model_name``; pass it for custom or unregistered
+            models.
+
+    Returns:
+        ``{group_id: {site: array (num_draws, n_points)}}`` in the order of
+        ``group_ids``.
+    """
+    import jax
+    import jax.numpy as jnp
+
+    from .batched import stack_bound_state
+    from .models import get_model
+
+    if model is not None and model.name != model_name:
+        raise ValueError(f"model {model.name!r} does not match model_name {model_name!r}.")
+    if group_ids is None:
+        group_ids = [gid for gid in fit.group_ids if (model_name, gid) in fit.fits]
+    gids = list(group_ids)
+    gfits = [fit.get(model_name, gid) for gid in gids]
+    if not gfits:
+        return {}
+    sites = tuple(sites)
+
+    # One batch per prior set (priors fix the likelihood family); groups with bound
+    # state that does not stack are evaluated one at a time.
+    batches: dict[str, list[int]] = {}
+    for i, gfit in enumerate(gfits):
+        batches.setdefault(gfit.priors.model_dump_json(), []).append(i)
+    jobs: list[tuple[list[int], dict[str, Any]]] = []
+    for members in batches.values():
+        bound = stack_bound_state([gfits[i].model_kwargs for i in members])
+        if bound is None:
+            jobs.extend(([i], {}) for i in members)
+        else:
+            jobs.append((members, bound))
+
+    out: dict[Any, dict[str, np.ndarray]] = {}
+    for members, bound in jobs:
+        chunk = [gfits[i] for i in members]
+        # Stacked bound state overrides the first group's; otherwise it stays baked in.
+        kwargs = chunk[0].model_kwargs
+        if model is None:
+            run_model = get_model(model_name, **kwargs)
+        else:
+            run_model = model.model_copy(update=kwargs) if kwargs else model
+        all_samples = [g.mcmc.get_samples() for g in chunk]
+        total = min(int(next(iter(s.values())).shape[0]) for s in all_samples)
+        idx = _draw_indices(total, num_draws or total)
+        # Only the latent sites condition the predictive; deterministic sites such
+        # as ``mu`` carry a per-point axis that differs between groups.
+        derived = _derived_sites(run_model, chunk[0])
+        samples = {
+            name: jnp.asarray(np.stack([np.asarray(s[name])[idx] for s in all_samples]))
+            for name in all_samples[0]
+            if name not in derived
+        }
+        feats, unc, lengths = _batch_features(
+            chunk, run_model.feature_names, features, observation_uncertainty
+        )
+        keys = jnp.stack([group_key(seed, gids[i]) for i in members])
+        fn = _cached_predictive(run_model, chunk[0].priors, sites, bound)
+        result = jax.device_get(
+            fn(
+                keys,
+                samples,
+                {f: jnp.asarray(a) for f, a in feats.items()},
+                jnp.asarray(unc),
+                jax.tree_util.tree_map(jnp.asarray, bound),
+            )
+        )
+        for pos, i in enumerate(members):
+            out[gids[i]] = {
+                site: np.asarray(arr[pos])[..., : lengths[pos]] for site, arr in result.items()
+            }
+    return {gid: out[gid] for gid in gids}
+
+
+__all__ = [
+    "DEFAULT_SITES",
+    "clear_predictive_cache",
+    "group_key",
+    "predictive_cache_info",
+    "predictive_draws",
+]
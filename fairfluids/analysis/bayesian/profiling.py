@@ -0,0 +1,191 @@
+"""Lightweight JAX instrumentation for the Bayesian fitting pipeline.
+
+:class:`CompileCounter` hooks into :mod:`jax.monitoring` and counts XLA backend
+compilations while it is active. It is how the batched sampler (see
+:mod:`fairfluids.analysis.bayesian.batched`) demonstrates that it compiles once
+per ``(model, shape bucket)`` instead of once per group::
+
+    with CompileCounter() as compiles:
+        fit = fit_groups(dataset, models, batched=True)
+    print(compiles.count, compiles.seconds)
+
+Every :class:`~fairfluids.analysis.bayesian.inference.GroupFit` also carries a
+:class:`SamplerTiming`: its compile, warmup and sampling time, the gradient
+evaluations (leapfrog steps) and the mean NUTS tree depth. They show up in
+:meth:`BayesianFit.diagnostics` next to ESS per second and per gradient, and
+:func:`throughput_table` ranks jobs or models by ESS per second to point at the
+slowest ones (candidates for a reparameterisation or a cheaper backend).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .inference import BayesianFit, GroupFit
+
+_BACKEND_COMPILE_EVENT = "/jax/core/compile/backend_compile_duration"
+
+
+class CompileCounter:
+    """Context manager counting JAX backend compilations (and their duration).
+
+    Attributes:
+        count: Number of XLA compilations observed inside the ``with`` block.
+        seconds: Total wall time spent in those compilations.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+    def _listener(self, event: str, duration_secs: float, **_kwargs: Any) -> None:
+        if event == _BACKEND_COMPILE_EVENT:
+            self.count += 1
+            self.seconds += float(duration_secs)
+
+    def __enter__(self) -> "CompileCounter":
+        import jax.monitoring
+
+        jax.monitoring.register_event_duration_secs_listener(self._listener)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        import jax.monitoring
+
+        jax.monitoring.unregister_event_duration_listener(self._listener)
+        return False
+
+    def __repr__(self) -> str:
+        return f"CompileCounter(count={self.count}, seconds={self.seconds:.2f})"
+
+
+@dataclass(frozen=True)
+class SamplerTiming:
+    """Where the time of one ``(model, group)`` job went.
+
+    Attributes:
+        compile_seconds: XLA compilation time attributed to the job.
+        warmup_seconds: Warmup (adaptation) time without compilation; ``None``
+            when warmup and sampling ran as one program (bucketed/batched).
+        sampling_seconds: Time of the post-warmup draws without compilation
+            (the whole run for bucketed/batched jobs, the optimisation for the
+            approximate backends).
+        grad_evals: Log-density gradient evaluations over all chains of the
+            post-warmup iterations (NUTS leapfrog steps); every NUTS path counts
+            this phase. The serial and bucketed paths draw their chains from
+            different PRNG streams, so single jobs can differ severalfold when
+            warmup is short. Optimiser steps for the approximate backends.
+        mean_tree_depth: Mean NUTS tree depth of the post-warmup iterations.
+    """
+
+    compile_seconds: float = 0.0
+    warmup_seconds: float | None = None
+    sampling_seconds: float | None = None
+    grad_evals: int | None = None
+    mean_tree_depth: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "compile_seconds": self.compile_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "sampling_seconds": self.sampling_seconds,
+            "grad_evals": self.grad_evals,
+            "mean_tree_depth": self.mean_tree_depth,
+        }
+
+
+def tree_statistics(num_steps: Any) -> tuple[int, float]:
+    """``(gradient evaluations, mean tree depth)`` from NUTS ``num_steps`` per iteration.
+
+    A tree of depth ``d`` takes at most ``2**d - 1`` leapfrog steps, so the depth
+    of an iteration is ``ceil(log2(num_steps + 1))``.
+    """
+    steps = np.asarray(num_steps, dtype=float)
+    if steps.size == 0:
+        return 0, float("nan")
+    return int(steps.sum()), float(np.ceil(np.log2(steps + 1.0)).mean())
+
+
+def _min_ess(gfit: "GroupFit") -> float:
+    values = [v for v in gfit.ess_bulk.values() if np.isfinite(v)]
+    return float(min(values)) if values else float("nan")
+
+
+def _ratio(num: float, den: float | None) -> float:
+    return num / den if den else float("nan")
+
+
+def job_throughput(gfit: "GroupFit") -> dict[str, Any]:
+    """Timing, gradient and ESS throughput figures of one fit."""
+    timing = gfit.timing.as_dict() if gfit.timing is not None else SamplerTiming().as_dict()
+    ess_min = _min_ess(gfit)
+    return {
+        "wall_seconds": gfit.wall_seconds,
+        **timing,
+        "ess_bulk_min": ess_min,
+        "ess_per_second": _ratio(ess_min, gfit.wall_seconds),
+        "ess_per_grad": _ratio(ess_min, timing["grad_evals"]),
+    }
+
+
+def throughput_table(
+    fit: "BayesianFit",
+    *,
+    by: Literal["job", "model"] = "job",
+    slowest: int = 5,
+) -> "pd.DataFrame":
+    """Throughput of every fit, slowest first.
+
+    Jobs (``by="job"``) or models (``by="model"``, summed over their groups) are
+    sorted by ascending ``ess_per_second``, the minimum bulk ESS over the
+    parameters divided by the wall time. The first ``slowest`` rows are flagged
+    ``slow``. ``ess_per_grad`` separates slow geometry (few ESS per gradient,
+    deep trees) from expensive gradients.
+    """
+    import pandas as pd
+
+    if by not in ("job", "model"):
+        raise ValueError(f"Unknown throughput grouping {by!r}; expected 'job' or 'model'.")
+    rows = [
+        {
+            "model": model_name,
+            "group_id": group_id,
+            "group_label": gfit.group.group_label,
+            "n_points": gfit.group.n_points,
+            "num_divergences": gfit.num_divergences,
+            **job_throughput(gfit),
+        }
+        for (model_name, group_id), gfit in fit.fits.items()
+    ]
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+    if by == "model":
+        sums = ["wall_seconds", "compile_seconds", "warmup_seconds", "sampling_seconds", "grad_evals"]
+        grouped = df.groupby("model", sort=False)
+        df = grouped[sums].sum(min_count=1)
+        df.insert(0, "n_groups", grouped.size())
+        df["num_divergences"] = grouped["num_divergences"].sum()
+        df["mean_tree_depth"] = grouped["mean_tree_depth"].mean()
+        df["ess_bulk_min"] = grouped["ess_bulk_min"].sum()
+        df["ess_per_second"] = df["ess_bulk_min"] / df["wall_seconds"]
+        df["ess_per_grad"] = df["ess_bulk_min"] / df["grad_evals"]
+        df = df.reset_index()
+    df = df.sort_values("ess_per_second", na_position="last", kind="stable").reset_index(drop=True)
+    df["slow"] = df.index < int(slowest)
+    return df
+
+
+__all__ = ["CompileCounter", "SamplerTiming", "job_throughput", "throughput_table", "tree_statistics"]
@@ -0,0 +1,265 @@
+"""Storage policies controlling how much of each fit a :class:`GroupFit` keeps.
+
+By default a :class:`~fairfluids.analysis.bayesian.inference.GroupFit` holds the
+live NumPyro ``MCMC`` object (draws on the JAX device), a float64 ArviZ
+``InferenceData`` with a pointwise log-likelihood and a reference to the group's
+source ``DataFrame``: the posterior exists twice and the log-likelihood adds an
+``(chain, draw, n_points)`` array on top. For sweeps over many groups that
+quickly dominates memory. A :class:`StoragePolicy` passed to
+:func:`~fairfluids.analysis.bayesian.inference.fit_groups` compacts every fit as
+it completes:
+
+- ``keep_mcmc=False`` drops the ``MCMC`` object; ``GroupFit.mcmc`` becomes a
+  :class:`~fairfluids.analysis.bayesian.batched.PosteriorDraws` whose arrays are
+  the ``InferenceData`` arrays themselves, so the draws are stored once.
+- ``dtype="float32"`` halves the stored draws.
+- ``thin=k`` keeps every ``k``-th draw of each chain.
+- ``keep_log_likelihood=False`` drops the pointwise log-likelihood; it is
+  recomputed on demand by :meth:`GroupFit.ensure_log_likelihood`, which every
+  LOO consumer calls.
+- ``keep_dataframe=False`` detaches the group's source ``DataFrame``.
+
+Convergence diagnostics (R-hat, ESS, divergences) are computed on the full
+draws before compaction. :meth:`BayesianFit.memory_usage` reports the array
+payload of each fit.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from .batched import PosteriorDraws
+
+if TYPE_CHECKING:
+    import arviz as az
+
+    from .inference import GroupFit
+
+
+@dataclass(frozen=True)
+class StoragePolicy:
+    """What a :class:`GroupFit` keeps in memory (see the module docstring)."""
+
+    keep_mcmc: bool = True
+    dtype: Literal["float64", "float32"] | None = None
+    thin: int = 1
+    keep_log_likelihood: bool = True
+    keep_dataframe: bool = True
+
+    def __post_init__(self) -> None:
+        if int(self.thin) < 1:
+            raise ValueError(f"StoragePolicy.thin must be >= 1, got {self.thin}.")
+        if self.dtype not in (None, "float64", "float32"):
+            raise ValueError(
+                f"StoragePolicy.dtype must be None, 'float64' or 'float32', got {self.dtype!r}."
+            )
+
+    @classmethod
+    def lean(cls, *, thin: int = 1) -> "StoragePolicy":
+        """Smallest footprint: draws stored once in float32, lazy log-likelihood."""
+        return cls(
+            keep_mcmc=False,
+            dtype="float32",
+            thin=thin,
+            keep_log_likelihood=False,
+            keep_dataframe=False,
+        )
+
+    @property
+    def is_full(self) -> bool:
+        return self == StoragePolicy()
+
+
+def as_storage_policy(storage: "StoragePolicy | str") -> StoragePolicy:
+    """Accept a :class:`StoragePolicy` or the names ``"full"`` / ``"lean"``."""
+    if isinstance(storage, StoragePolicy):
+        return storage
+    if storage == "full":
+        return StoragePolicy()
+    if storage == "lean":
+        return StoragePolicy.lean()
+    raise ValueError(f"Unknown storage policy {storage!r}; expected 'full', 'lean' or a StoragePolicy.")
+
+
+def idata_group_names(idata: "az.InferenceData") -> list[str]:
+    """Top-level group names (``posterior``, ``log_likelihood`` ...) of ``idata``.
+
+    arviz >= 1.0 returns an ``xarray.DataTree`` whose ``groups`` are paths
+    (``"/"``, ``"/posterior"`` ...); its direct children are the groups.
+    """
+    children = getattr(idata, "children", None)
+    if children is not None:
+        return [str(name) for name in children]
+    groups = idata.groups
+    if callable(groups):  # arviz < 1.x exposes groups() as a method
+        groups = groups()
+    return [str(name).strip("/") for name in groups if str(name).strip("/")]
+
+
+def _arrays(idata: "az.InferenceData", group_name: str) -> dict[str, np.ndarray]:
+    if group_name not in idata_group_names(idata):
+        return {}
+    return {str(name): np.asarray(da.values) for name, da in idata[group_name].data_vars.items()}
+
+
+def from_dict(groups: dict[str, dict[str, np.ndarray]]) -> "az.InferenceData":
+    """``az.from_dict`` over ``{group: {var: array}}`` for either arviz API.
+
+    arviz >= 1.0 takes the nested mapping as its single positional argument;
+    older releases take one keyword argument per group.
+    """
+    import inspect
+
+    import arviz as az
+
+    if "data" in inspect.signature(az.from_dict).parameters:
+        return az.from_dict(groups)
+    return az.from_dict(**groups)
+
+
+def _assemble(
+    posterior: dict[str, np.ndarray],
+    sample_stats: dict[str, np.ndarray],
+    log_likelihood: dict[str, np.ndarray],
+    observation: np.ndarray,
+) -> "az.InferenceData":
+    """``InferenceData`` with the ``az.from_numpyro`` layout from plain arrays."""
+    groups: dict[str, dict[str, np.ndarray]] = {
+        "posterior": posterior,
+        "sample_stats": sample_stats,
+        "observed_data": {"obs": np.asarray(observation, dtype=float)},
+    }
+    if log_likelihood:
+        groups["log_likelihood"] = log_likelihood
+    return from_dict(groups)
+
+
+def has_log_likelihood(idata: "az.InferenceData") -> bool:
+    return "log_likelihood" in idata_group_names(idata)
+
+
+def compact_group_fit(gfit: "GroupFit", policy: StoragePolicy) -> "GroupFit":
+    """Return ``gfit`` reduced according to ``policy`` (``gfit`` itself if full)."""
+    if policy.is_full:
+        return gfit
+    idata = gfit.inference_data
+    dtype = np.dtype(policy.dtype) if policy.dtype is not None else None
+    thin = int(policy.thin)
+
+    def shrink(arr: np.ndarray) -> np.ndarray:
+        if thin > 1:
+            arr = arr[:, ::thin]
+        if dtype is not None and arr.dtype.kind == "f" and arr.dtype != dtype:
+            arr = arr.astype(dtype)
+        return np.ascontiguousarray(arr)
+
+    posterior = {k: shrink(v) for k, v in _arrays(idata, "posterior").items()}
+    sample_stats = {k: shrink(v) for k, v in _arrays(idata, "sample_stats").items()}
+    log_lik = (
+        {k: shrink(v) for k, v in _arrays(idata, "log_likelihood").items()}
+        if policy.keep_log_likelihood
+        else {}
+    )
+    compact = _assemble(posterior, sample_stats, log_lik, gfit.group.observation)
+
+    mcmc = gfit.mcmc
+    if not policy.keep_mcmc:
+        mcmc = PosteriorDraws(samples=posterior, extra_fields=sample_stats)
+    group = gfit.group
+    if not policy.keep_dataframe and group.dataframe is not None:
+        group = group.model_copy(update={"dataframe": None})
+    return replace(gfit, mcmc=mcmc, inference_data=compact, group=group)
+
+
+def with_log_likelihood(gfit: "GroupFit") -> "az.InferenceData":
+    """``gfit.inference_data`` with the pointwise ``obs`` log-likelihood recomputed.
+
+    Rebuilds the fitted model from ``model_name`` / ``model_kwargs`` and evaluates
+    the likelihood of every stored draw (chain and draw axes batched).
+    """
+    import jax
+    from numpyro.infer.util import log_likelihood
+
+    from .models import get_model
+
+    idata = gfit.inference_data
+    posterior = _arrays(idata, "posterior")
+    model = get_model(gfit.model_name, **gfit.model_kwargs)
+    group = gfit.group
+    log_lik = log_likelihood(
+        model.numpyro_model,
+        posterior,
+        batch_ndims=2,
+        features=group.features_jax(),
+        observation=group.observation_jax(),
+        observation_uncertainty=group.observation_uncertainty_jax(),
+        priors=gfit.priors,
+    )["obs"]
+    obs = np.asarray(jax.device_get(log_lik))
+    reference = next(iter(posterior.values()))
+    if reference.dtype.kind == "f":
+        obs = obs.astype(reference.dtype, copy=False)
+    return _assemble(posterior, _arrays(idata, "sample_stats"), {"obs": obs}, group.observation)
+
+
+def _root(arr: np.ndarray) -> np.ndarray:
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+def fit_nbytes(gfit: "GroupFit") -> dict[str, int]:
+    """Array payload of one fit in bytes, split by owner.
+
+    Keys are ``mcmc`` (draws and sampler statistics held by ``GroupFit.mcmc``),
+    ``inference_data`` (every ``InferenceData`` group), ``dataframe`` and
+    ``total``. Buffers shared between owners are counted once, under the first.
+    """
+    seen: set[int] = set()
+
+    def count(arrays: Any) -> int:
+        total = 0
+        for arr in arrays:
+            root = _root(arr) if isinstance(arr, np.ndarray) else arr
+            if id(root) in seen:
+                continue
+            seen.add(id(root))
+            total += int(root.nbytes)
+        return total
+
+    mcmc = gfit.mcmc
+    sizes = {
+        "mcmc": count(
+            [
+                *mcmc.get_samples(group_by_chain=True).values(),
+                *mcmc.get_extra_fields(group_by_chain=True).values(),
+            ]
+        ),
+        "inference_data": count(
+            arr
+            for name in idata_group_names(gfit.inference_data)
+            for arr in _arrays(gfit.inference_data, name).values()
+        ),
+        "dataframe": (
+            int(gfit.group.dataframe.memory_usage(deep=True).sum())
+            if gfit.group.dataframe is not None
+            else 0
+        ),
+    }
+    sizes["total"] = sum(sizes.values())
+    return sizes
+
+
+__all__ = [
+    "StoragePolicy",
+    "as_storage_policy",
+    "compact_group_fit",
+    "fit_nbytes",
+    "from_dict",
+    "has_log_likelihood",
+    "idata_group_names",
+    "with_log_likelihood",
+]
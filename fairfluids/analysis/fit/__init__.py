@@ -15,7 +15,13 @@ containers (``BayesianGroup`` / ``BayesianDataset``-like) to either backend.
 from __future__ import annotations
 
 from .adapters import DatasetFit, fit_dataset, fit_group
-from .derived import evaluate_derived, scalar_derived_names
+from .derived import (
+    DerivedCurve,
+    curve_derived_names,
+    evaluate_derived,
+    evaluate_derived_curves,
+    scalar_derived_names,
+)
 from .least_squares import SymbolicFit
 from .least_squares import fit as fit_least_squares
 from .mcmc import build_numpyro_model, fit_mcmc
@@ -33,4 +39,7 @@ __all__ = [
     # derived-quantity propagation
     "evaluate_derived",
     "scalar_derived_names",
+    "evaluate_derived_curves",
+    "curve_derived_names",
+    "DerivedCurve",
 ]
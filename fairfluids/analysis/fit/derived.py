@@ -8,19 +8,28 @@ the derived expression symbolically and propagate the parameter covariance via
 the first-order (delta-method) rule ``var(d) = J Σ Jᵀ``.
 
 Derived expressions that depend on a *feature* (e.g. ``alpha_p(T) = A2*T + A1``)
-are not scalars — they are curves — so they are skipped here and left for the
-plotting/reconstruction layer to lambdify directly.
+are not scalars — they are curves. :func:`evaluate_derived_curves` evaluates
+them for many fits over a shared feature grid at once: the expression and its
+parameter gradient are compiled once per model (and cached with the mean
+kernels, see :func:`~fairfluids.analysis.models.compile.compile_derived`) and
+broadcast over ``(n_fits, n_grid)``, with the same delta-method band per grid
+point.
 """
 
 from __future__ import annotations
 
-from typing import Mapping, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Mapping, Optional, Sequence
 
 import numpy as np
 import sympy as sp
 
+from fairfluids.analysis.models.compile import compile_derived
 from fairfluids.analysis.models.model import SymbolicModel
 
+if TYPE_CHECKING:
+    from .least_squares import SymbolicFit
+
 
 def scalar_derived_names(model: SymbolicModel) -> tuple[str, ...]:
     """Derived quantities that reduce to a scalar (no feature dependence)."""
@@ -33,6 +42,12 @@ def scalar_derived_names(model: SymbolicModel) -> tuple[str, ...]:
     return tuple(sorted(out))
 
 
+def curve_derived_names(model: SymbolicModel) -> tuple[str, ...]:
+    """Derived quantities that depend on a feature (curves over the grid)."""
+    scalar = set(scalar_derived_names(model))
+    return tuple(name for name in model.derived_names if name not in scalar)
+
+
 def evaluate_derived(
     model: SymbolicModel,
     param_values: Mapping[str, float],
@@ -79,4 +94,143 @@ def evaluate_derived(
     return out
 
 
-__all__ = ["evaluate_derived", "scalar_derived_names"]
+@dataclass(frozen=True)
+class DerivedCurve:
+    """One derived quantity evaluated for many fits over a shared feature grid.
+
+    ``value`` and ``std`` have shape ``(n_fits, n_grid)``; ``std`` is NaN for
+    fits without a finite covariance (and ``value`` for failed fits).
+    """
+
+    name: str
+    unit: Optional[str]
+    grid: dict[str, np.ndarray]
+    value: np.ndarray
+    std: np.ndarray
+
+    def band(self, z: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(value - z*std, value + z*std)``."""
+        return self.value - z * self.std, self.value + z * self.std
+
+
+def _stack_fits(
+    model: SymbolicModel, fits: "Sequence[SymbolicFit]"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    pnames = model.param_names
+    n_fits, n_params = len(fits), len(pnames)
+    values = np.full((n_fits, n_params), np.nan)
+    consts = np.full((n_fits, len(model.constant_names)), np.nan)
+    cov = np.full((n_fits, n_params, n_params), np.nan)
+    for i, fit in enumerate(fits):
+        if not fit.success:
+            continue
+        values[i] = [fit.params[p][0] for p in pnames]
+        consts[i] = [fit.constants[c] for c in model.constant_names]
+        if fit.covariance is not None and np.shape(fit.covariance) == (
+            n_params,
+            n_params,
+        ):
+            cov[i] = fit.covariance
+    return values, consts, cov
+
+
+def _column(
+    values: Mapping[str, object], names: tuple[str, ...], n_fits: int, what: str
+) -> np.ndarray:
+    missing = [n for n in names if n not in values]
+    if missing:
+        raise KeyError(f"Missing {what} {missing}; expected {list(names)}.")
+    out = np.empty((n_fits, len(names)))
+    for j, name in enumerate(names):
+        out[:, j] = np.broadcast_to(np.asarray(values[name], dtype=float), (n_fits,))
+    return out
+
+
+def evaluate_derived_curves(
+    model: SymbolicModel,
+    fits: "Sequence[SymbolicFit] | Mapping[str, object]",
+    grid: Mapping[str, object],
+    *,
+    constants: Optional[Mapping[str, object]] = None,
+    covariance: Optional[np.ndarray] = None,
+    names: Optional[Sequence[str]] = None,
+) -> dict[str, DerivedCurve]:
+    """Evaluate derived curves for many fits of ``model`` over one feature grid.
+
+    Args:
+        model: The fitted model.
+        fits: Either a sequence of :class:`~.least_squares.SymbolicFit` (their
+            values, resolved constants and covariances are stacked; failed fits
+            give NaN rows) or a mapping ``param -> (n_fits,)`` array.
+        grid: Feature arrays of a common length ``n_grid``, keyed by feature
+            name.
+        constants: With a parameter mapping: ``constant -> scalar or (n_fits,)``.
+        covariance: With a parameter mapping: ``(n_fits, n_params, n_params)``
+            ordered like ``model.param_names``. ``None`` gives NaN ``std``.
+        names: Derived quantities to evaluate; defaults to
+            :func:`curve_derived_names`. Scalar ones are broadcast over the grid.
+
+    Returns:
+        ``{name: DerivedCurve}`` in the order of ``names``.
+    """
+    if isinstance(fits, Mapping):
+        n_fits = max(
+            (np.size(fits[p]) for p in model.param_names if p in fits), default=1
+        )
+        values = _column(fits, model.param_names, n_fits, "parameter values")
+        consts = _column(constants or {}, model.constant_names, n_fits, "constants")
+        n_params = len(model.param_names)
+        if covariance is None:
+            cov = np.full((n_fits, n_params, n_params), np.nan)
+        else:
+            cov = np.broadcast_to(
+                np.asarray(covariance, dtype=float), (n_fits, n_params, n_params)
+            )
+    else:
+        values, consts, cov = _stack_fits(model, fits)
+        n_fits = values.shape[0]
+
+    missing = [f for f in model.features if f not in grid]
+    if missing:
+        raise KeyError(
+            f"Grid is missing feature(s) {missing}; model {model.name!r} needs "
+            f"{list(model.features)}."
+        )
+    grid_arrays = {f: np.asarray(grid[f], dtype=float).ravel() for f in model.features}
+    n_grid = len(next(iter(grid_arrays.values()))) if grid_arrays else 1
+    if any(len(a) != n_grid for a in grid_arrays.values()):
+        raise ValueError("All grid features must have the same length.")
+
+    # Features vary along axis 1, per-fit constants and parameters along axis 0.
+    args = [grid_arrays[f][None, :] for f in model.features]
+    args += [consts[:, j, None] for j in range(consts.shape[1])]
+    args += [values[:, i, None] for i in range(values.shape[1])]
+    shape = (n_fits, n_grid)
+
+    out: dict[str, DerivedCurve] = {}
+    for name in curve_derived_names(model) if names is None else tuple(names):
+        value, *grads = compile_derived(model, name)(*args)
+        value = np.array(np.broadcast_to(value, shape), dtype=float)
+        jac = np.stack(
+            [np.broadcast_to(np.asarray(g, dtype=float), shape) for g in grads]
+        )
+        with np.errstate(invalid="ignore"):
+            var = np.einsum("pfg,fpq,qfg->fg", jac, cov, jac)
+            std = np.sqrt(np.where(var >= 0.0, var, np.nan))
+        out[name] = DerivedCurve(
+            name=name,
+            unit=model.derived_unit(name),
+            grid=grid_arrays,
+            value=value,
+            std=std,
+        )
+    return out
+
+
+__all__ = [
+    "DerivedCurve",
+    "curve_derived_names",
+    "evaluate_derived",
+    "evaluate_derived_curves",
+    "scalar_derived_names",
+]
@@ -26,7 +26,11 @@ class SymbolicFit:
 
     ``params`` holds the primary fitted parameters as ``name -> (value, std)``;
     ``derived`` holds the model's declared scalar derived quantities with their
-    delta-method propagated uncertainty.
+    delta-method propagated uncertainty. ``nfev`` is the number of model
+    evaluations the optimiser needed (``None`` when the fit raised).
+    ``covariance`` is the parameter covariance ordered like
+    ``model.param_names``; :func:`~.derived.evaluate_derived_curves` propagates
+    it onto feature-dependent derived quantities.
     """
 
     model_name: str
@@ -35,6 +39,8 @@ class SymbolicFit:
     r_squared: Optional[float]
     success: bool
     derived: dict[str, tuple[float, Optional[float]]] = field(default_factory=dict)
+    nfev: Optional[int] = None
+    covariance: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
 
     def values(self) -> dict[str, float]:
         return {k: v for k, (v, _s) in self.params.items()}
@@ -43,24 +49,19 @@ class SymbolicFit:
         return {k: v for k, (v, _s) in self.derived.items()}
 
 
-def _eval_numeric_hint(hint: Any, T: np.ndarray, y: np.ndarray) -> float:
+def _eval_numeric_hint(
+    model: SymbolicModel, hint: Any, T: np.ndarray, y: np.ndarray
+) -> float:
     """Resolve a p0/bounds hint that may be a number or a small expression string.
 
     Expressions may reference the feature array ``T`` and the (transformed)
     observation ``y`` through ``min`` / ``max`` / ``mean`` (e.g.
-    ``"min(T) - 50.0"``). Evaluated with an empty builtins namespace.
+    ``"min(T) - 50.0"``). They are parsed once per model by the restricted
+    grammar of :mod:`..models.hints` and never ``eval``-ed.
     """
     if isinstance(hint, (int, float)):
         return float(hint)
-    namespace = {
-        "min": lambda a: float(np.min(a)),
-        "max": lambda a: float(np.max(a)),
-        "mean": lambda a: float(np.mean(a)),
-        "T": T,
-        "y": y,
-        "inf": float("inf"),
-    }
-    return float(eval(str(hint), {"__builtins__": {}}, namespace))  # noqa: S307
+    return float(model.compiled_hint(hint)(T, y))
 
 
 def fit(
@@ -119,7 +120,7 @@ def fit(
     lsq_meta = model.metadata.get("lsq", {}) if isinstance(model.metadata, Mapping) else {}
     guesses: dict[str, float] = {n: float(v) for n, v in model.p0.items()}
     for name, hint in (lsq_meta.get("p0", {}) or {}).items():
-        guesses[name] = _eval_numeric_hint(hint, feats_arr, y)
+        guesses[name] = _eval_numeric_hint(model, hint, feats_arr, y)
     guesses.update({k: float(v) for k, v in (p0 or {}).items()})
     p0_vec = [float(guesses.get(name, 1.0)) for name in pnames]
 
@@ -132,10 +133,10 @@ def fit(
         if not spec:
             continue
         if "lower" in spec:
-            lower[idx] = _eval_numeric_hint(spec["lower"], feats_arr, y)
+            lower[idx] = _eval_numeric_hint(model, spec["lower"], feats_arr, y)
             has_bounds = True
         if "upper" in spec:
-            upper[idx] = _eval_numeric_hint(spec["upper"], feats_arr, y)
+            upper[idx] = _eval_numeric_hint(model, spec["upper"], feats_arr, y)
             has_bounds = True
     # Keep the initial guess strictly inside any finite bounds.
     if has_bounds:
@@ -160,7 +161,9 @@ def fit(
 
     xdata = np.arange(y.size, dtype=float)
     try:
-        popt, pcov = curve_fit(f, xdata, y, p0=p0_vec, **fit_kwargs)
+        popt, pcov, infodict, _mesg, _ier = curve_fit(
+            f, xdata, y, p0=p0_vec, full_output=True, **fit_kwargs
+        )
     except Exception:
         return SymbolicFit(
             model_name=model.name, params={}, constants=consts,
@@ -183,9 +186,11 @@ def fit(
         model, {n: v for n, (v, _s) in params.items()}, consts, pcov
     )
 
+    nfev = infodict.get("nfev")
     return SymbolicFit(
         model_name=model.name, params=params, constants=consts,
         r_squared=r_squared, success=True, derived=derived,
+        nfev=None if nfev is None else int(nfev), covariance=pcov,
     )
 
 
@@ -4,7 +4,9 @@ This module reuses the existing prior primitives from
 :mod:`fairfluids.analysis.bayesian.priors` (pure pydantic, cheap to import) but
 does **not** touch the Bayesian model registry or its generated models. The mean
 function is the model's symbolic ``mean_expr`` compiled to JAX, so NUTS runs on
-exactly the same mathematics as the least-squares backend.
+exactly the same mathematics as the least-squares backend. ``fit_mcmc`` can
+also fit a Laplace or SVI Gaussian approximation instead of running NUTS (see
+:mod:`fairfluids.analysis.bayesian.approximate`).
 
 JAX and NumPyro are imported lazily inside the functions, so importing this
 module (and the whole ``symbolic`` package) never requires the ``[bayesian]``
@@ -13,7 +15,7 @@ extra.
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional
+from typing import Any, Literal, Mapping, Optional
 
 import numpy as np
 
@@ -110,12 +112,24 @@ def fit_mcmc(
     num_chains: int = 2,
     target_accept_prob: float = 0.9,
     seed: int = 0,
+    backend: Literal["nuts", "laplace", "svi"] = "nuts",
+    svi_steps: int = 2000,
+    svi_learning_rate: float = 0.01,
 ):
     """Run NUTS for one group and return the fitted ``numpyro.infer.MCMC`` object.
 
     ``observation`` is raw (linear); the log transform is applied internally when
     ``model.log_observation`` is True, matching the least-squares backend.
+
+    ``backend="laplace"`` or ``"svi"`` fits a Gaussian approximation of the
+    posterior in ``svi_steps`` optimiser steps instead and returns
+    ``num_chains * num_samples`` independent draws as a
+    :class:`~fairfluids.analysis.bayesian.batched.PosteriorDraws`, which has the
+    same ``get_samples`` / ``get_extra_fields`` accessors (``num_warmup`` and
+    ``target_accept_prob`` are then unused).
     """
+    if backend not in ("nuts", "laplace", "svi"):
+        raise ValueError(f"Unknown backend {backend!r}; expected 'nuts', 'laplace' or 'svi'.")
     import jax
     import jax.numpy as jnp
     from numpyro.infer import MCMC, NUTS
@@ -144,6 +158,25 @@ def fit_mcmc(
 
     features_jax = {n: jnp.asarray(v) for n, v in feats.items()}
     numpyro_model = build_numpyro_model(model, features_jax, constants, prior_set)
+    model_kwargs = {
+        "observation": jnp.asarray(y),
+        "observation_uncertainty": jnp.asarray(obs_unc) if obs_unc is not None else None,
+    }
+
+    if backend != "nuts":
+        from fairfluids.analysis.bayesian.approximate import approximate_draws
+
+        draws, _, _ = approximate_draws(
+            numpyro_model,
+            model_kwargs,
+            jax.random.PRNGKey(seed),
+            backend=backend,
+            num_samples=num_samples,
+            num_chains=num_chains,
+            svi_steps=svi_steps,
+            svi_learning_rate=svi_learning_rate,
+        )
+        return draws
 
     kernel = NUTS(numpyro_model, target_accept_prob=target_accept_prob)
     mcmc = MCMC(
@@ -153,11 +186,7 @@ def fit_mcmc(
         num_chains=num_chains,
         progress_bar=False,
     )
-    mcmc.run(
-        jax.random.PRNGKey(seed),
-        observation=jnp.asarray(y),
-        observation_uncertainty=jnp.asarray(obs_unc) if obs_unc is not None else None,
-    )
+    mcmc.run(jax.random.PRNGKey(seed), **model_kwargs)
     return mcmc
 
 
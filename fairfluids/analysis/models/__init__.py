@@ -20,14 +20,24 @@ Notebook usage::
     )
     result = ff.fit_least_squares(fm.get_model("my_vft"), {"T": T_arr}, eta_arr)
 
-Importing this package pulls in only sympy + numpy.
+Importing this package pulls in only sympy + numpy; the built-in store is
+parsed on the first registry access (see :mod:`.builtin`).
 """
 
 from __future__ import annotations
 
 from . import resolvers
-from .builtin import load_builtin_models
-from .compile import compile_jax, compile_numpy
+from .builtin import build_precompiled_store, load_builtin_models
+from .compile import (
+    cache_info,
+    clear_cache,
+    compile_derived,
+    compile_fused,
+    compile_jax,
+    compile_numpy,
+    set_cache_size,
+)
+from .hints import NumericHint, compile_hint
 from .io import (
     from_dict,
     load_models,
@@ -39,8 +49,8 @@ from .model import SymbolicModel
 from .registry import define_model, get_model, list_models, registry
 from .resolvers import FixedConstant, InterpConstant, MeanConstant
 
-# Populate the registry with the framework-provided models (idempotent).
-load_builtin_models()
+# Populate the registry with the framework-provided models on first access.
+registry.defer(load_builtin_models)
 
 __all__ = [
     # core
@@ -51,13 +61,22 @@ __all__ = [
     "list_models",
     "registry",
     "load_builtin_models",
+    "build_precompiled_store",
     # constants
     "FixedConstant",
     "MeanConstant",
     "InterpConstant",
     # compile
     "compile_numpy",
+    "compile_fused",
+    "compile_derived",
     "compile_jax",
+    "cache_info",
+    "clear_cache",
+    "set_cache_size",
+    # p0 / bounds hints
+    "NumericHint",
+    "compile_hint",
     # io
     "to_dict",
     "from_dict",
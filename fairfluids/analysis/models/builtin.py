@@ -3,35 +3,167 @@
 The unified model store lives as plain JSON under ``store/`` (one file per
 property, e.g. ``viscosity.json`` / ``density.json``) in the *same*
 ``{"models": [...]}`` shape a user would author by hand. Importing
-:mod:`fairfluids.analysis.models` calls :func:`load_builtin_models` once so the
-standard Arrhenius / VFT / Litovitz / density models are immediately available
-to both fit backends and to the regression/Bayesian bridges — there is no
-codegen step and no generated package to keep in sync.
+:mod:`fairfluids.analysis.models` defers :func:`load_builtin_models` to the
+first registry access, so the standard Arrhenius / VFT / Litovitz / density
+models are available to both fit backends and to the regression/Bayesian
+bridges without parsing every expression at import time.
+
+Cold starts (e.g. many cluster workers) can skip sympy parsing altogether with
+a precompiled artifact built by :func:`build_precompiled_store`: a pickle of
+the parsed models — with their fingerprints and derived expressions already
+computed — plus the kernel source ``lambdify`` generated for each. It is keyed
+on the SHA-256 of every store file, of the modules the pickled objects come from
+(``model.py`` / ``compile.py``), and on the fairfluids and sympy versions. The
+key is written as a one-line JSON header in front of the pickle and checked
+before anything is unpickled; when it differs the artifact is ignored and the
+JSON is parsed as usual.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import pickle
 from pathlib import Path
+from typing import Any
 
 from .io import load_models
 from .registry import registry
 
 STORE_DIR = Path(__file__).parent / "store"
+PRECOMPILED_PATH = STORE_DIR / "precompiled.pickle"
+
+_PRECOMPILED_VERSION = 2
+
+# Modules whose classes and kernel code end up inside the pickle.
+_SOURCE_FILES = ("model.py", "compile.py")
+
+
+def _store_hashes() -> dict[str, str]:
+    return {
+        path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(STORE_DIR.glob("*.json"))
+    }
+
+
+def _source_hashes() -> dict[str, str]:
+    here = Path(__file__).parent
+    return {
+        name: hashlib.sha256((here / name).read_bytes()).hexdigest()
+        for name in _SOURCE_FILES
+    }
 
 
-def load_builtin_models(*, overwrite: bool = True) -> list[str]:
+def _artifact_key() -> dict[str, Any]:
+    import sympy as sp
+
+    from fairfluids import __version__
+
+    return {
+        "version": _PRECOMPILED_VERSION,
+        "fairfluids": __version__,
+        "sympy": sp.__version__,
+        "store": _store_hashes(),
+        "source": _source_hashes(),
+    }
+
+
+def build_precompiled_store(
+    path: str | os.PathLike[str] | None = None,
+    *,
+    backends: tuple[str, ...] = ("numpy",),
+) -> Path:
+    """Parse the JSON store once and write the precompiled artifact to ``path``.
+
+    Run this at deployment time (it needs write access to ``path``, by default
+    :data:`PRECOMPILED_PATH`). Kernel source is captured for each of
+    ``backends``; add ``"jax"`` when the Bayesian extra is installed.
+    """
+    path = Path(path) if path is not None else PRECOMPILED_PATH
+    from .compile import kernel_source
+
+    models = []
+    kernels: dict[tuple[str, str], str] = {}
+    for store_file in sorted(STORE_DIR.glob("*.json")):
+        for model in load_models(store_file):
+            # Warm the per-instance caches so they travel with the pickle.
+            model.fingerprint
+            model.derived_exprs
+            for backend in backends:
+                source = kernel_source(model, backend)
+                if source is not None:
+                    kernels[(model.fingerprint, backend)] = source
+            models.append(model)
+
+    header = json.dumps(_artifact_key(), sort_keys=True).encode() + b"\n"
+    payload = {"models": models, "kernels": kernels}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(header + pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp, path)
+    return path
+
+
+def _load_precompiled(path: Path) -> list | None:
+    """Models from a valid artifact at ``path``; ``None`` when absent or stale.
+
+    The JSON header is compared with the current key first, so a stale or
+    foreign artifact is never unpickled.
+    """
+    if not path.is_file():
+        return None
+    try:
+        with path.open("rb") as fh:
+            if json.loads(fh.readline()) != _artifact_key():
+                return None
+            payload = pickle.load(fh)
+    except Exception:
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    from .compile import register_kernel_source
+
+    for (fingerprint, backend), source in payload["kernels"].items():
+        register_kernel_source(fingerprint, backend, source)
+    return payload["models"]
+
+
+def load_builtin_models(
+    *,
+    overwrite: bool = True,
+    precompiled: str | os.PathLike[str] | bool = True,
+) -> list[str]:
     """Register every model in ``store/*.json`` and return their names.
 
     ``overwrite=True`` (the default) makes this idempotent so re-importing the
     package — or calling it again after a registry ``clear()`` — simply refreshes
     the built-ins rather than raising on name collisions.
+
+    ``precompiled`` selects the artifact written by
+    :func:`build_precompiled_store`: ``True`` uses :data:`PRECOMPILED_PATH`, a
+    path uses that file and ``False`` always parses the JSON store.
     """
+    models = None
+    if precompiled is not False:
+        path = PRECOMPILED_PATH if precompiled is True else Path(precompiled)
+        models = _load_precompiled(path)
+    if models is None:
+        models = [
+            m for path in sorted(STORE_DIR.glob("*.json")) for m in load_models(path)
+        ]
+
     loaded: list[str] = []
-    for path in sorted(STORE_DIR.glob("*.json")):
-        for model in load_models(path):
-            registry.register(model, overwrite=overwrite)
-            loaded.append(model.name)
+    for model in models:
+        registry.register(model, overwrite=overwrite)
+        loaded.append(model.name)
     return loaded
 
 
-__all__ = ["load_builtin_models", "STORE_DIR"]
+__all__ = [
+    "PRECOMPILED_PATH",
+    "STORE_DIR",
+    "build_precompiled_store",
+    "load_builtin_models",
+]
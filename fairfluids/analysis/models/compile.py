@@ -2,42 +2,273 @@
 
 One symbolic ``mean_expr`` is turned into:
 
-* a **numpy** callable for the frequentist least-squares backend, and
-* a **JAX** callable for the NumPyro mean (autodiff-traceable, NUTS-ready).
+* a **numpy** callable for the frequentist least-squares backend,
+* a **JAX** callable for the NumPyro mean (autodiff-traceable, NUTS-ready), and
+* optionally a **fused** callable (:func:`compile_fused`, see :mod:`.fused`) for
+  million-point evaluations.
 
-Both use the model's :attr:`~SymbolicModel.arg_order`, so they evaluate the
-*same* mathematics. Compiled callables are cached on the (expr, args, backend)
-signature because ``lambdify`` is comparatively expensive.
+All use the model's :attr:`~SymbolicModel.arg_order`, so they evaluate the
+*same* mathematics. Compiled callables are cached on the model's
+:attr:`~SymbolicModel.fingerprint` plus the backend because ``lambdify`` is
+comparatively expensive. The cache is a bounded, thread-safe LRU (see
+:func:`cache_info` / :func:`clear_cache` / :func:`set_cache_size`) so
+interactively redefined models do not accumulate without limit.
+
+The source ``lambdify`` generates can be captured with :func:`kernel_source`
+and handed back through :func:`register_kernel_source`; a cache miss on a key
+with registered source execs that text instead of re-running ``lambdify``. The
+precompiled built-in store (:mod:`.builtin`) uses this to skip code generation
+on a cold start.
 """
 
 from __future__ import annotations
 
-from typing import Callable, Mapping
+import builtins
+import dis
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from types import CodeType
+from typing import Callable, Mapping, NamedTuple
 
 import sympy as sp
 
 from .model import SymbolicModel
 
-_CACHE: dict[tuple[str, tuple[str, ...], str], Callable] = {}
 
+class CacheInfo(NamedTuple):
+    """Counters of the compiled-kernel cache (mirrors ``functools.lru_cache``)."""
 
-def _compile(model: SymbolicModel, backend: str) -> Callable:
-    arg_names = model.arg_order
-    key = (sp.srepr(model.mean_expr), arg_names, backend)
-    fn = _CACHE.get(key)
-    if fn is None:
-        symbols = model.symbols(arg_names)
-        modules = "numpy" if backend == "numpy" else "jax"
-        fn = sp.lambdify(symbols, model.mean_expr, modules=modules)
-        _CACHE[key] = fn
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_CACHE_MAXSIZE = 256
+_CACHE: OrderedDict[tuple[str, str], Callable] = OrderedDict()
+_LOCK = threading.Lock()
+_HITS = 0
+_MISSES = 0
+_SOURCES: dict[tuple[str, str], str] = {}
+
+
+def _backend_namespace(backend: str) -> dict[str, object]:
+    """Globals the generated source expects (mirrors ``lambdify``'s module imports)."""
+    if backend in ("numpy", "fused"):
+        import numpy as module
+
+        namespace: dict[str, object] = {"numpy": module}
+    else:
+        import jax
+        import jax.numpy as module
+
+        namespace = {"jax": jax}
+    namespace.update({k: v for k, v in vars(module).items() if not k.startswith("_")})
+    namespace["builtins"] = builtins
+    return namespace
+
+
+def _global_names(code: CodeType) -> set[str]:
+    names = {
+        ins.argval
+        for ins in dis.get_instructions(code)
+        if ins.opname in ("LOAD_GLOBAL", "LOAD_NAME")
+    }
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _from_source(source: str, backend: str) -> Callable | None:
+    """Exec registered kernel source; ``None`` if it does not resolve cleanly."""
+    try:
+        namespace = _backend_namespace(backend)
+        local: dict[str, object] = {}
+        exec(compile(source, f"<precompiled-{backend}>", "exec"), namespace, local)
+    except Exception:
+        return None
+    fns = [v for v in local.values() if inspect.isfunction(v)]
+    if len(fns) != 1:
+        return None
+    missing = _global_names(fns[0].__code__) - namespace.keys() - vars(builtins).keys()
+    return None if missing else fns[0]
+
+
+def _lambdify(model: SymbolicModel, backend: str) -> Callable:
+    symbols = model.symbols(model.arg_order)
+    modules = "numpy" if backend == "numpy" else "jax"
+    return sp.lambdify(symbols, model.mean_expr, modules=modules)
+
+
+def _build(model: SymbolicModel, backend: str) -> Callable:
+    if backend == "fused":
+        from .fused import fused_source
+
+        source = fused_source(model)
+        fn = None if source is None else _from_source(source, backend)
+        return fn if fn is not None else _lambdify(model, "numpy")
+    if backend == "numba":
+        from .fused import build_numba
+
+        return build_numba(model)
+    return _lambdify(model, backend)
+
+
+def _cached(key: tuple[str, str], build: Callable[[], Callable]) -> Callable:
+    global _HITS, _MISSES
+
+    with _LOCK:
+        fn = _CACHE.get(key)
+        if fn is not None:
+            _CACHE.move_to_end(key)
+            _HITS += 1
+            return fn
+        _MISSES += 1
+
+    # Code generation runs outside the lock; a concurrent miss on the same key
+    # just compiles twice and the first insertion wins.
+    compiled = build()
+
+    with _LOCK:
+        fn = _CACHE.setdefault(key, compiled)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
     return fn
 
 
+def _compile(model: SymbolicModel, backend: str) -> Callable:
+    key = (model.fingerprint, backend)
+
+    def build() -> Callable:
+        source = _SOURCES.get(key)
+        compiled = None if source is None else _from_source(source, backend)
+        return compiled if compiled is not None else _build(model, backend)
+
+    return _cached(key, build)
+
+
+def _derived_fingerprint(model: SymbolicModel, name: str) -> str:
+    cache = model.__dict__.setdefault("_derived_fingerprint_cache", {})
+    digest = cache.get(name)
+    if digest is None:
+        payload = "\x1f".join((sp.srepr(model.derived_exprs[name]), *model.arg_order))
+        digest = cache[name] = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return digest
+
+
+def compile_derived(model: SymbolicModel, name: str) -> Callable:
+    """Return ``f(*args) -> [value, d/dp_1, ..., d/dp_k]`` for derived quantity ``name``.
+
+    Arguments follow :attr:`SymbolicModel.arg_order` and the gradient entries
+    follow :attr:`SymbolicModel.param_names`. Entries may be scalars when they
+    do not depend on an argument; callers broadcast them. Cached like the mean
+    kernels, keyed on the derived expression rather than the model.
+    """
+    if name not in model.derived:
+        raise KeyError(
+            f"Model {model.name!r} has no derived quantity {name!r}; "
+            f"available: {list(model.derived_names)}"
+        )
+
+    def build() -> Callable:
+        expr = model.derived_exprs[name]
+        grads = [sp.diff(expr, s) for s in model.symbols(model.param_names)]
+        return sp.lambdify(
+            model.symbols(model.arg_order), [expr, *grads], modules="numpy"
+        )
+
+    return _cached((_derived_fingerprint(model, name), "derived"), build)
+
+
+def kernel_source(model: SymbolicModel, backend: str = "numpy") -> str | None:
+    """Return the Python source generated for ``model`` on ``backend``.
+
+    ``"numpy"`` / ``"jax"`` give the ``lambdify`` source, ``"fused"`` the
+    :func:`~fairfluids.analysis.models.fused.fused_source` kernel. ``None`` when
+    the source is not retrievable (the lambdified function is not registered
+    with :mod:`linecache` on every sympy version).
+    """
+    if backend == "fused":
+        from .fused import fused_source
+
+        return fused_source(model)
+    try:
+        return inspect.getsource(_lambdify(model, backend))
+    except (OSError, TypeError):
+        return None
+
+
+def register_kernel_source(fingerprint: str, backend: str, source: str) -> None:
+    """Use ``source`` instead of ``lambdify`` when ``(fingerprint, backend)`` misses.
+
+    Source that fails to exec, or that references a global the backend namespace
+    does not provide, is ignored and the kernel is lambdified as usual.
+    """
+    with _LOCK:
+        _SOURCES[(fingerprint, backend)] = source
+
+
+def cache_info() -> CacheInfo:
+    """Return hit/miss counters and the current size of the kernel cache."""
+    with _LOCK:
+        return CacheInfo(_HITS, _MISSES, _CACHE_MAXSIZE, len(_CACHE))
+
+
+def clear_cache() -> None:
+    """Drop every compiled kernel and reset the hit/miss counters."""
+    global _HITS, _MISSES
+
+    with _LOCK:
+        _CACHE.clear()
+        _HITS = 0
+        _MISSES = 0
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Bound the kernel cache to ``maxsize`` entries (evicting least recently used)."""
+    global _CACHE_MAXSIZE
+
+    if maxsize < 1:
+        raise ValueError(f"Kernel cache size must be >= 1, got {maxsize}.")
+    with _LOCK:
+        _CACHE_MAXSIZE = int(maxsize)
+        while len(_CACHE) > _CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
+
+
 def compile_numpy(model: SymbolicModel) -> Callable:
     """Return a numpy callable ``f(*args)`` over :attr:`SymbolicModel.arg_order`."""
     return _compile(model, "numpy")
 
 
+def compile_fused(model: SymbolicModel, *, jit: str | None = None) -> Callable:
+    """Return a fused kernel ``f(*args)`` over :attr:`SymbolicModel.arg_order`.
+
+    The alternative to :func:`compile_numpy` for large evaluations (see
+    :mod:`.fused`): common subexpressions are computed once and feature-dependent
+    terms are evaluated in place. By default (``jit=None``) this is the numpy
+    kernel, which matches :func:`compile_numpy` bit for bit. numba is opt-in:
+    ``jit="auto"`` uses a numba loop kernel when numba is installed and
+    ``"numba"`` requires it; both agree with numpy only to rounding.
+    """
+    if jit not in ("auto", "numba", None):
+        raise ValueError(f"Unknown jit {jit!r}; expected 'auto', 'numba' or None.")
+    if jit is not None:
+        import importlib.util
+
+        if importlib.util.find_spec("numba") is not None:
+            return _compile(model, "numba")
+        if jit == "numba":
+            raise ImportError(
+                "compile_fused(jit='numba') requires numba to be installed."
+            )
+    return _compile(model, "fused")
+
+
 def compile_jax(model: SymbolicModel) -> Callable:
     """Return a JAX callable ``f(*args)`` over :attr:`SymbolicModel.arg_order`.
 
@@ -65,4 +296,16 @@ def evaluate(
     return fn(*values)
 
 
-__all__ = ["compile_numpy", "compile_jax", "evaluate"]
+__all__ = [
+    "CacheInfo",
+    "cache_info",
+    "clear_cache",
+    "compile_derived",
+    "compile_fused",
+    "compile_jax",
+    "compile_numpy",
+    "evaluate",
+    "kernel_source",
+    "register_kernel_source",
+    "set_cache_size",
+]
@@ -0,0 +1,259 @@
+"""Fused numpy (and optional numba) kernels for a :class:`SymbolicModel`.
+
+``lambdify`` prints :attr:`~SymbolicModel.mean_expr` as one nested numpy
+expression, so every intermediate result allocates a fresh full-size temporary
+and a subterm that appears twice is evaluated twice. For million-point
+evaluations that allocation traffic dominates. :func:`fused_source` rewrites
+the *same* printed expression into straight-line code:
+
+* repeated subterms are computed once and reused (common-subexpression
+  elimination on the printed expression);
+* the first operation on feature data allocates a buffer, every later operation
+  writes into it in place (``_t0 += logA``, ``numpy.exp(_t0, out=_t0)``).
+
+Each in-place step calls the ufunc the nested expression would have called,
+with the operands in the same order, so the result is bit-for-bit the
+``lambdify`` result. In-place reuse is only valid when every intermediate is a
+``float64`` array of the feature shape, so the kernel checks its arguments
+first (equally shaped ``float64`` feature arrays, real scalar constants and
+parameters) and otherwise evaluates the original expression unchanged.
+
+The gain depends on the expression. On 10^6 points (best of 7) the fused
+kernel is 1.5-2.0x faster for ``arrhenius``, ``vft`` and ``litovitz``, whose
+cost is temporaries. It is *not* faster (0.94-1.06x) for ``extended_arrhenius``,
+``litovitz_extended`` and the density polynomials, where one ``log`` or
+``power`` call dominates and the number of ufunc calls is unchanged.
+``test_fused_kernel_timing_on_a_million_points`` (``pytest -m benchmark -s``)
+reproduces these figures.
+
+:func:`build_numba` compiles the printed expression into a ``numba.vectorize``
+loop instead. Its ``exp`` / ``log`` come from LLVM rather than numpy, so it
+agrees with the numpy kernels only to rounding.
+"""
+
+from __future__ import annotations
+
+import ast
+import itertools
+from collections import Counter
+from typing import Callable
+
+import numpy as np
+
+from .model import SymbolicModel
+
+# Operators lowered to in-place updates: AST node -> (operator, ufunc name).
+_BINOPS: dict[type, tuple[str, str]] = {
+    ast.Add: ("+", "add"),
+    ast.Sub: ("-", "subtract"),
+    ast.Mult: ("*", "multiply"),
+    ast.Div: ("/", "true_divide"),
+    ast.Pow: ("**", "power"),
+}
+_UNARY: dict[type, str] = {ast.USub: "negative", ast.UAdd: "positive"}
+
+_KERNEL_NAME = "_fused_kernel"
+
+
+def _printed(model: SymbolicModel) -> ast.FunctionDef | None:
+    """The ``lambdify`` numpy source of ``model`` as a parsed function."""
+    from .compile import kernel_source
+
+    source = kernel_source(model, "numpy")
+    if source is None:
+        return None
+    func = ast.parse(source).body[0]
+    if not isinstance(func, ast.FunctionDef) or len(func.body) != 1:
+        return None
+    if not isinstance(func.body[0], ast.Return) or func.body[0].value is None:
+        return None
+    return func
+
+
+class _Lowering:
+    """Lower a printed expression to statements over owned ``float64`` buffers.
+
+    :meth:`lower` returns ``(ref, owned)``: the name (or parenthesised scalar
+    expression) holding a node's value and whether that buffer is a temporary
+    of the feature shape the kernel may overwrite. Only nodes that depend on a
+    feature become statements; scalar subterms stay inline, exactly as printed.
+    """
+
+    def __init__(self, arrays: set[str], namespace: dict[str, object], shared: set[str]) -> None:
+        self.arrays = arrays
+        self.namespace = namespace
+        self.shared = shared
+        self.lines: list[str] = []
+        self.done: dict[str, str] = {}
+        # Refs known to hold a float64 array of the feature shape.
+        self.safe: set[str] = set(arrays)
+        self._names = (f"_t{i}" for i in itertools.count())
+
+    def is_array(self, node: ast.AST) -> bool:
+        return any(isinstance(n, ast.Name) and n.id in self.arrays for n in ast.walk(node))
+
+    def lower(self, node: ast.expr) -> tuple[str, bool]:
+        key = ast.dump(node)
+        if key in self.done:
+            return self.done[key], False
+        if not self.is_array(node):
+            ref, owned = f"({ast.unparse(node)})", False
+        else:
+            ref, owned = self._lower(node)
+        if key in self.shared:
+            # Reused elsewhere: bind once and never overwrite it in place.
+            name = next(self._names)
+            self.lines.append(f"{name} = {ref}")
+            if ref in self.safe:
+                self.safe.add(name)
+            self.done[key] = name
+            return name, False
+        return ref, owned
+
+    def _fresh(self, expr: str, safe: bool) -> tuple[str, bool]:
+        name = next(self._names)
+        self.lines.append(f"{name} = {expr}")
+        if safe:
+            self.safe.add(name)
+        return name, safe
+
+    def _ufunc(self, func: ast.expr, nargs: int) -> bool:
+        """True if ``func`` names a numpy ufunc with a ``float64 -> float64`` loop."""
+        path: list[str] = []
+        while isinstance(func, ast.Attribute):
+            path.append(func.attr)
+            func = func.value
+        if not isinstance(func, ast.Name) or func.id not in self.namespace:
+            return False
+        obj = self.namespace[func.id]
+        for attr in reversed(path):
+            obj = getattr(obj, attr, None)
+        if not isinstance(obj, np.ufunc) or obj.nout != 1 or obj.nin != nargs:
+            return False
+        return "d" * nargs + "->d" in obj.types
+
+    def _safe(self, *operands: tuple[ast.expr, str, bool]) -> bool:
+        # Array operands must be float64 arrays of the feature shape.
+        return all(ref in self.safe or not self.is_array(node) for node, ref, _ in operands)
+
+    def _lower(self, node: ast.expr) -> tuple[str, bool]:
+        if isinstance(node, ast.Name):
+            return node.id, False
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+            symbol, ufunc = _BINOPS[type(node.op)]
+            left, lo = self.lower(node.left)
+            right, ro = self.lower(node.right)
+            safe = self._safe((node.left, left, lo), (node.right, right, ro))
+            if safe and lo:
+                self.lines.append(f"{left} {symbol}= {right}")
+                return left, True
+            if safe and ro:
+                self.lines.append(f"numpy.{ufunc}({left}, {right}, out={right})")
+                return right, True
+            return self._fresh(f"{left} {symbol} {right}", safe)
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY:
+            operand, owned = self.lower(node.operand)
+            if owned:
+                self.lines.append(f"numpy.{_UNARY[type(node.op)]}({operand}, out={operand})")
+                return operand, True
+            safe = self._safe((node.operand, operand, False))
+            return self._fresh(f"numpy.{_UNARY[type(node.op)]}({operand})", safe)
+
+        if (
+            isinstance(node, ast.Call)
+            and not node.keywords
+            and self._ufunc(node.func, len(node.args))
+        ):
+            func = ast.unparse(node.func)
+            lowered = [(arg, *self.lower(arg)) for arg in node.args]
+            refs = ", ".join(ref for _, ref, _ in lowered)
+            safe = self._safe(*lowered)
+            owned = [ref for _, ref, own in lowered if own]
+            if safe and owned:
+                self.lines.append(f"{func}({refs}, out={owned[0]})")
+                return owned[0], True
+            return self._fresh(f"{func}({refs})", safe)
+
+        # Anything else (Piecewise selects, comparisons ...) is evaluated as printed.
+        return self._fresh(ast.unparse(node), False)
+
+
+def fused_source(model: SymbolicModel) -> str | None:
+    """Source of the fused kernel ``f(*args)`` over :attr:`SymbolicModel.arg_order`.
+
+    ``None`` when the ``lambdify`` source of ``model`` is not retrievable.
+    """
+    from .compile import _backend_namespace
+
+    func = _printed(model)
+    if func is None:
+        return None
+    expr = func.body[0].value
+    args = [a.arg for a in func.args.args]
+    features, scalars = args[: len(model.features)], args[len(model.features):]
+
+    # A repeated subtree is evaluated once, so count uses without descending
+    # into a subtree's second occurrence.
+    uses: Counter[str] = Counter()
+
+    def visit(node: ast.expr) -> None:
+        key = ast.dump(node)
+        uses[key] += 1
+        if uses[key] == 1:
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.expr):
+                    visit(child)
+
+    visit(expr)
+    shared = {
+        key for key, n in uses.items() if n > 1 and not key.startswith(("Name(", "Constant("))
+    }
+    lowering = _Lowering(set(features), _backend_namespace("numpy"), shared)
+    result, _ = lowering.lower(expr)
+
+    printed = ast.unparse(expr)
+    guard = " and ".join(
+        [
+            *(
+                f"type({f}) is numpy.ndarray and {f}.dtype == numpy.float64"
+                + (f" and {f}.shape == {features[0]}.shape" if i else "")
+                for i, f in enumerate(features)
+            ),
+            *(
+                f"numpy.ndim({s}) == 0 and numpy.result_type(numpy.float64, {s}) == numpy.float64"
+                for s in scalars
+            ),
+        ]
+    ) or "True"
+    body = [
+        f"if not ({guard}):",
+        f"    return {printed}",
+        *lowering.lines,
+        f"return {result}",
+    ]
+    return f"def {_KERNEL_NAME}({', '.join(args)}):\n" + "".join(f"    {line}\n" for line in body)
+
+
+def build_numba(model: SymbolicModel) -> Callable:
+    """Compile the printed expression to a ``numba.vectorize`` loop kernel.
+
+    The ufunc broadcasts like the numpy kernels and is compiled lazily for the
+    argument types of its first call.
+    """
+    import numba
+
+    from .compile import _backend_namespace
+
+    func = _printed(model)
+    if func is None:
+        raise ValueError(f"Model {model.name!r}: lambdify source is not retrievable.")
+    func.name = "_scalar_kernel"
+    func.decorator_list = []
+    namespace = _backend_namespace("numpy")
+    exec(compile(ast.Module([func], type_ignores=[]), f"<numba:{model.name}>", "exec"), namespace)
+    return numba.vectorize(nopython=True)(namespace["_scalar_kernel"])
+
+
+__all__ = ["build_numba", "fused_source"]
@@ -0,0 +1,128 @@
+"""Restricted p0 / bounds hint expressions (``"min(T) - 50.0"``).
+
+A model's backend metadata may give initial guesses and bounds as small
+expressions over the group's data instead of numbers: the primary feature array
+``T``, the (transformed) observation ``y``, the reductions ``min`` / ``max`` /
+``mean``, numeric literals, ``inf`` and the arithmetic operators. Such a hint is
+parsed once with :mod:`ast`, checked against that grammar and flattened into a
+postfix program, so evaluating it is a short loop rather than an ``eval`` — no
+Python code from a model file is ever executed.
+
+Compiled hints are plain frozen dataclasses: they pickle with the model (see
+:meth:`SymbolicModel.compiled_hint`) and evaluate against numpy by default or
+any array namespace with the same reductions (``jax.numpy`` in the Bayesian
+bridge).
+"""
+
+from __future__ import annotations
+
+import ast
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+
+_NAMES = ("T", "y")
+_REDUCTIONS = ("min", "max", "mean")
+_BINARY: dict[type, tuple[str, Callable[[Any, Any], Any]]] = {
+    ast.Add: ("add", operator.add),
+    ast.Sub: ("sub", operator.sub),
+    ast.Mult: ("mul", operator.mul),
+    ast.Div: ("truediv", operator.truediv),
+    ast.Pow: ("pow", operator.pow),
+}
+_APPLY = {name: func for name, func in _BINARY.values()}
+
+
+@dataclass(frozen=True)
+class NumericHint:
+    """A parsed hint: ``source`` plus its postfix ``program``.
+
+    Each step is ``(op, arg)``: ``("push", value)``, ``("load", "T" | "y")``,
+    ``("reduce", "min" | "max" | "mean")``, ``("neg", None)`` or a binary
+    operator such as ``("add", None)``.
+    """
+
+    source: str
+    program: tuple[tuple[str, Any], ...]
+
+    @property
+    def names(self) -> frozenset[str]:
+        """Data names (``T`` / ``y``) the hint reads."""
+        return frozenset(arg for op, arg in self.program if op == "load")
+
+    def __call__(self, T: Any, y: Any = None, *, xp: Any = np) -> Any:
+        """Evaluate the hint on feature ``T`` and observation ``y``.
+
+        Reductions resolve on ``xp`` so the result stays traceable for JAX.
+        """
+        stack: list[Any] = []
+        for op, arg in self.program:
+            if op == "push":
+                stack.append(arg)
+            elif op == "load":
+                value = T if arg == "T" else y
+                if value is None:
+                    raise ValueError(
+                        f"Hint {self.source!r} needs {arg!r}, which was not given."
+                    )
+                stack.append(value)
+            elif op == "reduce":
+                stack.append(getattr(xp, arg)(stack.pop()))
+            elif op == "neg":
+                stack.append(-stack.pop())
+            else:
+                right = stack.pop()
+                stack.append(_APPLY[op](stack.pop(), right))
+        return stack[0]
+
+
+def _emit(node: ast.AST, source: str, program: list[tuple[str, Any]]) -> None:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        program.append(("push", float(node.value)))
+    elif isinstance(node, ast.Name) and node.id in _NAMES:
+        program.append(("load", node.id))
+    elif isinstance(node, ast.Name) and node.id == "inf":
+        program.append(("push", float("inf")))
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        _emit(node.operand, source, program)
+        if isinstance(node.op, ast.USub):
+            program.append(("neg", None))
+    elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+        _emit(node.left, source, program)
+        _emit(node.right, source, program)
+        program.append((_BINARY[type(node.op)][0], None))
+    elif (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _REDUCTIONS
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        _emit(node.args[0], source, program)
+        program.append(("reduce", node.func.id))
+    else:
+        raise ValueError(
+            f"Unsupported hint expression {source!r} at {ast.unparse(node)!r}; "
+            f"expected numbers, inf, {'/'.join(_NAMES)}, {'/'.join(_REDUCTIONS)}(...) "
+            "and + - * / **."
+        )
+
+
+def compile_hint(hint: Any) -> NumericHint:
+    """Parse ``hint`` (a number or an expression string) into a :class:`NumericHint`."""
+    if isinstance(hint, (int, float)) and not isinstance(hint, bool):
+        return NumericHint(repr(hint), (("push", float(hint)),))
+    source = str(hint)
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as exc:
+        msg = f"Hint expression {source!r} is not valid: {exc.msg}."
+        raise ValueError(msg) from None
+    program: list[tuple[str, Any]] = []
+    _emit(tree.body, source, program)
+    return NumericHint(source, tuple(program))
+
+
+__all__ = ["NumericHint", "compile_hint"]
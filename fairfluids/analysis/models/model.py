@@ -17,13 +17,17 @@ kernel for least-squares (:mod:`.regression`) and the JAX mean for NUTS
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping
 
 import sympy as sp
 
 from .resolvers import ConstantResolver
 
+if TYPE_CHECKING:
+    from .hints import NumericHint
+
 
 @dataclass(frozen=True)
 class SymbolicModel:
@@ -151,6 +155,23 @@ class SymbolicModel:
             return self.expr
         return sp.expand_log(sp.log(self.expr), force=True)
 
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of everything a compiled kernel depends on.
+
+        Covers the observation-scale expression and the canonical argument
+        order, so two models with the same mathematics share a fingerprint even
+        if their names differ. Computed once and cached on the instance (the
+        ``srepr`` of a large expression is itself costly to build).
+        """
+        cached = self.__dict__.get("_fingerprint_cache")
+        if cached is not None:
+            return cached
+        payload = "\x1f".join((sp.srepr(self.mean_expr), *self.arg_order))
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        object.__setattr__(self, "_fingerprint_cache", digest)
+        return digest
+
     @property
     def derived_names(self) -> tuple[str, ...]:
         """Names of the declared derived quantities (sorted, stable)."""
@@ -175,6 +196,24 @@ class SymbolicModel:
         object.__setattr__(self, "_derived_exprs_cache", out)
         return out
 
+    def compiled_hint(self, hint: Any) -> NumericHint:
+        """The p0/bounds ``hint`` (number or expression string) compiled once.
+
+        Compiled hints are cached on the instance, keyed by their source, so a
+        fit over many groups parses each metadata expression a single time.
+        """
+        key = hint if isinstance(hint, str) else repr(hint)
+        cache = self.__dict__.get("_hint_cache")
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_hint_cache", cache)
+        compiled = cache.get(key)
+        if compiled is None:
+            from .hints import compile_hint
+
+            compiled = cache[key] = compile_hint(hint)
+        return compiled
+
     def derived_unit(self, name: str) -> str | None:
         """Unit string for derived quantity ``name`` (``None`` when unknown)."""
         return self.derived_units.get(name)
@@ -5,11 +5,15 @@ generated modules), this registry is populated *at runtime* — a user declares
 model in a notebook cell with :func:`define_model` and it is immediately
 available to the fit backends. The registry is intentionally separate from the
 ``bayesian`` / ``regression`` registries so this module never touches them.
+
+Bulk sources such as the built-in store are attached with
+:meth:`_SymbolicRegistry.defer` and only loaded on the first registry access,
+so importing the package does not parse every stored expression up front.
 """
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 import sympy as sp
 
@@ -22,8 +26,19 @@ class _SymbolicRegistry:
 
     def __init__(self) -> None:
         self._entries: dict[str, SymbolicModel] = {}
+        self._pending: list[Callable[[], Any]] = []
+
+    def defer(self, loader: Callable[[], Any]) -> None:
+        """Run ``loader`` (which registers models) on the first registry access."""
+        self._pending.append(loader)
+
+    def _load_pending(self) -> None:
+        # Pop before running: loaders call ``register`` and must not re-enter.
+        while self._pending:
+            self._pending.pop(0)()
 
     def register(self, model: SymbolicModel, *, overwrite: bool = False) -> None:
+        self._load_pending()
         if model.name in self._entries and not overwrite:
             raise ValueError(
                 f"Symbolic model {model.name!r} already registered. "
@@ -32,6 +47,7 @@ class _SymbolicRegistry:
         self._entries[model.name] = model
 
     def get(self, name: str) -> SymbolicModel:
+        self._load_pending()
         if name not in self._entries:
             raise KeyError(
                 f"No symbolic model registered under {name!r}. "
@@ -40,9 +56,11 @@ class _SymbolicRegistry:
         return self._entries[name]
 
     def names(self) -> list[str]:
+        self._load_pending()
         return sorted(self._entries)
 
     def clear(self) -> None:
+        self._pending.clear()
         self._entries.clear()
 
 
@@ -1,8 +1,8 @@
 """Regression fits (Arrhenius, extended Arrhenius, VFT) from the symbolic store.
 
 Models are no longer rendered by a codegen pipeline. The ``(spec, kernel)`` pairs
-this engine dispatches to are *synthesised at import time* from the single source
-of truth — the :class:`~fairfluids.analysis.models.SymbolicModel` instances in
+this engine dispatches to are *synthesised on first registry access* from the
+single source of truth — the :class:`~fairfluids.analysis.models.SymbolicModel` instances in
 :data:`fairfluids.analysis.models.registry` — via :mod:`.bridge`. A generic,
 model-agnostic engine groups the data and dispatches to those kernels, returning
 a universal :class:`ParameterStack` of derived quantities.
@@ -19,10 +19,11 @@ Public surface:
 
 from __future__ import annotations
 
-# Synthesise and register every model from the symbolic store on import.
+# Synthesise and register every model from the symbolic store on first access.
 from . import bridge
+from .spec import ModelRegistry as _ModelRegistry
 
-bridge.register_all()
+_ModelRegistry.defer(bridge.register_all)
 
 from .compat import fit_arrhenius, fit_extended_arrhenius, fit_vft
 from .engine import fit_documents, fit_model
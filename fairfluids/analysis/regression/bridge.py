@@ -3,10 +3,11 @@
 The regression engine (:mod:`.engine`) is model-agnostic: it groups the data,
 transforms the observation and dispatches to a registered ``(spec, kernel)``
 pair looked up by name. Historically those pairs were rendered by a codegen
-pipeline into ``_generated/``. They are now *synthesised at import time* from the
-single source of truth — the :class:`~fairfluids.analysis.models.SymbolicModel`
-instances in :data:`fairfluids.analysis.models.registry` — so the regression and
-Bayesian backends can never describe a model differently.
+pipeline into ``_generated/``. They are now *synthesised on first registry
+access* from the single source of truth — the
+:class:`~fairfluids.analysis.models.SymbolicModel` instances in
+:data:`fairfluids.analysis.models.registry` — so the regression and Bayesian
+backends can never describe a model differently.
 
 For each symbolic model we build:
 
@@ -22,6 +23,8 @@ For each symbolic model we build:
 
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Mapping, Optional
 
 import numpy as np
@@ -33,6 +36,17 @@ from ..models.model import SymbolicModel
 from .spec import ModelRegistry, RawFit, RegressionModelSpec, register_model
 
 
+def _model_version(model: SymbolicModel) -> str:
+    """Hash of everything that changes a least-squares result for fixed data."""
+    meta = model.metadata if isinstance(model.metadata, Mapping) else {}
+    payload = json.dumps(
+        [model.fingerprint, dict(model.p0), meta.get("lsq", {})],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def build_spec(model: SymbolicModel) -> RegressionModelSpec:
     """Synthesise a :class:`RegressionModelSpec` from a symbolic model."""
     reg: Mapping = model.metadata.get("regression", {}) if isinstance(model.metadata, Mapping) else {}
@@ -59,6 +73,7 @@ def build_spec(model: SymbolicModel) -> RegressionModelSpec:
         n_fitted=n_fitted,
         param_units=units,
         description=model.description,
+        version=_model_version(model),
     )
 
 
@@ -69,13 +84,18 @@ def build_kernel(model: SymbolicModel):
     fitted scale. The shared least-squares backend re-applies the transform
     internally, so we hand it the reconstructed *raw* observation (and propagate
     ``sigma`` back to raw units) to keep one code path for both entry points.
+    An optional ``p0`` (e.g. a neighbouring group's converged parameters) overrides
+    the model's static initial guesses; keys that are not fitted parameters are
+    ignored.
     """
     feature = model.features[0]
+    pnames = set(model.param_names)
 
     def kernel(
         temperatures: np.ndarray,
         y: np.ndarray,
         sigma: Optional[np.ndarray],
+        p0: Optional[Mapping[str, float]] = None,
     ) -> RawFit:
         T = np.asarray(temperatures, dtype=float).ravel()
         y_arr = np.asarray(y, dtype=float).ravel()
@@ -86,13 +106,14 @@ def build_kernel(model: SymbolicModel):
             sig = np.asarray(sigma, dtype=float).ravel()
             raw_unc = sig * raw if model.log_observation else sig
 
-        fit = _ls_fit(model, {feature: T}, raw, observation_uncertainty=raw_unc)
+        seed = None if p0 is None else {k: v for k, v in p0.items() if k in pnames}
+        fit = _ls_fit(model, {feature: T}, raw, observation_uncertainty=raw_unc, p0=seed)
         if not fit.success:
             return RawFit(params={}, r_squared=None, success=False)
 
         params: dict[str, tuple[float, Optional[float]]] = dict(fit.params)
         params.update(fit.derived)
-        return RawFit(params=params, r_squared=fit.r_squared, success=True)
+        return RawFit(params=params, r_squared=fit.r_squared, success=True, nfev=fit.nfev)
 
     return kernel
 
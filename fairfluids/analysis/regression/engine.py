@@ -9,11 +9,20 @@ the registry in :mod:`fairfluids.analysis.regression.spec`.
 
 The result is always a :class:`~fairfluids.analysis.regression.result.ParameterStack`
 so heterogeneous models contribute to one universal "derived quantities" object.
+
+Every :class:`FitResult` records a ``data_fingerprint`` in its ``meta``. Passing
+an earlier stack as ``previous=`` lets :func:`fit_model` reuse the results of
+groups whose data and model definition are unchanged and fit only new or
+modified groups. With ``warm_start=True`` each nonlinear fit is seeded from the
+converged parameters of the nearest already-fitted composition of the same DOI,
+falling back to the model's static initial guesses if the seeded fit fails.
 """
 
 from __future__ import annotations
 
+import hashlib
 from collections.abc import Mapping as MappingABC, Sequence as SequenceABC
+from itertools import chain
 from typing import Any, Optional, Union
 
 import numpy as np
@@ -23,12 +32,15 @@ from fairfluids.core.functionalities import extract_property_dataframe
 from fairfluids.core.lib import FAIRFluidsDocument
 
 from .result import FitResult, FittedParameter, GroupKey, ParameterStack
-from .spec import RegressionModelSpec, get_model
+from .spec import ModelRegistry, RawFit, RegressionModelSpec, get_model
+
+
+_SEQUENCE_TYPES = (list, tuple, np.ndarray)
 
 
 def _normalize_molefractions(mf: Any, *, molefrac_round: int) -> Optional[tuple[float, ...]]:
     """Round a sequence of mole fractions into a stable, hashable grouping key."""
-    if isinstance(mf, (list, tuple, np.ndarray)):
+    if isinstance(mf, _SEQUENCE_TYPES):
         try:
             return tuple(round(float(x), molefrac_round) for x in mf)
         except (TypeError, ValueError):
@@ -36,13 +48,62 @@ def _normalize_molefractions(mf: Any, *, molefrac_round: int) -> Optional[tuple[
     return None
 
 
-def _derive_water_fraction(
-    row: pd.Series, *, molefractions_col: str, fluid_compounds_col: str
-) -> float:
-    """Water mole fraction for a row, identified via its fluid-compound labels."""
-    fracs = row.get(molefractions_col)
-    comps = row.get(fluid_compounds_col)
-    if not isinstance(fracs, (list, tuple, np.ndarray)):
+def _composition_codes(
+    mole_fractions: np.ndarray, *, molefrac_round: int
+) -> tuple[np.ndarray, list[tuple[float, ...]]]:
+    """Integer composition code per row plus the rounded key behind each code.
+
+    The sequences are flattened into one float buffer and scattered into a padded
+    matrix whose first column holds the sequence length (so compositions of
+    different size never merge), which ``np.unique`` factorises in one pass.
+    Rounding runs once per *distinct* row, yielding exactly the keys of
+    :func:`_normalize_molefractions`; codes follow the sorted key order. Rows
+    that are not numeric sequences get code ``-1``.
+    """
+    n = len(mole_fractions)
+    codes = np.full(n, -1, dtype=np.intp)
+    if set(map(type, mole_fractions)) <= set(_SEQUENCE_TYPES):
+        rows = np.arange(n)
+    else:
+        rows = np.flatnonzero(
+            np.fromiter(
+                (isinstance(mf, _SEQUENCE_TYPES) for mf in mole_fractions), dtype=bool, count=n
+            )
+        )
+    seqs = mole_fractions[rows]
+    if not seqs.size:
+        return codes, []
+    try:
+        lengths = np.fromiter(map(len, seqs), dtype=np.intp, count=seqs.size)
+        flat = np.fromiter(chain.from_iterable(seqs), dtype=float, count=int(lengths.sum()))
+    except (TypeError, ValueError):
+        # Nested or non-numeric entries: fall back to per-row normalisation.
+        normalized = [_normalize_molefractions(mf, molefrac_round=molefrac_round) for mf in mole_fractions]
+        keys = sorted({k for k in normalized if k is not None})
+        lookup = {k: i for i, k in enumerate(keys)}
+        codes[:] = [-1 if k is None else lookup[k] for k in normalized]
+        return codes, keys
+
+    matrix = np.zeros((seqs.size, int(lengths.max()) + 1))
+    matrix[:, 0] = lengths
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    matrix[np.repeat(np.arange(seqs.size), lengths), np.arange(flat.size) - offsets + 1] = flat
+    unique_rows, inverse = np.unique(matrix, axis=0, return_inverse=True)
+
+    unique_keys = [
+        tuple(round(float(x), molefrac_round) for x in row[1 : 1 + int(row[0])])
+        for row in unique_rows
+    ]
+    keys = sorted(set(unique_keys))
+    lookup = {k: i for i, k in enumerate(keys)}
+    remap = np.fromiter((lookup[k] for k in unique_keys), dtype=np.intp, count=len(unique_keys))
+    codes[rows] = remap[inverse.ravel()]
+    return codes, keys
+
+
+def _derive_water_fraction(fracs: Any, comps: Any) -> float:
+    """Water mole fraction of one composition, identified via its compound labels."""
+    if not isinstance(fracs, _SEQUENCE_TYPES):
         return float("nan")
     if isinstance(comps, (list, tuple)):
         for idx, comp in enumerate(comps):
@@ -81,6 +142,85 @@ def _sigma_on_transformed_scale(
     raise ValueError(f"Unsupported y_transform {y_transform!r}.")
 
 
+def _group_fingerprint(
+    spec: RegressionModelSpec,
+    doi: Any,
+    mf_key: tuple[float, ...],
+    temperatures: np.ndarray,
+    raw_values: np.ndarray,
+    raw_uncertainty: Optional[np.ndarray],
+    *,
+    include_water_mole_fraction: bool,
+    measurement_ids: tuple[str, ...],
+) -> str:
+    """Hash one group's fit inputs together with the model name and version."""
+    h = hashlib.blake2b(digest_size=16)
+    header = (spec.name, spec.version, str(doi), mf_key, include_water_mole_fraction)
+    h.update(repr(header).encode("utf-8"))
+    for arr in (temperatures, raw_values, raw_uncertainty):
+        if arr is None:
+            h.update(b"\x00none")
+        else:
+            h.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+    h.update("\x1f".join(measurement_ids).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _nearest_seed(
+    neighbours: list[tuple[np.ndarray, dict[str, float]]],
+    mf_key: tuple[float, ...],
+) -> Optional[dict[str, float]]:
+    """Converged parameters of the neighbour closest in mole-fraction space."""
+    x = np.asarray(mf_key, dtype=float)
+    best: Optional[dict[str, float]] = None
+    best_dist = np.inf
+    for mf, params in neighbours:
+        if mf.shape != x.shape:
+            continue
+        dist = float(np.sum((mf - x) ** 2))
+        if dist < best_dist:
+            best, best_dist = params, dist
+    return best
+
+
+def _well_determined(raw_fit: RawFit, spec: RegressionModelSpec) -> bool:
+    """Whether a fit is a trustworthy warm-start donor.
+
+    Every primary parameter needs a finite standard deviation smaller than its
+    magnitude; poorly identified fits (e.g. a VFT ``T0`` running off to large
+    negative values) would otherwise drag their neighbours into the same valley.
+    """
+    primary = spec.param_names[: spec.n_fitted] if spec.n_fitted else spec.param_names
+    for name in primary:
+        value, std = raw_fit.params.get(name, (np.nan, None))
+        if std is None or not np.isfinite(std) or not std < abs(value):
+            return False
+    return True
+
+
+def _run_kernel(
+    kernel: Any,
+    temperatures: np.ndarray,
+    y: np.ndarray,
+    sigma: Optional[np.ndarray],
+    seed: Optional[dict[str, float]],
+) -> tuple[RawFit, bool, Optional[int]]:
+    """Call ``kernel``, warm-started from ``seed`` when given.
+
+    Returns ``(raw_fit, warm_started, nfev)``. A failed warm-started fit is retried
+    from the model's own initial guesses; ``nfev`` then counts both attempts.
+    """
+    if seed is None:
+        raw_fit = kernel(temperatures, y, sigma)
+        return raw_fit, False, raw_fit.nfev
+    warm = kernel(temperatures, y, sigma, p0=seed)
+    if warm.success:
+        return warm, True, warm.nfev
+    cold = kernel(temperatures, y, sigma)
+    counts = [n for n in (warm.nfev, cold.nfev) if n is not None]
+    return cold, False, sum(counts) if counts else None
+
+
 def fit_model(
     model_name: str,
     df: pd.DataFrame,
@@ -97,6 +237,8 @@ def fit_model(
     t_range: Optional[tuple[float, float]] = None,
     min_points: Optional[int] = None,
     molefrac_round: int = 6,
+    previous: Optional[ParameterStack] = None,
+    warm_start: bool = False,
 ) -> ParameterStack:
     """Fit a registered model per ``(source_doi, mole_fractions)`` group.
 
@@ -118,11 +260,28 @@ def fit_model(
         t_range: Optional inclusive ``(T_min, T_max)`` window in Kelvin.
         min_points: Minimum points per group; defaults to the model's ``min_points``.
         molefrac_round: Rounding for stable mole-fraction grouping.
+        previous: Optional stack from an earlier run. Groups whose data
+            fingerprint (temperatures, values, uncertainties, model name and
+            version) matches a result in ``previous`` reuse that
+            :class:`FitResult` instead of being refitted.
+        warm_start: Seed each fit from the nearest converged composition of the
+            same DOI (groups are visited in composition order). Only kernels
+            that accept ``p0=`` (:class:`~.spec.WarmStartFitKernel`) are seeded;
+            three-argument kernels are fitted cold. The outcome is recorded in
+            ``FitResult.meta['warm_start']`` alongside ``meta['nfev']``.
 
     Returns:
         A :class:`ParameterStack` with one :class:`FitResult` per fitted group.
     """
     spec, kernel = get_model(model_name)
+    # Three-argument kernels cannot take ``p0``: they are always fitted cold.
+    warm_capable = warm_start and ModelRegistry.supports_warm_start(spec.name)
+    reusable: dict[str, FitResult] = {}
+    if previous is not None:
+        for res in previous:
+            fp = res.meta.get("data_fingerprint")
+            if res.model_name == spec.name and fp:
+                reusable[fp] = res
     effective_min_points = spec.min_points if min_points is None else min_points
 
     required = [value_col, temperature_col, doi_col, molefractions_col]
@@ -133,19 +292,10 @@ def fit_model(
             f"Available columns: {list(df.columns)}"
         )
 
-    work = df.copy()
-    work[value_col] = pd.to_numeric(work[value_col], errors="coerce")
-    work[temperature_col] = pd.to_numeric(work[temperature_col], errors="coerce")
-    if uncertainty_col and uncertainty_col in work.columns:
-        work[uncertainty_col] = pd.to_numeric(work[uncertainty_col], errors="coerce")
-
-    work = work[
-        work[value_col].notna()
-        & work[temperature_col].notna()
-        & work[doi_col].notna()
-        & (work[value_col] > 0)
-        & (work[temperature_col] > 0)
-    ].copy()
+    values = pd.to_numeric(df[value_col], errors="coerce").to_numpy(dtype=float)
+    temps = pd.to_numeric(df[temperature_col], errors="coerce").to_numpy(dtype=float)
+    dois = df[doi_col].to_numpy()
+    keep = (values > 0) & (temps > 0) & pd.notna(dois)
 
     if t_range is not None:
         if not isinstance(t_range, (list, tuple)) or len(t_range) != 2:
@@ -153,61 +303,133 @@ def fit_model(
         t_min, t_max = float(t_range[0]), float(t_range[1])
         if t_min > t_max:
             raise ValueError(f"Invalid t_range: T_min ({t_min}) must be <= T_max ({t_max}).")
-        work = work[work[temperature_col].between(t_min, t_max, inclusive="both")].copy()
-
-    if (
-        include_water_mole_fraction
-        and water_col not in work.columns
-        and fluid_compounds_col in work.columns
-    ):
-        work[water_col] = work.apply(
-            _derive_water_fraction,
-            axis=1,
-            molefractions_col=molefractions_col,
-            fluid_compounds_col=fluid_compounds_col,
-        )
-
-    work["_mf_key"] = work[molefractions_col].apply(
-        _normalize_molefractions, molefrac_round=molefrac_round
+        keep &= (temps >= t_min) & (temps <= t_max)
+
+    uncertainties: Optional[np.ndarray] = None
+    if uncertainty_col and uncertainty_col in df.columns:
+        uncertainties = pd.to_numeric(df[uncertainty_col], errors="coerce").to_numpy(dtype=float)
+    mole_fractions = df[molefractions_col].to_numpy()
+    compounds = df[fluid_compounds_col].to_numpy() if fluid_compounds_col in df.columns else None
+    ids = (
+        df[measurement_id_col].to_numpy()
+        if measurement_id_col and measurement_id_col in df.columns
+        else None
     )
-    work = work[work["_mf_key"].notna()].copy()
+    water: Optional[np.ndarray] = None
+    if include_water_mole_fraction and water_col in df.columns:
+        water = pd.to_numeric(df[water_col], errors="coerce").to_numpy(dtype=float)
+
+    # Factorise (DOI, composition) into integer codes and sort the row indices
+    # once; every group is then a contiguous slice of the gathered columns.
+    rows = np.flatnonzero(keep)
+    mf_codes, mf_keys = _composition_codes(mole_fractions[rows], molefrac_round=molefrac_round)
+    valid = mf_codes >= 0
+    rows, mf_codes = rows[valid], mf_codes[valid]
+    doi_codes, doi_values = pd.factorize(dois[rows], sort=True)
+    order = np.lexsort((mf_codes, doi_codes))
+    rows, mf_codes, doi_codes = rows[order], mf_codes[order], doi_codes[order]
+    group_codes = doi_codes.astype(np.int64) * max(len(mf_keys), 1) + mf_codes
+    starts = np.flatnonzero(np.r_[True, group_codes[1:] != group_codes[:-1]]) if rows.size else rows
+    stops = np.r_[starts[1:], rows.size]
+
+    temps = temps[rows]
+    values = values[rows]
+    if uncertainties is not None:
+        uncertainties = uncertainties[rows]
 
     results: list[FitResult] = []
-    for (doi, mf_key), group in work.groupby([doi_col, "_mf_key"], dropna=False):
-        if len(group) < effective_min_points:
+    converged: dict[Any, list[tuple[np.ndarray, dict[str, float]]]] = {}
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        if stop - start < effective_min_points:
             continue
+        doi = doi_values[doi_codes[start]]
+        mf_key = mf_keys[mf_codes[start]]
+        group_rows = rows[start:stop]
 
-        temperatures = group[temperature_col].to_numpy(dtype=float)
-        raw_values = group[value_col].to_numpy(dtype=float)
+        temperatures = temps[start:stop]
+        raw_values = values[start:stop]
         y = _transform_observation(raw_values, spec.y_transform)
 
         sigma: Optional[np.ndarray] = None
+        raw_unc: Optional[np.ndarray] = None
         value_uncertainty_mean: Optional[float] = None
-        if uncertainty_col and uncertainty_col in group.columns:
-            raw_unc = group[uncertainty_col].to_numpy(dtype=float)
+        if uncertainties is not None:
+            raw_unc = uncertainties[start:stop]
             sigma = _sigma_on_transformed_scale(raw_values, raw_unc, spec.y_transform)
             finite_unc = raw_unc[np.isfinite(raw_unc)]
             if finite_unc.size:
                 value_uncertainty_mean = float(np.mean(finite_unc))
 
-        raw_fit = kernel(temperatures, y, sigma)
+        measurement_ids: tuple[str, ...] = ()
+        if ids is not None:
+            measurement_ids = tuple(str(m) for m in ids[group_rows].tolist() if m is not None)
+        fingerprint = _group_fingerprint(
+            spec,
+            doi,
+            mf_key,
+            temperatures,
+            raw_values,
+            raw_unc,
+            include_water_mole_fraction=include_water_mole_fraction,
+            measurement_ids=measurement_ids,
+        )
+        if fingerprint in reusable:
+            reused = reusable[fingerprint]
+            results.append(reused)
+            if warm_capable and _well_determined(
+                RawFit(params={n: (p.value, p.std) for n, p in reused.parameters.items()}),
+                spec,
+            ):
+                converged.setdefault(doi, []).append(
+                    (np.asarray(mf_key, dtype=float),
+                     {n: p.value for n, p in reused.parameters.items()})
+                )
+            continue
+
+        seed = _nearest_seed(converged.get(doi, []), mf_key) if warm_capable else None
+        raw_fit, warm_started, nfev = _run_kernel(kernel, temperatures, y, sigma, seed)
         if not raw_fit.success:
             continue
+        if warm_capable and _well_determined(raw_fit, spec):
+            converged.setdefault(doi, []).append(
+                (np.asarray(mf_key, dtype=float),
+                 {n: float(v) for n, (v, _s) in raw_fit.params.items()})
+            )
+
+        fluid_compounds: tuple[str, ...] = ()
+        if compounds is not None:
+            first = compounds[group_rows[0]]
+            if isinstance(first, _SEQUENCE_TYPES):
+                fluid_compounds = tuple(str(c) for c in first)
+
+        water_fraction: Optional[float] = None
+        if water is not None:
+            finite = water[group_rows]
+            finite = finite[~np.isnan(finite)]
+            water_fraction = float(finite[0]) if finite.size else float("nan")
+        elif include_water_mole_fraction and compounds is not None:
+            water_fraction = float("nan")
+            for r in group_rows.tolist():
+                water_fraction = _derive_water_fraction(mole_fractions[r], compounds[r])
+                if not np.isnan(water_fraction):
+                    break
 
         result = _build_fit_result(
             spec=spec,
             doi=doi,
             mf_key=mf_key,
-            group=group,
+            fluid_compounds=fluid_compounds,
             raw_fit=raw_fit,
             temperatures=temperatures,
-            temperature_col=temperature_col,
-            fluid_compounds_col=fluid_compounds_col,
-            measurement_id_col=measurement_id_col,
-            include_water_mole_fraction=include_water_mole_fraction,
-            water_col=water_col,
+            measurement_ids=measurement_ids,
+            water_fraction=water_fraction,
             value_uncertainty_mean=value_uncertainty_mean,
         )
+        result.meta["data_fingerprint"] = fingerprint
+        if nfev is not None:
+            result.meta["nfev"] = nfev
+        if warm_start:
+            result.meta["warm_start"] = warm_started
         results.append(result)
 
     results.sort(
@@ -221,23 +443,14 @@ def _build_fit_result(
     spec: RegressionModelSpec,
     doi: Any,
     mf_key: tuple[float, ...],
-    group: pd.DataFrame,
+    fluid_compounds: tuple[str, ...],
     raw_fit: Any,
     temperatures: np.ndarray,
-    temperature_col: str,
-    fluid_compounds_col: str,
-    measurement_id_col: Optional[str],
-    include_water_mole_fraction: bool,
-    water_col: str,
+    measurement_ids: tuple[str, ...],
+    water_fraction: Optional[float],
     value_uncertainty_mean: Optional[float],
 ) -> FitResult:
     """Assemble a :class:`FitResult` from a kernel's :class:`RawFit`."""
-    fluid_compounds: tuple[str, ...] = ()
-    if fluid_compounds_col in group.columns:
-        first = group[fluid_compounds_col].iloc[0]
-        if isinstance(first, (list, tuple, np.ndarray)):
-            fluid_compounds = tuple(str(c) for c in first)
-
     group_key = GroupKey(
         source_doi=None if doi is None else str(doi),
         fluid_compounds=fluid_compounds,
@@ -256,26 +469,17 @@ def _build_fit_result(
             unit=spec.unit(pname),
         )
 
-    measurement_ids: tuple[str, ...] = ()
-    if measurement_id_col and measurement_id_col in group.columns:
-        measurement_ids = tuple(
-            str(m) for m in group[measurement_id_col].tolist() if m is not None
-        )
-
     meta: dict[str, Any] = {}
     if value_uncertainty_mean is not None:
         meta["value_uncertainty_mean"] = value_uncertainty_mean
-    if include_water_mole_fraction and water_col in group.columns:
-        water_values = pd.to_numeric(group[water_col], errors="coerce").dropna()
-        meta["mole_fraction_water"] = (
-            float(water_values.iloc[0]) if not water_values.empty else float("nan")
-        )
+    if water_fraction is not None:
+        meta["mole_fraction_water"] = water_fraction
 
     return FitResult(
         model_name=spec.name,
         group_key=group_key,
         parameters=parameters,
-        n_points=int(len(group)),
+        n_points=int(temperatures.size),
         r_squared=raw_fit.r_squared,
         t_min=float(np.min(temperatures)),
         t_max=float(np.max(temperatures)),
@@ -298,12 +502,16 @@ def fit_documents(
     include_water_mole_fraction: bool = False,
     molefrac_round: int = 6,
     extract_kwargs: Optional[dict[str, Any]] = None,
+    previous: Optional[ParameterStack] = None,
+    warm_start: bool = False,
 ) -> ParameterStack:
     """Fit a model directly from one or more ``FAIRFluidsDocument`` instances.
 
     Uses :func:`extract_property_dataframe` to build the working frame, then
     delegates to :func:`fit_model`. The property defaults to the model's
-    ``observation`` (e.g. ``"viscosity"``).
+    ``observation`` (e.g. ``"viscosity"``). Pass the stack of an earlier run as
+    ``previous`` to refit only groups whose data changed, and ``warm_start`` to
+    seed each group from its nearest converged composition.
     """
     spec = get_model(model_name)[0]
     prop = property_type or spec.observation
@@ -319,6 +527,8 @@ def fit_documents(
         min_points=min_points,
         include_water_mole_fraction=include_water_mole_fraction,
         molefrac_round=molefrac_round,
+        previous=previous,
+        warm_start=warm_start,
     )
 
 
@@ -10,14 +10,19 @@ The design goal is a single "derived quantities" object (:class:`ParameterStack`
 that serialises back into a ``FAIRFluidsDocument`` via
 :meth:`ParameterStack.to_fairfluids_document` (and the lower-level
 :meth:`ParameterStack.to_fitted_models`), expressing uncertainties according to
-the GUM (Guide to the Expression of Uncertainty in Measurement).
+the GUM (Guide to the Expression of Uncertainty in Measurement). Stacks are
+stored columnar and persist to ``.npz`` / Parquet via :meth:`ParameterStack.save`
+and :meth:`ParameterStack.load`.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Optional, Sequence
+import json
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -96,26 +101,659 @@ class FitResult:
         return None if param is None else param.std
 
 
-@dataclass
+# --- columnar backing store ---------------------------------------------------
+
+_FORMAT_VERSION = 1
+
+
+def _encode(items: Sequence[Any]) -> tuple[tuple[Any, ...], np.ndarray]:
+    """Dictionary-encode ``items`` into ``(levels, int32 codes)`` (first-seen order)."""
+    lookup: dict[Any, int] = {}
+    codes = np.fromiter(
+        (lookup.setdefault(x, len(lookup)) for x in items),
+        dtype=np.int32,
+        count=len(items),
+    )
+    return tuple(lookup), codes
+
+
+def _meta_kind(values: list[Any]) -> str:
+    """Storage kind of a meta column: bool, int, float, str or JSON."""
+    types = {type(v) for v in values}
+    if types <= {bool, np.bool_}:
+        return "b"
+    if types <= {int, np.int32, np.int64}:
+        return "i"
+    if types <= {int, float, np.int32, np.int64, np.float32, np.float64}:
+        return "f"
+    if types <= {str}:
+        return "U"
+    return "J"
+
+
+_META_DTYPES = {"b": bool, "i": np.int64, "f": float}
+
+
+def _none_to_nan(values: Sequence[Optional[float]]) -> np.ndarray:
+    return np.fromiter(
+        (np.nan if v is None else v for v in values), dtype=float, count=len(values)
+    )
+
+
+def _nan_to_none(values: np.ndarray) -> list[Optional[float]]:
+    return [None if v != v else v for v in values.tolist()]
+
+
+@dataclass(frozen=True)
+class _StackColumns:
+    """Columnar backing store of a :class:`ParameterStack`, one row per fit.
+
+    Categorical fields (model, DOI, compound list) are dictionary-encoded as
+    ``int32`` codes into ``*_levels`` tuples. Mole fractions are a NaN-padded
+    ``(n, width)`` matrix with the true length in :attr:`n_components`.
+    Parameter values and standard deviations are ``(n, n_params)`` float
+    matrices with boolean masks of the same shape: :attr:`present` marks the
+    parameters a fit has and :attr:`has_std` those with a known standard
+    deviation, so a fitted NaN is kept apart from an absent entry (the float
+    matrices hold NaN at unmasked cells). Meta entries become one array per key
+    plus a presence mask.
+    """
+
+    model_levels: tuple[str, ...]
+    model_codes: np.ndarray
+    doi_levels: tuple[Optional[str], ...]
+    doi_codes: np.ndarray
+    compound_levels: tuple[tuple[str, ...], ...]
+    compound_codes: np.ndarray
+    mole_fractions: np.ndarray
+    n_components: np.ndarray
+    param_names: tuple[str, ...]
+    values: np.ndarray
+    stds: np.ndarray
+    present: np.ndarray
+    has_std: np.ndarray
+    units: dict[tuple[str, str], Optional[str]]
+    n_points: np.ndarray
+    r_squared: np.ndarray
+    t_min: np.ndarray
+    t_max: np.ndarray
+    measurement_ids: np.ndarray
+    meta: dict[str, tuple[str, np.ndarray, np.ndarray]]
+
+    def __len__(self) -> int:
+        return int(self.model_codes.size)
+
+    @classmethod
+    def from_results(cls, results: Sequence[FitResult]) -> "_StackColumns":
+        n = len(results)
+        model_levels, model_codes = _encode([r.model_name for r in results])
+        doi_levels, doi_codes = _encode([r.group_key.source_doi for r in results])
+        compound_levels, compound_codes = _encode(
+            [r.group_key.fluid_compounds for r in results]
+        )
+
+        n_components = np.fromiter(
+            (len(r.group_key.mole_fractions) for r in results), dtype=np.int32, count=n
+        )
+        width = int(n_components.max()) if n else 0
+        mole_fractions = np.full((n, width), np.nan)
+        for i, r in enumerate(results):
+            mole_fractions[i, : n_components[i]] = r.group_key.mole_fractions
+
+        param_index: dict[str, int] = {}
+        meta_index: dict[str, list[Any]] = {}
+        for r in results:
+            for name in r.parameters:
+                param_index.setdefault(name, len(param_index))
+            for key in r.meta:
+                meta_index.setdefault(key, [])
+        values = np.full((n, len(param_index)), np.nan)
+        stds = np.full((n, len(param_index)), np.nan)
+        has_value = np.zeros((n, len(param_index)), dtype=bool)
+        has_std = np.zeros((n, len(param_index)), dtype=bool)
+        units: dict[tuple[str, str], Optional[str]] = {}
+        present = {key: np.zeros(n, dtype=bool) for key in meta_index}
+        for i, r in enumerate(results):
+            for name, param in r.parameters.items():
+                j = param_index[name]
+                values[i, j] = param.value
+                has_value[i, j] = True
+                if param.std is not None:
+                    stds[i, j] = param.std
+                    has_std[i, j] = True
+                units.setdefault((r.model_name, name), param.unit)
+            for key, column in meta_index.items():
+                if key in r.meta:
+                    column.append(r.meta[key])
+                    present[key][i] = True
+
+        meta: dict[str, tuple[str, np.ndarray, np.ndarray]] = {}
+        for key, found in meta_index.items():
+            kind = _meta_kind(found)
+            mask = present[key]
+            if kind in _META_DTYPES:
+                column = np.zeros(n, dtype=_META_DTYPES[kind])
+            else:
+                column = np.full(n, None, dtype=object)
+            column[mask] = found if kind in _META_DTYPES else _object_array(found)
+            meta[key] = (kind, column, mask)
+
+        return cls(
+            model_levels=model_levels,
+            model_codes=model_codes,
+            doi_levels=doi_levels,
+            doi_codes=doi_codes,
+            compound_levels=compound_levels,
+            compound_codes=compound_codes,
+            mole_fractions=mole_fractions,
+            n_components=n_components,
+            param_names=tuple(param_index),
+            values=values,
+            stds=stds,
+            present=has_value,
+            has_std=has_std,
+            units=units,
+            n_points=np.fromiter(
+                (r.n_points for r in results), dtype=np.int64, count=n
+            ),
+            r_squared=_none_to_nan([r.r_squared for r in results]),
+            t_min=_none_to_nan([r.t_min for r in results]),
+            t_max=_none_to_nan([r.t_max for r in results]),
+            measurement_ids=_object_array([tuple(r.measurement_ids) for r in results]),
+            meta=meta,
+        )
+
+    def take(self, rows: np.ndarray) -> "_StackColumns":
+        """Row subset (boolean mask or integer indices); levels are kept as-is.
+
+        Parameter and meta columns without a present entry in the subset are
+        dropped and the rest ordered by first appearance, as if the subset had
+        been built from its own results.
+        """
+        index = np.flatnonzero(rows) if rows.dtype == bool else rows
+        present = self.present[index]
+        params = _first_seen(present)
+        names = tuple(self.param_names[j] for j in params.tolist())
+        meta = {
+            k: (kind, col[index], mask[index])
+            for k, (kind, col, mask) in self.meta.items()
+        }
+        if meta:
+            keys = list(meta)
+            order = _first_seen(np.column_stack([meta[k][2] for k in keys]))
+            meta = {keys[j]: meta[keys[j]] for j in order.tolist()}
+        return replace(
+            self,
+            model_codes=self.model_codes[index],
+            doi_codes=self.doi_codes[index],
+            compound_codes=self.compound_codes[index],
+            mole_fractions=self.mole_fractions[index],
+            n_components=self.n_components[index],
+            param_names=names,
+            values=self.values[index][:, params],
+            stds=self.stds[index][:, params],
+            present=present[:, params],
+            has_std=self.has_std[index][:, params],
+            units={key: unit for key, unit in self.units.items() if key[1] in names},
+            n_points=self.n_points[index],
+            r_squared=self.r_squared[index],
+            t_min=self.t_min[index],
+            t_max=self.t_max[index],
+            measurement_ids=self.measurement_ids[index],
+            meta=meta,
+        )
+
+    def to_results(self) -> list[FitResult]:
+        """Materialise one :class:`FitResult` per row."""
+        present = self.present.tolist()
+        has_std = self.has_std.tolist()
+        values = self.values.tolist()
+        stds = self.stds.tolist()
+        units = [
+            [self.units.get((model, name)) for name in self.param_names]
+            for model in self.model_levels
+        ]
+        fractions = self.mole_fractions.tolist()
+        r_squared = _nan_to_none(self.r_squared)
+        t_min = _nan_to_none(self.t_min)
+        t_max = _nan_to_none(self.t_max)
+        meta_columns = [
+            (key, col.tolist(), mask.tolist())
+            for key, (_kind, col, mask) in self.meta.items()
+        ]
+        names = self.param_names
+        measurement_ids = self.measurement_ids.tolist()
+
+        results: list[FitResult] = []
+        for i, (m, d, c, n_comp, n_points) in enumerate(
+            zip(
+                self.model_codes.tolist(),
+                self.doi_codes.tolist(),
+                self.compound_codes.tolist(),
+                self.n_components.tolist(),
+                self.n_points.tolist(),
+            )
+        ):
+            row_units = units[m]
+            row_stds = stds[i]
+            row_has_std = has_std[i]
+            row_values = values[i]
+            parameters = {
+                names[j]: FittedParameter(
+                    name=names[j],
+                    value=row_values[j],
+                    std=row_stds[j] if row_has_std[j] else None,
+                    unit=row_units[j],
+                )
+                for j, has in enumerate(present[i])
+                if has
+            }
+            results.append(
+                FitResult(
+                    model_name=self.model_levels[m],
+                    group_key=GroupKey(
+                        source_doi=self.doi_levels[d],
+                        fluid_compounds=self.compound_levels[c],
+                        mole_fractions=tuple(fractions[i][:n_comp]),
+                    ),
+                    parameters=parameters,
+                    n_points=n_points,
+                    r_squared=r_squared[i],
+                    t_min=t_min[i],
+                    t_max=t_max[i],
+                    measurement_ids=measurement_ids[i],
+                    meta={key: col[i] for key, col, mask in meta_columns if mask[i]},
+                )
+            )
+        return results
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per fit: group metadata, ``p``/``p_std`` columns, then meta."""
+        if not len(self):
+            return pd.DataFrame()
+        data: dict[str, Any] = {
+            "model_name": np.asarray(self.model_levels, dtype=object)[self.model_codes],
+            "source_doi": _object_array(self.doi_levels)[self.doi_codes],
+            "fluid_compounds": _object_array(self.compound_levels)[self.compound_codes],
+            "mole_fractions": _object_array(
+                [
+                    tuple(row[:k])
+                    for row, k in zip(
+                        self.mole_fractions.tolist(), self.n_components.tolist()
+                    )
+                ]
+            ),
+            "n_points": self.n_points,
+            "R_squared": self.r_squared,
+            "T_min": self.t_min,
+            "T_max": self.t_max,
+        }
+        for j, name in enumerate(self.param_names):
+            data[name] = self.values[:, j]
+            data[f"{name}_std"] = self.stds[:, j]
+        for key, (kind, col, mask) in self.meta.items():
+            if kind in ("f", "i") and mask.all():
+                data[key] = col
+            elif kind == "f":
+                data[key] = np.where(mask, col, np.nan)
+            else:
+                filled = col.astype(object)
+                filled[~mask] = np.nan
+                data[key] = filled
+        return pd.DataFrame(data)
+
+    # -- persistence -----------------------------------------------------------
+
+    def _header(self) -> dict[str, Any]:
+        return {
+            "format": "fairfluids.ParameterStack",
+            "version": _FORMAT_VERSION,
+            "model_levels": list(self.model_levels),
+            "doi_levels": list(self.doi_levels),
+            "compound_levels": [list(c) for c in self.compound_levels],
+            "param_names": list(self.param_names),
+            "units": [[m, p, u] for (m, p), u in self.units.items()],
+            "meta_kinds": {key: kind for key, (kind, _c, _m) in self.meta.items()},
+        }
+
+    def _meta_storage(self, key: str) -> np.ndarray:
+        kind, col, mask = self.meta[key]
+        if kind in _META_DTYPES:
+            return col
+        if kind == "U":
+            return np.asarray(
+                [v if m else "" for v, m in zip(col.tolist(), mask.tolist())], dtype=str
+            )
+        return np.asarray(
+            [
+                json.dumps(v, default=str) if m else ""
+                for v, m in zip(col.tolist(), mask.tolist())
+            ],
+            dtype=str,
+        )
+
+    @staticmethod
+    def _meta_from_storage(
+        kind: str, stored: np.ndarray, mask: np.ndarray
+    ) -> np.ndarray:
+        if kind in _META_DTYPES:
+            return np.asarray(stored, dtype=_META_DTYPES[kind])
+        col = np.full(stored.size, None, dtype=object)
+        if kind == "U":
+            col[mask] = stored[mask].tolist()
+        else:
+            col[mask] = _object_array([json.loads(s) for s in stored[mask].tolist()])
+        return col
+
+    def to_npz(self, path: Path) -> None:
+        arrays: dict[str, np.ndarray] = {
+            "header": np.asarray(json.dumps(self._header())),
+            "model_codes": self.model_codes,
+            "doi_codes": self.doi_codes,
+            "compound_codes": self.compound_codes,
+            "mole_fractions": self.mole_fractions,
+            "n_components": self.n_components,
+            "values": self.values,
+            "stds": self.stds,
+            "present": self.present,
+            "has_std": self.has_std,
+            "n_points": self.n_points,
+            "r_squared": self.r_squared,
+            "t_min": self.t_min,
+            "t_max": self.t_max,
+            "measurement_id_counts": np.fromiter(
+                (len(m) for m in self.measurement_ids), dtype=np.int64, count=len(self)
+            ),
+            "measurement_ids": np.asarray(
+                [m for ids in self.measurement_ids for m in ids], dtype=str
+            ),
+        }
+        for i, key in enumerate(self.meta):
+            arrays[f"meta_{i}"] = self._meta_storage(key)
+            arrays[f"meta_{i}_present"] = self.meta[key][2]
+        np.savez(path, **arrays)
+
+    @classmethod
+    def from_npz(cls, path: Path) -> "_StackColumns":
+        with np.load(path, allow_pickle=False) as data:
+            header = cls._check_header(json.loads(str(data["header"])))
+            counts = data["measurement_id_counts"]
+            flat = data["measurement_ids"].tolist()
+            offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+            meta = {}
+            for i, (key, kind) in enumerate(header["meta_kinds"].items()):
+                mask = data[f"meta_{i}_present"]
+                meta[key] = (
+                    kind,
+                    cls._meta_from_storage(kind, data[f"meta_{i}"], mask),
+                    mask,
+                )
+            return cls._from_header(
+                header,
+                model_codes=data["model_codes"],
+                doi_codes=data["doi_codes"],
+                compound_codes=data["compound_codes"],
+                mole_fractions=data["mole_fractions"],
+                n_components=data["n_components"],
+                values=data["values"],
+                stds=data["stds"],
+                present=data["present"],
+                has_std=data["has_std"],
+                n_points=data["n_points"],
+                r_squared=data["r_squared"],
+                t_min=data["t_min"],
+                t_max=data["t_max"],
+                measurement_ids=_object_array(
+                    [tuple(flat[a:b]) for a, b in zip(offsets[:-1], offsets[1:])]
+                ),
+                meta=meta,
+            )
+
+    def to_parquet(self, path: Path) -> None:
+        columns: dict[str, Any] = {
+            "model_code": self.model_codes,
+            "doi_code": self.doi_codes,
+            "compound_code": self.compound_codes,
+            "n_components": self.n_components,
+            "n_points": self.n_points,
+            "r_squared": self.r_squared,
+            "t_min": self.t_min,
+            "t_max": self.t_max,
+            "measurement_ids": [list(m) for m in self.measurement_ids],
+        }
+        for k in range(self.mole_fractions.shape[1]):
+            columns[f"mole_fraction_{k}"] = self.mole_fractions[:, k]
+        for j in range(len(self.param_names)):
+            columns[f"value_{j}"] = self.values[:, j]
+            columns[f"std_{j}"] = self.stds[:, j]
+            columns[f"present_{j}"] = self.present[:, j]
+            columns[f"has_std_{j}"] = self.has_std[:, j]
+        for i, key in enumerate(self.meta):
+            columns[f"meta_{i}"] = self._meta_storage(key)
+            columns[f"meta_{i}_present"] = self.meta[key][2]
+        frame = pd.DataFrame(columns)
+        frame.attrs["fairfluids_parameter_stack"] = json.dumps(self._header())
+        frame.to_parquet(path, index=False)
+
+    @classmethod
+    def from_parquet(cls, path: Path) -> "_StackColumns":
+        frame = pd.read_parquet(path)
+        raw = frame.attrs.get("fairfluids_parameter_stack")
+        if raw is None:
+            raise ValueError(
+                f"{str(path)!r} is not a saved ParameterStack (no header)."
+            )
+        header = cls._check_header(json.loads(raw))
+        n_params = len(header["param_names"])
+        width = sum(1 for c in frame.columns if c.startswith("mole_fraction_"))
+        meta = {}
+        for i, (key, kind) in enumerate(header["meta_kinds"].items()):
+            mask = frame[f"meta_{i}_present"].to_numpy(dtype=bool)
+            stored = frame[f"meta_{i}"].to_numpy()
+            if kind not in _META_DTYPES:
+                stored = stored.astype(str)
+            meta[key] = (kind, cls._meta_from_storage(kind, stored, mask), mask)
+
+        def matrix(prefix: str, k: int, dtype: type = float) -> np.ndarray:
+            if not k:
+                return np.empty((len(frame), 0), dtype=dtype)
+            return frame[[f"{prefix}{j}" for j in range(k)]].to_numpy(dtype=dtype)
+
+        return cls._from_header(
+            header,
+            model_codes=frame["model_code"].to_numpy(dtype=np.int32),
+            doi_codes=frame["doi_code"].to_numpy(dtype=np.int32),
+            compound_codes=frame["compound_code"].to_numpy(dtype=np.int32),
+            mole_fractions=matrix("mole_fraction_", width),
+            n_components=frame["n_components"].to_numpy(dtype=np.int32),
+            values=matrix("value_", n_params),
+            stds=matrix("std_", n_params),
+            present=matrix("present_", n_params, bool),
+            has_std=matrix("has_std_", n_params, bool),
+            n_points=frame["n_points"].to_numpy(dtype=np.int64),
+            r_squared=frame["r_squared"].to_numpy(dtype=float),
+            t_min=frame["t_min"].to_numpy(dtype=float),
+            t_max=frame["t_max"].to_numpy(dtype=float),
+            measurement_ids=_object_array(
+                [tuple(str(m) for m in ids) for ids in frame["measurement_ids"]]
+            ),
+            meta=meta,
+        )
+
+    @staticmethod
+    def _check_header(header: dict[str, Any]) -> dict[str, Any]:
+        if header.get("format") != "fairfluids.ParameterStack":
+            raise ValueError("File does not contain a saved ParameterStack.")
+        if header.get("version") != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported ParameterStack format version {header.get('version')!r} "
+                f"(expected {_FORMAT_VERSION})."
+            )
+        return header
+
+    @classmethod
+    def _from_header(cls, header: dict[str, Any], **arrays: Any) -> "_StackColumns":
+        return cls(
+            model_levels=tuple(header["model_levels"]),
+            doi_levels=tuple(header["doi_levels"]),
+            compound_levels=tuple(tuple(c) for c in header["compound_levels"]),
+            param_names=tuple(header["param_names"]),
+            units={(m, p): u for m, p, u in header["units"]},
+            **arrays,
+        )
+
+
+def _first_seen(mask: np.ndarray) -> np.ndarray:
+    """Indices of the columns of ``mask`` with any set row, by first set row."""
+    used = np.flatnonzero(mask.any(axis=0))
+    if not used.size:
+        return used
+    return used[np.argsort(mask[:, used].argmax(axis=0), kind="stable")]
+
+
+class _ResultList(list):
+    """``list`` of :class:`FitResult` that tells its stack when it is mutated."""
+
+    def __init__(self, items: Any = (), on_change: Any = None) -> None:
+        super().__init__(items)
+        self._on_change = on_change
+
+    def __reduce__(self) -> Any:
+        return list, (list(self),)
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+
+def _mutator(name: str) -> Any:
+    method = getattr(list, name)
+
+    def mutate(self: _ResultList, *args: Any, **kwargs: Any) -> Any:
+        out = method(self, *args, **kwargs)
+        self._changed()
+        return self if name in ("__iadd__", "__imul__") else out
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(_ResultList, _name, _mutator(_name))
+del _name
+
+
+def _object_array(items: Sequence[Any]) -> np.ndarray:
+    """1-D object array of ``items`` (tuples stay elements, not a 2-D array)."""
+    out = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        out[i] = item
+    return out
+
+
+@dataclass(repr=False)
 class ParameterStack:
     """A collection of :class:`FitResult` objects across groups and/or models.
 
     This is the universal "derived quantities" object returned by the fitting
     engine. It is intentionally model-agnostic: each :class:`FitResult` carries
     its own named parameters, so heterogeneous models can coexist in one stack.
+
+    Internally the stack is columnar: group keys are dictionary-encoded and the
+    parameter values/standard deviations live in 2-D arrays with presence
+    masks. :meth:`filter` and :meth:`to_dataframe` work on those arrays, the
+    frame is built once and cached, and :meth:`save` / :meth:`load` persist the
+    arrays to ``.npz`` or Parquet. :attr:`results` is a ``list``, materialised
+    lazily, so a loaded stack of 10^5 fits is usable without creating a single
+    :class:`FitResult`. Mutating it (``append``, ``extend``, item assignment,
+    ...) or assigning a new sequence drops the columnar arrays, which are
+    rebuilt on next use. The list is a copy of the sequence it was given.
     """
 
     results: list[FitResult] = field(default_factory=list)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "results":
+            value = _ResultList(value, self._invalidate)
+            self._invalidate()
+        object.__setattr__(self, name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached while ``results`` is unset: a stack loaded from columns.
+        if name == "results":
+            results = _ResultList(
+                self.__dict__["_columns"].to_results(), self._invalidate
+            )
+            object.__setattr__(self, "results", results)
+            return results
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickle/copy hand back a plain list; re-wrap it so mutations are seen.
+        self.__dict__.update(state)
+        if "results" in state:
+            object.__setattr__(
+                self, "results", _ResultList(state["results"], self._invalidate)
+            )
+
+    def _invalidate(self) -> None:
+        object.__setattr__(self, "_columns", None)
+        object.__setattr__(self, "_frame", None)
+
+    @classmethod
+    def _from_columns(
+        cls, columns: _StackColumns, results: Optional[Sequence[FitResult]] = None
+    ) -> "ParameterStack":
+        stack = cls.__new__(cls)
+        if results is not None:
+            object.__setattr__(
+                stack, "results", _ResultList(results, stack._invalidate)
+            )
+        object.__setattr__(stack, "_columns", columns)
+        object.__setattr__(stack, "_frame", None)
+        return stack
+
+    @property
+    def _store(self) -> _StackColumns:
+        cols = self.__dict__["_columns"]
+        if cols is None:
+            cols = _StackColumns.from_results(self.results)
+            object.__setattr__(self, "_columns", cols)
+            object.__setattr__(self, "_frame", None)
+        return cols
+
     def __len__(self) -> int:
-        return len(self.results)
+        if "results" in self.__dict__:
+            return len(self.results)
+        return len(self._columns)
 
     def __iter__(self):
         return iter(self.results)
 
+    def __repr__(self) -> str:
+        return f"ParameterStack(n_results={len(self)}, models={self.model_names()})"
+
     def model_names(self) -> list[str]:
         """Sorted unique model names present in the stack."""
-        return sorted({r.model_name for r in self.results})
+        cols = self._store
+        return sorted(
+            cols.model_levels[c] for c in np.unique(cols.model_codes).tolist()
+        )
 
     def filter(
         self,
@@ -124,39 +762,67 @@ class ParameterStack:
         source_doi: Optional[str] = None,
     ) -> "ParameterStack":
         """Return a new stack keeping only results matching the given filters."""
-        kept = [
-            r
-            for r in self.results
-            if (model_name is None or r.model_name == model_name)
-            and (source_doi is None or r.group_key.source_doi == source_doi)
-        ]
-        return ParameterStack(results=kept)
+        cols = self._store
+        keep = np.ones(len(cols), dtype=bool)
+        for value, levels, codes in (
+            (model_name, cols.model_levels, cols.model_codes),
+            (source_doi, cols.doi_levels, cols.doi_codes),
+        ):
+            if value is not None:
+                keep &= codes == (levels.index(value) if value in levels else -1)
+        rows = np.flatnonzero(keep)
+        results = None
+        if "results" in self.__dict__:
+            results = [self.results[i] for i in rows.tolist()]
+        return ParameterStack._from_columns(cols.take(rows), results)
 
     def to_dataframe(self) -> pd.DataFrame:
         """Flatten the stack to one row per :class:`FitResult`.
 
         Each parameter ``p`` contributes a ``p`` column (value) and a ``p_std``
         column (standard deviation). Group metadata, goodness of fit and
-        temperature range are included as well.
+        temperature range are included as well. The frame is built once from
+        the columnar arrays and cached; callers receive a copy.
         """
-        rows: list[dict[str, Any]] = []
-        for res in self.results:
-            row: dict[str, Any] = {
-                "model_name": res.model_name,
-                "source_doi": res.group_key.source_doi,
-                "fluid_compounds": res.group_key.fluid_compounds,
-                "mole_fractions": res.group_key.mole_fractions,
-                "n_points": res.n_points,
-                "R_squared": res.r_squared,
-                "T_min": res.t_min,
-                "T_max": res.t_max,
-            }
-            for name, param in res.parameters.items():
-                row[name] = param.value
-                row[f"{name}_std"] = param.std
-            row.update(res.meta)
-            rows.append(row)
-        return pd.DataFrame(rows)
+        cols = self._store
+        if self._frame is None:
+            self._frame = cols.to_frame()
+        return self._frame.copy()
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Persist the stack to ``.npz`` or ``.parquet`` (chosen by suffix).
+
+        ``.npz`` needs nothing beyond numpy; Parquet requires ``pyarrow``. Both
+        store the columnar arrays directly, so :meth:`load` is cheap even for
+        very large stacks.
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix == ".npz":
+            self._store.to_npz(path)
+        elif suffix in (".parquet", ".pq"):
+            _require_parquet()
+            self._store.to_parquet(path)
+        else:
+            raise ValueError(
+                f"Unsupported ParameterStack file suffix {path.suffix!r}; "
+                "use '.npz' or '.parquet'."
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ParameterStack":
+        """Load a stack written by :meth:`save`."""
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix == ".npz":
+            return cls._from_columns(_StackColumns.from_npz(path))
+        if suffix in (".parquet", ".pq"):
+            _require_parquet()
+            return cls._from_columns(_StackColumns.from_parquet(path))
+        raise ValueError(
+            f"Unsupported ParameterStack file suffix {path.suffix!r}; use '.npz' or '.parquet'."
+        )
 
     def to_fitted_models(
         self,
@@ -226,7 +892,9 @@ class ParameterStack:
             DistributionType,
             FitMethod,
             FittedModel,
-            FittedParameter as LibFittedParameter,
+        )
+        from ...core.lib import FittedParameter as LibFittedParameter
+        from ...core.lib import (
             Parameters,
             ParameterValue,
             Properties,
@@ -321,6 +989,16 @@ class ParameterStack:
         )
 
 
+def _require_parquet() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Saving/loading a ParameterStack as Parquet requires pyarrow. "
+            "Install with: pip install fairfluids[parquet] (or use a '.npz' path)."
+        ) from exc
+
+
 def _student_t_coverage_factor(
     coverage_probability: Optional[float],
     dof: Optional[float],
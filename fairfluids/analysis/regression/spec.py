@@ -8,8 +8,9 @@ symbolic model, pairs it with a low-level ``fit`` kernel and registers both via
 
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass, field
-from typing import Callable, Optional
+from typing import Any, Callable, Mapping, Optional, Protocol, Union
 
 import numpy as np
 
@@ -21,12 +22,13 @@ class RawFit:
     ``params`` maps each parameter name to ``(value, std)`` where ``std`` may be
     ``None`` when the kernel cannot estimate it. ``success`` is ``False`` when a
     (typically nonlinear) fit failed to converge; such groups are skipped by the
-    engine.
+    engine. ``nfev`` is the optimiser's function-evaluation count when known.
     """
 
     params: dict[str, tuple[float, Optional[float]]]
     r_squared: Optional[float] = None
     success: bool = True
+    nfev: Optional[int] = None
 
 
 # A fit kernel maps (T, y, sigma) -> RawFit. ``sigma`` carries per-point
@@ -34,6 +36,36 @@ class RawFit:
 FitKernel = Callable[[np.ndarray, np.ndarray, Optional[np.ndarray]], RawFit]
 
 
+class WarmStartFitKernel(Protocol):
+    """A :data:`FitKernel` that also accepts a ``p0=`` mapping of initial guesses.
+
+    The engine passes ``p0`` when warm-starting from a neighbouring group; plain
+    three-argument kernels are always fitted cold.
+    """
+
+    def __call__(
+        self,
+        temperatures: np.ndarray,
+        y: np.ndarray,
+        sigma: Optional[np.ndarray],
+        *,
+        p0: Optional[Mapping[str, float]] = None,
+    ) -> RawFit: ...
+
+
+def accepts_p0(kernel: Callable[..., RawFit]) -> bool:
+    """Whether ``kernel`` can be called with a ``p0=`` keyword (see :class:`WarmStartFitKernel`)."""
+    try:
+        params = inspect.signature(kernel).parameters.values()
+    except (TypeError, ValueError):  # builtins / C callables without a signature
+        return False
+    return any(
+        (p.name == "p0" and p.kind in (p.KEYWORD_ONLY, p.POSITIONAL_OR_KEYWORD))
+        or p.kind is p.VAR_KEYWORD
+        for p in params
+    )
+
+
 @dataclass(frozen=True)
 class RegressionModelSpec:
     """Declarative metadata describing one regression model.
@@ -57,6 +89,10 @@ class RegressionModelSpec:
     freedom ``n_points - n_fitted`` for GUM uncertainty reporting."""
     param_units: dict[str, Optional[str]] = field(default_factory=dict)
     description: str = ""
+    version: str = ""
+    """Opaque hash of the model definition (expression, initial guesses, bounds).
+    Part of every group's data fingerprint, so editing a model invalidates the
+    results :func:`~.engine.fit_model` would otherwise reuse incrementally."""
 
     def unit(self, param_name: str) -> Optional[str]:
         """Unit string for ``param_name`` (``None`` when dimensionless/unknown)."""
@@ -68,9 +104,22 @@ class _ModelRegistry:
 
     def __init__(self) -> None:
         self._specs: dict[str, RegressionModelSpec] = {}
-        self._kernels: dict[str, FitKernel] = {}
-
-    def register(self, spec: RegressionModelSpec, kernel: FitKernel) -> None:
+        self._kernels: dict[str, Union[FitKernel, WarmStartFitKernel]] = {}
+        self._warm: dict[str, bool] = {}
+        self._pending: list[Callable[[], Any]] = []
+
+    def defer(self, loader: Callable[[], Any]) -> None:
+        """Run ``loader`` (which registers models) on the first registry access."""
+        self._pending.append(loader)
+
+    def _load_pending(self) -> None:
+        while self._pending:
+            self._pending.pop(0)()
+
+    def register(
+        self, spec: RegressionModelSpec, kernel: Union[FitKernel, WarmStartFitKernel]
+    ) -> None:
+        self._load_pending()
         name = spec.name
         if not name:
             raise ValueError("RegressionModelSpec.name must be non-empty.")
@@ -80,8 +129,10 @@ class _ModelRegistry:
             )
         self._specs[name] = spec
         self._kernels[name] = kernel
+        self._warm[name] = accepts_p0(kernel)
 
     def get_spec(self, name: str) -> RegressionModelSpec:
+        self._load_pending()
         if name not in self._specs:
             raise KeyError(
                 f"No regression model registered under {name!r}. "
@@ -89,7 +140,8 @@ class _ModelRegistry:
             )
         return self._specs[name]
 
-    def get_kernel(self, name: str) -> FitKernel:
+    def get_kernel(self, name: str) -> Union[FitKernel, WarmStartFitKernel]:
+        self._load_pending()
         if name not in self._kernels:
             raise KeyError(
                 f"No regression model registered under {name!r}. "
@@ -97,19 +149,27 @@ class _ModelRegistry:
             )
         return self._kernels[name]
 
+    def supports_warm_start(self, name: str) -> bool:
+        """Whether the kernel of ``name`` accepts ``p0=`` (checked once at registration)."""
+        self.get_kernel(name)
+        return self._warm[name]
+
     def names(self) -> list[str]:
+        self._load_pending()
         return sorted(self._specs)
 
 
 ModelRegistry = _ModelRegistry()
 
 
-def register_model(spec: RegressionModelSpec, kernel: FitKernel) -> None:
+def register_model(
+    spec: RegressionModelSpec, kernel: Union[FitKernel, WarmStartFitKernel]
+) -> None:
     """Register a model spec together with its fit kernel."""
     ModelRegistry.register(spec, kernel)
 
 
-def get_model(name: str) -> tuple[RegressionModelSpec, FitKernel]:
+def get_model(name: str) -> tuple[RegressionModelSpec, Union[FitKernel, WarmStartFitKernel]]:
     """Return ``(spec, kernel)`` for a registered model name."""
     return ModelRegistry.get_spec(name), ModelRegistry.get_kernel(name)
 
@@ -127,6 +187,8 @@ def list_models() -> list[str]:
 __all__ = [
     "RawFit",
     "FitKernel",
+    "WarmStartFitKernel",
+    "accepts_p0",
     "RegressionModelSpec",
     "ModelRegistry",
     "register_model",
@@ -3,41 +3,105 @@ Core functionality for FAIRFluids package.
 
 This module contains the main data models and utilities for working with
 FAIR fluid data documents.
+
+Names are resolved lazily through a module-level ``__getattr__`` (see
+:mod:`fairfluids`), so importing :mod:`fairfluids.core.lib` no longer drags in
+the I/O stack, pandas or the plotting helpers.
 """
 
-from .fairfluids import (
-    FAIRFluidsDocument,
-    Version,
-    Citation,
-    Author,
-    Compound,
-    Fluid,
-    Property,
-    PropertyValue,
-    Parameter,
-    ParameterValue,
-    Measurement,
-    UnitDefinition,
-    BaseUnit,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Import enums and other utilities from lib since they don't need extension
-from .lib import (
-    Method,
-    Properties,
-    Parameters,
-    LitType,
-)
+# Public name -> module that defines it (imported on first attribute access).
+_LAZY_ATTRS = {
+    **dict.fromkeys(
+        (
+            "FAIRFluidsDocument",
+            "Version",
+            "Citation",
+            "Author",
+            "Compound",
+            "Fluid",
+            "Property",
+            "PropertyValue",
+            "Parameter",
+            "ParameterValue",
+            "Measurement",
+            "UnitDefinition",
+            "BaseUnit",
+        ),
+        ".fairfluids",
+    ),
+    # Enums and other utilities come from lib since they don't need extension.
+    **dict.fromkeys(("Method", "Properties", "Parameters", "LitType"), ".lib"),
+    "FluidIO": "fairfluids.io",
+    "FAIRFluidsCMLParser": "fairfluids.io",
+    **dict.fromkeys(
+        (
+            "calculate_ratio_of_solvent",
+            "cleanup_orphaned_parameters",
+            "combine_compounds",
+        ),
+        "fairfluids.operations",
+    ),
+    "filter_fluid_compounds_by_mole_fractions": ".functionalities",
+    "filter_fluid_measurements": ".visualization",
+    "save_plot_as_svg": ".plot_utils",
+    "reset_plot_counter": ".plot_utils",
+}
 
-from fairfluids.io import FluidIO, FAIRFluidsCMLParser
-from fairfluids.operations import (
-    calculate_ratio_of_solvent,
-    cleanup_orphaned_parameters,
-    combine_compounds,
+_SUBMODULES = (
+    "fairfluids",
+    "fluid_io",
+    "functionalities",
+    "lib",
+    "plot_utils",
+    "visualization",
 )
-from .functionalities import filter_fluid_compounds_by_mole_fractions
-from .visualization import filter_fluid_measurements
-from .plot_utils import save_plot_as_svg, reset_plot_counter
+
+if TYPE_CHECKING:
+    from fairfluids.io import FAIRFluidsCMLParser, FluidIO
+    from fairfluids.operations import (
+        calculate_ratio_of_solvent,
+        cleanup_orphaned_parameters,
+        combine_compounds,
+    )
+
+    from .fairfluids import (
+        Author,
+        BaseUnit,
+        Citation,
+        Compound,
+        FAIRFluidsDocument,
+        Fluid,
+        Measurement,
+        Parameter,
+        ParameterValue,
+        Property,
+        PropertyValue,
+        UnitDefinition,
+        Version,
+    )
+    from .functionalities import filter_fluid_compounds_by_mole_fractions
+    from .lib import LitType, Method, Parameters, Properties
+    from .plot_utils import reset_plot_counter, save_plot_as_svg
+    from .visualization import filter_fluid_measurements
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
+
 
 __all__ = [
     "FAIRFluidsDocument",
@@ -5,12 +5,19 @@ ThermoML often reports only n−1 explicit mole or mass fractions per mixture, o
 molalities relative to solvent. This module completes those values, converts
 mass fractions and molalities to mole fractions when molar masses are available,
 and validates that mole fractions sum to 1.
+
+The work is done on whole datasets: :func:`complete_dataset_composition_values`
+scans each measurement's parameter values once into ``(n_rows, n_compounds)``
+matrices, completes and converts them with NumPy and writes the changed cells
+back. The per-measurement functions are the one-row case of the same code.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from fairfluids.core.lib import Compound, Parameter, ParameterValue, Parameters
 
@@ -30,14 +37,6 @@ _MOLALITY_PARAM_TYPES = (
 )
 
 
-def _clamp_unit_fraction(value: float) -> float:
-    if value < 0.0:
-        return 0.0
-    if value > 1.0:
-        return 1.0
-    return value
-
-
 def _molality_params(parameters: List[Parameter]) -> List[Parameter]:
     return [p for p in parameters if p.parameters in _MOLALITY_PARAM_TYPES]
 
@@ -124,24 +123,6 @@ def _compound_to_param_id(
     return mapping
 
 
-def _extract_compound_values(
-    param_values: List[ParameterValue],
-    param_objects: List[Parameter],
-    param_type: Parameters,
-) -> tuple[Dict[str, float], Dict[str, ParameterValue]]:
-    compound_to_param = _compound_to_param_id(param_objects, param_type)
-    compound_to_value: Dict[str, float] = {}
-    param_id_to_pv: Dict[str, ParameterValue] = {}
-    for pv in param_values:
-        if pv.parameterID is None or pv.paramValue is None:
-            continue
-        param_id_to_pv[pv.parameterID] = pv
-        for compound_id, param_id in compound_to_param.items():
-            if param_id == pv.parameterID:
-                compound_to_value[compound_id] = float(pv.paramValue)
-    return compound_to_value, param_id_to_pv
-
-
 def _ensure_composition_parameters(
     parameters: List[Parameter],
     compound_refs: List[str],
@@ -240,115 +221,13 @@ def ensure_mass_fraction_parameters(
     )
 
 
-def _complete_composition_values(
-    param_values: List[ParameterValue],
-    param_objects: List[Parameter],
-    compound_refs: List[str],
-    param_type: Parameters,
-    *,
-    label: str,
-    sum_tol: float,
-) -> Dict[str, float]:
-    """Fill or normalize composition values so they sum to 1 when possible."""
-    compound_to_param = _compound_to_param_id(param_objects, param_type)
-    if not compound_refs:
-        return {}
-
-    compound_to_value, param_id_to_pv = _extract_compound_values(
-        param_values, param_objects, param_type
-    )
-
-    if len(compound_refs) == 1:
-        compound_id = compound_refs[0]
-        if compound_id not in compound_to_value:
-            param_id = compound_to_param.get(compound_id)
-            if param_id is not None:
-                param_values.append(
-                    ParameterValue(
-                        parameterID=param_id,
-                        parameters=param_type,
-                        paramValue=1.0,
-                        uncertainty=None,
-                    )
-                )
-                compound_to_value[compound_id] = 1.0
-        _validate_fraction_sum(compound_refs, compound_to_value, label, sum_tol)
-        return compound_to_value
-
-    missing = [cid for cid in compound_refs if cid not in compound_to_value]
-    known_values = [
-        compound_to_value[cid] for cid in compound_refs if cid in compound_to_value
-    ]
-
-    if len(missing) == 1 and len(known_values) == len(compound_refs) - 1:
-        complement = _clamp_unit_fraction(1.0 - sum(known_values))
-        missing_id = missing[0]
-        param_id = compound_to_param.get(missing_id)
-        if param_id is not None:
-            param_values.append(
-                ParameterValue(
-                    parameterID=param_id,
-                    parameters=param_type,
-                    paramValue=complement,
-                    uncertainty=None,
-                )
-            )
-            compound_to_value[missing_id] = complement
-        _validate_fraction_sum(compound_refs, compound_to_value, label, sum_tol)
-        return compound_to_value
-
-    if not missing:
-        total = sum(compound_to_value[cid] for cid in compound_refs)
-        if abs(total - 1.0) > sum_tol:
-            if total <= 0.0:
-                logger.warning(
-                    "%s values sum to %.6g; cannot normalize to 1",
-                    label,
-                    total,
-                )
-            else:
-                logger.warning(
-                    "%s values sum to %.6g; normalizing to 1",
-                    label,
-                    total,
-                )
-                for compound_id in compound_refs:
-                    normalized = compound_to_value[compound_id] / total
-                    param_id = compound_to_param[compound_id]
-                    if param_id in param_id_to_pv:
-                        param_id_to_pv[param_id].paramValue = normalized
-                    else:
-                        param_values.append(
-                            ParameterValue(
-                                parameterID=param_id,
-                                parameters=param_type,
-                                paramValue=normalized,
-                                uncertainty=None,
-                            )
-                        )
-                    compound_to_value[compound_id] = normalized
-        _validate_fraction_sum(compound_refs, compound_to_value, label, sum_tol)
-        return compound_to_value
-
-    logger.warning(
-        "Incomplete %s for %d of %d compounds; measurement kept",
-        label,
-        len(missing),
-        len(compound_refs),
-    )
-    return compound_to_value
-
-
 def complete_mole_fraction_values(
     param_values: List[ParameterValue],
     param_objects: List[Parameter],
     compound_refs: List[str],
 ) -> None:
     """Fill or normalize mole-fraction values so they sum to 1 when possible."""
-    _complete_composition_values(
-        param_values,
-        param_objects,
-        compound_refs,
+    _CompositionTable([param_values], param_objects, compound_refs).complete(
         Parameters.MOLE_FRACTION,
         label="mole fractions",
         sum_tol=MOLE_FRACTION_SUM_TOL,
@@ -361,14 +240,18 @@ def complete_mass_fraction_values(
     compound_refs: List[str],
 ) -> Dict[str, float]:
     """Fill or normalize mass-fraction values so they sum to 1 when possible."""
-    return _complete_composition_values(
-        param_values,
-        param_objects,
-        compound_refs,
+    values = _CompositionTable([param_values], param_objects, compound_refs).complete(
         Parameters.MASS_FRACTION,
         label="mass fractions",
         sum_tol=MASS_FRACTION_SUM_TOL,
     )
+    if not compound_refs:
+        return {}
+    return {
+        compound_id: float(value)
+        for compound_id, value in zip(compound_refs, values[0])
+        if not np.isnan(value)
+    }
 
 
 def mass_fractions_to_mole_fractions(
@@ -403,34 +286,6 @@ def mass_fractions_to_mole_fractions(
     }
 
 
-def _extract_molality_values(
-    param_values: List[ParameterValue],
-    param_objects: List[Parameter],
-    compound_refs: List[str],
-) -> Dict[str, float]:
-    solute_ids = _molality_solute_compounds(param_objects, compound_refs)
-    if not solute_ids:
-        return {}
-
-    param_id_to_compound: Dict[str, str] = {}
-    for param in _molality_params(param_objects):
-        if not param.parameterID:
-            continue
-        for compound_id in param.associated_compounds or []:
-            if compound_id in solute_ids:
-                param_id_to_compound[param.parameterID] = compound_id
-
-    values = {compound_id: 0.0 for compound_id in solute_ids}
-    for param_value in param_values:
-        if param_value.parameterID not in param_id_to_compound:
-            continue
-        if param_value.paramValue is None:
-            continue
-        compound_id = param_id_to_compound[param_value.parameterID]
-        values[compound_id] = float(param_value.paramValue)
-    return values
-
-
 def molalities_to_mole_fractions(
     molalities: Dict[str, float],
     molar_masses: Dict[str, float],
@@ -469,32 +324,6 @@ def molalities_to_mole_fractions(
     }
 
 
-def _apply_derived_mole_fractions(
-    param_values: List[ParameterValue],
-    param_objects: List[Parameter],
-    derived_mole_fractions: Dict[str, float],
-    mole_param_id_to_pv: Dict[str, ParameterValue],
-) -> None:
-    mole_param_by_compound = _compound_to_param_id(
-        param_objects, Parameters.MOLE_FRACTION
-    )
-    for compound_id, mole_fraction in derived_mole_fractions.items():
-        param_id = mole_param_by_compound.get(compound_id)
-        if param_id is None:
-            continue
-        if param_id in mole_param_id_to_pv:
-            mole_param_id_to_pv[param_id].paramValue = mole_fraction
-        else:
-            param_values.append(
-                ParameterValue(
-                    parameterID=param_id,
-                    parameters=Parameters.MOLE_FRACTION,
-                    paramValue=mole_fraction,
-                    uncertainty=None,
-                )
-            )
-
-
 def resolve_molar_masses(
     compounds: List[Compound],
     compound_refs: List[str],
@@ -527,122 +356,330 @@ def resolve_molar_masses(
     return resolved
 
 
-def derive_mole_fractions_from_mass_fractions(
-    param_values: List[ParameterValue],
-    param_objects: List[Parameter],
-    compound_refs: List[str],
-    molar_masses: Dict[str, float],
-) -> None:
-    """Derive mole fractions from completed mass fractions when mole data is missing."""
-    if not compound_refs:
-        return
-
-    mole_values, mole_param_id_to_pv = _extract_compound_values(
-        param_values, param_objects, Parameters.MOLE_FRACTION
-    )
-    if all(compound_id in mole_values for compound_id in compound_refs):
-        return
+class _CompositionTable:
+    """Composition values of many measurements as ``(n_rows, n_compounds)`` matrices.
+
+    Each measurement's ``param_values`` list is scanned once: mole and mass
+    fractions become ``NaN``-padded matrices over ``compound_refs`` and
+    molalities a zero-padded one. Completion and conversion run on the
+    matrices; :meth:`write` mirrors every changed cell back onto the rows,
+    updating the existing :class:`ParameterValue` or appending a new one in
+    compound order.
+    """
+
+    def __init__(
+        self,
+        rows: List[List[ParameterValue]],
+        param_objects: List[Parameter],
+        compound_refs: List[str],
+    ) -> None:
+        self.rows = rows
+        self.compound_refs = compound_refs
+        self.has_molality = bool(_molality_params(param_objects))
+        self.solute_ids = _molality_solute_compounds(param_objects, compound_refs)
+
+        self.param_ids: Dict[Parameters, List[Optional[str]]] = {}
+        for param_type in (Parameters.MOLE_FRACTION, Parameters.MASS_FRACTION):
+            by_compound = _compound_to_param_id(param_objects, param_type)
+            self.param_ids[param_type] = [by_compound.get(cid) for cid in compound_refs]
+
+        column = {cid: j for j, cid in enumerate(compound_refs)}
+        molality_column: Dict[str, int] = {}
+        for param in _molality_params(param_objects):
+            if not param.parameterID:
+                continue
+            for compound_id in param.associated_compounds or []:
+                if compound_id in self.solute_ids:
+                    molality_column[param.parameterID] = column[compound_id]
+
+        shape = (len(rows), len(compound_refs))
+        self.molalities = np.zeros(shape)
+        self.index: List[Dict[str, ParameterValue]] = []
+        for i, param_values in enumerate(rows):
+            by_param: Dict[str, ParameterValue] = {}
+            for pv in param_values:
+                if pv.parameterID is None or pv.paramValue is None:
+                    continue
+                by_param[pv.parameterID] = pv
+                j = molality_column.get(pv.parameterID)
+                if j is not None:
+                    self.molalities[i, j] = float(pv.paramValue)
+            self.index.append(by_param)
+
+        self.values: Dict[Parameters, np.ndarray] = {}
+        for param_type, param_ids in self.param_ids.items():
+            values = np.full(shape, np.nan)
+            for j, param_id in enumerate(param_ids):
+                if param_id is None:
+                    continue
+                for i, by_param in enumerate(self.index):
+                    pv = by_param.get(param_id)
+                    if pv is not None:
+                        values[i, j] = float(pv.paramValue)
+            self.values[param_type] = values
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.rows)
+
+    def writable(self, param_type: Parameters) -> np.ndarray:
+        """Columns whose compound has a ``param_type`` parameter to write to."""
+        return np.array([pid is not None for pid in self.param_ids[param_type]], dtype=bool)
+
+    def incomplete(self, param_type: Parameters) -> np.ndarray:
+        """Rows missing a ``param_type`` value for at least one compound."""
+        return np.isnan(self.values[param_type]).any(axis=1)
+
+    def write(self, param_type: Parameters, values: np.ndarray, mask: np.ndarray) -> None:
+        """Store ``values[mask]`` in the matrix and on the measurement rows."""
+        param_ids = self.param_ids[param_type]
+        rows_idx, cols_idx = np.nonzero(mask)
+        # Boolean indexing and ``nonzero`` both walk the mask in row-major order.
+        for i, j, value in zip(rows_idx.tolist(), cols_idx.tolist(), values[mask].tolist()):
+            param_id = param_ids[j]
+            pv = self.index[i].get(param_id)
+            if pv is not None:
+                pv.paramValue = value
+            else:
+                pv = ParameterValue(
+                    parameterID=param_id,
+                    parameters=param_type,
+                    paramValue=value,
+                    uncertainty=None,
+                )
+                self.rows[i].append(pv)
+                self.index[i][param_id] = pv
+        self.values[param_type][mask] = values[mask]
+
+    def complete(
+        self,
+        param_type: Parameters,
+        *,
+        label: str,
+        sum_tol: float,
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Fill or normalize ``param_type`` values so each row sums to 1 when possible.
+
+        Only ``rows`` (a boolean mask, default all) are touched. Returns the
+        completed matrix.
+        """
+        n_compounds = len(self.compound_refs)
+        if n_compounds == 0:
+            return self.values[param_type]
+        selected = np.ones(self.n_rows, dtype=bool) if rows is None else rows
+        values = self.values[param_type].copy()
+        known = ~np.isnan(values)
+        n_missing = n_compounds - known.sum(axis=1)
+
+        # Exactly one value missing: it is the complement of the others (1 for
+        # a pure compound).
+        complement = np.clip(1.0 - np.nansum(values, axis=1), 0.0, 1.0)
+        update = (selected & (n_missing == 1))[:, None] & ~known & self.writable(param_type)
+        values[update] = np.broadcast_to(complement[:, None], values.shape)[update]
+
+        if n_compounds > 1:
+            total = values.sum(axis=1)
+            off = selected & (n_missing == 0) & (np.abs(total - 1.0) > sum_tol)
+            if np.any(off & (total <= 0.0)):
+                logger.warning(
+                    "%s values sum to <= 0 in %d row(s); cannot normalize to 1",
+                    label,
+                    int(np.sum(off & (total <= 0.0))),
+                )
+            scale = off & (total > 0.0)
+            if np.any(scale):
+                logger.warning(
+                    "%s values do not sum to 1 in %d row(s) (e.g. %.6g); normalizing to 1",
+                    label,
+                    int(np.sum(scale)),
+                    float(total[scale][0]),
+                )
+                values[scale] = values[scale] / total[scale][:, None]
+                update[scale] = True
+
+        done = selected & (n_missing <= 1) & ~np.isnan(values).any(axis=1)
+        still_off = done & (np.abs(values.sum(axis=1) - 1.0) > sum_tol)
+        if np.any(still_off):
+            logger.warning(
+                "%s still do not sum to 1 after completion in %d row(s) (e.g. sum=%.6g)",
+                label,
+                int(np.sum(still_off)),
+                float(values[still_off].sum(axis=1)[0]),
+            )
+        incomplete = selected & (n_missing > 1)
+        if np.any(incomplete):
+            logger.warning(
+                "Incomplete %s for up to %d of %d compounds in %d row(s); measurements kept",
+                label,
+                int(n_missing[incomplete].max()),
+                n_compounds,
+                int(np.sum(incomplete)),
+            )
 
-    mass_values = complete_mass_fraction_values(
-        param_values, param_objects, compound_refs
-    )
-    if not all(compound_id in mass_values for compound_id in compound_refs):
-        logger.warning(
-            "Cannot derive mole fractions from mass fractions: mass fractions incomplete"
-        )
-        return
+        self.write(param_type, values, update)
+        return self.values[param_type]
+
+    def derive_from_molalities(
+        self, compounds: List[Compound], molar_masses: Dict[str, float]
+    ) -> None:
+        """Mole fractions from molalities (mol/kg solvent) for rows lacking them."""
+        if not self.compound_refs or not self.has_molality:
+            return
+        need = self.incomplete(Parameters.MOLE_FRACTION)
+        if not np.any(need):
+            return
+        if not self.solute_ids:
+            logger.warning(
+                "Cannot derive mole fractions from molalities: no molality values found"
+            )
+            return
 
-    missing_molar_mass = [
-        compound_id
-        for compound_id in compound_refs
-        if compound_id not in molar_masses
-    ]
-    if missing_molar_mass:
-        logger.warning(
-            "Cannot derive mole fractions from mass fractions: missing molar mass for %s",
-            missing_molar_mass,
-        )
-        return
+        solvent_ids = _solvent_compound_ids(self.compound_refs, self.solute_ids, compounds)
+        if not solvent_ids:
+            logger.warning(
+                "Cannot derive mole fractions from molalities: solvent could not be identified"
+            )
+            return
+        if not self._have_molar_masses(molar_masses, "molalities"):
+            return
 
-    try:
-        derived_mole_fractions = mass_fractions_to_mole_fractions(
-            mass_values, molar_masses, compound_refs
+        if len(self.compound_refs) == 1:
+            derived = np.ones((self.n_rows, 1))
+        else:
+            if len(solvent_ids) != 1:
+                logger.warning(
+                    "Cannot derive mole fractions from molalities: molality conversion "
+                    "requires exactly one solvent, got %d",
+                    len(solvent_ids),
+                )
+                return
+            moles = self.molalities.copy()
+            solvent = self.compound_refs.index(solvent_ids[0])
+            moles[:, solvent] = 1000.0 / molar_masses[solvent_ids[0]]
+            derived = self._normalize_moles(moles, need, "molalities")
+
+        mask = need[:, None] & self.writable(Parameters.MOLE_FRACTION)
+        self.write(Parameters.MOLE_FRACTION, derived, mask)
+
+    def derive_from_mass_fractions(self, molar_masses: Dict[str, float]) -> None:
+        """Mole fractions from completed mass fractions for rows lacking them."""
+        if not self.compound_refs:
+            return
+        need = self.incomplete(Parameters.MOLE_FRACTION)
+        if not np.any(need):
+            return
+
+        mass = self.complete(
+            Parameters.MASS_FRACTION,
+            label="mass fractions",
+            sum_tol=MASS_FRACTION_SUM_TOL,
+            rows=need,
         )
-    except ValueError as exc:
-        logger.warning("Cannot derive mole fractions from mass fractions: %s", exc)
-        return
+        mass_incomplete = need & np.isnan(mass).any(axis=1)
+        if np.any(mass_incomplete):
+            logger.warning(
+                "Cannot derive mole fractions from mass fractions in %d row(s): "
+                "mass fractions incomplete",
+                int(np.sum(mass_incomplete)),
+            )
+        need &= ~mass_incomplete
+        if not np.any(need) or not self._have_molar_masses(molar_masses, "mass fractions"):
+            return
 
-    _apply_derived_mole_fractions(
-        param_values,
-        param_objects,
-        derived_mole_fractions,
-        mole_param_id_to_pv,
-    )
+        if len(self.compound_refs) == 1:
+            derived = np.ones((self.n_rows, 1))
+        else:
+            masses = np.array([molar_masses[cid] for cid in self.compound_refs])
+            if np.any(masses <= 0.0):
+                logger.warning(
+                    "Cannot derive mole fractions from mass fractions: molar masses "
+                    "must be positive, got %s",
+                    dict(zip(self.compound_refs, masses.tolist())),
+                )
+                return
+            derived = self._normalize_moles(mass / masses, need, "mass fractions")
+
+        mask = need[:, None] & self.writable(Parameters.MOLE_FRACTION)
+        self.write(Parameters.MOLE_FRACTION, derived, mask)
+
+    def _have_molar_masses(self, molar_masses: Dict[str, float], source: str) -> bool:
+        missing = [cid for cid in self.compound_refs if cid not in molar_masses]
+        if missing:
+            logger.warning(
+                "Cannot derive mole fractions from %s: missing molar mass for %s",
+                source,
+                missing,
+            )
+        return not missing
+
+    @staticmethod
+    def _normalize_moles(moles: np.ndarray, need: np.ndarray, source: str) -> np.ndarray:
+        """Mole fractions from amounts; rows with no positive total drop out of ``need``."""
+        total = moles.sum(axis=1)
+        empty = need & (total <= 0.0)
+        if np.any(empty):
+            logger.warning(
+                "Cannot derive mole fractions from %s in %d row(s): total amount is zero",
+                source,
+                int(np.sum(empty)),
+            )
+            need &= ~empty
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return moles / total[:, None]
 
 
-def derive_mole_fractions_from_molalities(
-    param_values: List[ParameterValue],
+def complete_dataset_composition_values(
+    rows: List[List[ParameterValue]],
     param_objects: List[Parameter],
     compound_refs: List[str],
     compounds: List[Compound],
-    molar_masses: Dict[str, float],
+    *,
+    fetch_from_pubchem: bool = True,
 ) -> None:
-    """Derive mole fractions from molalities when mole data is missing."""
-    if not compound_refs or not _molality_params(param_objects):
+    """Complete the composition of every measurement row of one dataset at once.
+
+    ``rows`` holds each measurement's ``param_values`` list; they are updated in
+    place. Molar masses are resolved once, then mole fractions are derived from
+    molalities or mass fractions where missing and finally completed, exactly
+    as :func:`complete_composition_values` does for a single row.
+    """
+    if not rows:
         return
-
-    mole_values, mole_param_id_to_pv = _extract_compound_values(
-        param_values, param_objects, Parameters.MOLE_FRACTION
+    molar_masses = resolve_molar_masses(
+        compounds, compound_refs, fetch_from_pubchem=fetch_from_pubchem
     )
-    if all(compound_id in mole_values for compound_id in compound_refs):
-        return
-
-    molalities = _extract_molality_values(
-        param_values, param_objects, compound_refs
+    table = _CompositionTable(rows, param_objects, compound_refs)
+    table.derive_from_molalities(compounds, molar_masses)
+    table.derive_from_mass_fractions(molar_masses)
+    table.complete(
+        Parameters.MOLE_FRACTION,
+        label="mole fractions",
+        sum_tol=MOLE_FRACTION_SUM_TOL,
     )
-    if not molalities:
-        logger.warning(
-            "Cannot derive mole fractions from molalities: no molality values found"
-        )
-        return
 
-    solute_ids = set(molalities.keys())
-    solvent_ids = _solvent_compound_ids(compound_refs, solute_ids, compounds)
-    if not solvent_ids:
-        logger.warning(
-            "Cannot derive mole fractions from molalities: solvent could not be identified"
-        )
-        return
 
-    missing_molar_mass = [
-        compound_id
-        for compound_id in compound_refs
-        if compound_id not in molar_masses
-    ]
-    if missing_molar_mass:
-        logger.warning(
-            "Cannot derive mole fractions from molalities: missing molar mass for %s",
-            missing_molar_mass,
-        )
-        return
+def derive_mole_fractions_from_mass_fractions(
+    param_values: List[ParameterValue],
+    param_objects: List[Parameter],
+    compound_refs: List[str],
+    molar_masses: Dict[str, float],
+) -> None:
+    """Derive mole fractions from completed mass fractions when mole data is missing."""
+    table = _CompositionTable([param_values], param_objects, compound_refs)
+    table.derive_from_mass_fractions(molar_masses)
 
-    try:
-        derived_mole_fractions = molalities_to_mole_fractions(
-            molalities,
-            molar_masses,
-            compound_refs,
-            solvent_ids,
-        )
-    except ValueError as exc:
-        logger.warning("Cannot derive mole fractions from molalities: %s", exc)
-        return
 
-    _apply_derived_mole_fractions(
-        param_values,
-        param_objects,
-        derived_mole_fractions,
-        mole_param_id_to_pv,
-    )
+def derive_mole_fractions_from_molalities(
+    param_values: List[ParameterValue],
+    param_objects: List[Parameter],
+    compound_refs: List[str],
+    compounds: List[Compound],
+    molar_masses: Dict[str, float],
+) -> None:
+    """Derive mole fractions from molalities when mole data is missing."""
+    table = _CompositionTable([param_values], param_objects, compound_refs)
+    table.derive_from_molalities(compounds, molar_masses)
 
 
 def complete_composition_values(
@@ -654,40 +691,13 @@ def complete_composition_values(
     fetch_from_pubchem: bool = True,
 ) -> None:
     """Complete composition, derive mole fractions if needed, then complete mole fractions."""
-    molar_masses = resolve_molar_masses(
-        compounds, compound_refs, fetch_from_pubchem=fetch_from_pubchem
-    )
-    derive_mole_fractions_from_molalities(
-        param_values,
+    complete_dataset_composition_values(
+        [param_values],
         param_objects,
         compound_refs,
         compounds,
-        molar_masses,
-    )
-    derive_mole_fractions_from_mass_fractions(
-        param_values,
-        param_objects,
-        compound_refs,
-        molar_masses,
+        fetch_from_pubchem=fetch_from_pubchem,
     )
-    complete_mole_fraction_values(param_values, param_objects, compound_refs)
-
-
-def _validate_fraction_sum(
-    compound_refs: List[str],
-    compound_to_value: Dict[str, float],
-    label: str,
-    sum_tol: float,
-) -> None:
-    if any(cid not in compound_to_value for cid in compound_refs):
-        return
-    total = sum(compound_to_value[cid] for cid in compound_refs)
-    if abs(total - 1.0) > sum_tol:
-        logger.warning(
-            "%s still do not sum to 1 after completion (sum=%.6g)",
-            label,
-            total,
-        )
 
 
 def is_valid_mole_fraction_sum(
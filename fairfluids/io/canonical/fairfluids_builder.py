@@ -38,7 +38,7 @@ from .canonical_model import (
     CanonicalSourceCompound,
 )
 from .composition import (
-    complete_composition_values,
+    complete_dataset_composition_values,
     ensure_mass_fraction_parameters,
     ensure_mole_fraction_parameters,
 )
@@ -555,7 +555,7 @@ def _build_measurements(
         p.parameterID: p.parameters for p in param_objects if p.parameterID
     }
 
-    measurements: List[Measurement] = []
+    built: List[tuple[str, List[PropertyValue], List[ParameterValue]]] = []
     for row in cds.rows:
         m_id = registry.new_id("measurement")
 
@@ -588,18 +588,21 @@ def _build_measurements(
                     uncertainty=unc,
                 )
             )
+        built.append((m_id, prop_values, param_values))
 
-        if complete_composition:
-            complete_composition_values(
-                param_values=param_values,
-                param_objects=param_objects,
-                compound_refs=compound_refs,
-                compounds=compounds,
-                fetch_from_pubchem=fetch_from_pubchem,
-            )
+    # Composition is completed for the whole dataset in one pass.
+    if complete_composition:
+        complete_dataset_composition_values(
+            [param_values for _m_id, _props, param_values in built],
+            param_objects=param_objects,
+            compound_refs=compound_refs,
+            compounds=compounds,
+            fetch_from_pubchem=fetch_from_pubchem,
+        )
 
+    measurements: List[Measurement] = []
+    for row, (m_id, prop_values, param_values) in zip(cds.rows, built):
         row_method = row.method if row.method is not None else dataset_method
-
         measurements.append(
             Measurement(
                 measurement_id=m_id,
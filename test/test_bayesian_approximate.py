@@ -0,0 +1,139 @@
+"""Tests for the Laplace / SVI screening backends (``fit_groups`` / ``fit_mcmc``).
+
+Skipped automatically when the ``[bayesian]`` extra is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    Normal,
+    PosteriorDraws,
+    Uniform,
+    compare_models,
+    fit_groups,
+    get_model,
+    predict,
+)
+
+
+def _vft_group(label: str, n: int, shift: float) -> BayesianGroup:
+    T = np.linspace(290.0, 350.0, n)
+    raw = np.exp(-4.0 + (600.0 + 200.0 * shift) / (T - (150.0 + 20.0 * shift)))
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=np.log(raw),
+        observation_uncertainty=np.full(n, 0.01),
+        raw_observation=raw,
+        raw_observation_uncertainty=0.01 * raw,
+        dataframe=pd.DataFrame({"temperature": T, "viscosity_value": raw}),
+    )
+
+
+def _model(name: str):
+    model = get_model(name)
+    if name == "vft":
+        model.set_priors(
+            ln_eta0=Normal(mu=-4.0, sigma=2.0),
+            B=Normal(mu=700.0, sigma=300.0),
+            T0=Uniform(low=50.0, high=250.0),
+        )
+    else:
+        model.set_priors(logA=Normal(mu=-10.0, sigma=5.0), Ea=Normal(mu=20000.0, sigma=10000.0))
+    return model
+
+
+def _dataset(groups: list[BayesianGroup]) -> BayesianDataset:
+    return BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=groups,
+    )
+
+
+@pytest.mark.parametrize("backend", ["laplace", "svi"])
+def test_approximate_backend_matches_nuts_layout(backend: str):
+    ds = _dataset([_vft_group("a", 10, 0.0), _vft_group("b", 10, 1.0)])
+    models = [_model("vft"), _model("arrhenius")]
+    fit = fit_groups(
+        ds, models, backend=backend, num_samples=50, num_chains=2, svi_steps=500
+    )
+    nuts = fit_groups(ds, models[:1], num_warmup=60, num_samples=50, num_chains=2)
+
+    approx = fit.get("vft", ("a",))
+    exact = nuts.get("vft", ("a",))
+    assert isinstance(approx.mcmc, PosteriorDraws)
+    assert approx.num_divergences == 0
+    for name in ("posterior", "log_likelihood", "sample_stats", "observed_data"):
+        assert name in approx.inference_data
+    assert set(exact.inference_data.posterior.data_vars) <= set(
+        approx.inference_data.posterior.data_vars
+    )
+    assert approx.inference_data.posterior["mu"].shape == (2, 50, 10)
+    assert approx.inference_data.log_likelihood["obs"].shape == (2, 50, 10)
+
+    # Downstream consumers run unchanged on the approximate posteriors.
+    assert len(compare_models(fit).per_group_model) == 4
+    pred = predict(fit, "vft", {"temperature": np.array([300.0, 320.0])}, group_id=("a",))
+    assert np.all(np.isfinite(pred["mean"]))
+
+
+def test_approximate_backend_rejects_bucketing():
+    ds = _dataset([_vft_group("a", 6, 0.0)])
+    with pytest.raises(ValueError, match="cannot be combined"):
+        fit_groups(ds, [_model("vft")], backend="svi", bucketed=True)
+    with pytest.raises(ValueError, match="Unknown backend"):
+        fit_groups(ds, [_model("vft")], backend="advi")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("backend", ["laplace", "svi"])
+def test_fit_mcmc_approximate_backend_recovers_symbolic_parameters(backend: str):
+    import sympy as sp
+
+    from fairfluids.analysis.fit import fit_mcmc
+    from fairfluids.analysis.models import define_model
+
+    T, A, B = sp.symbols("T A B")
+    model = define_model(
+        "approx_arrhenius",
+        property="viscosity",
+        expr=sp.exp(A + B * (300 / T - 1)),
+        features=["T"],
+        register=False,
+    )
+    temps = np.linspace(280.0, 360.0, 30)
+    rng = np.random.default_rng(0)
+    eta = np.exp(-7.0 + 4.0 * (300.0 / temps - 1.0) + rng.normal(0.0, 0.02, temps.size))
+    priors = {"A": Normal(mu=-5.0, sigma=5.0), "B": Uniform(low=0.0, high=20.0)}
+    draws = fit_mcmc(
+        model,
+        {"T": temps},
+        eta,
+        priors=priors,
+        backend=backend,
+        num_samples=100,
+        num_chains=2,
+        svi_steps=5000,
+        svi_learning_rate=0.05,
+    )
+    assert isinstance(draws, PosteriorDraws)
+    samples = draws.get_samples(group_by_chain=True)
+    assert samples["mu"].shape == (2, 100, 30)
+    assert not draws.get_extra_fields()["diverging"].any()
+    assert float(np.median(samples["A"])) == pytest.approx(-7.0, abs=0.1)
+    assert float(np.median(samples["B"])) == pytest.approx(4.0, abs=0.2)
+    with pytest.raises(ValueError, match="Unknown backend"):
+        fit_mcmc(model, {"T": temps}, eta, priors=priors, backend="advi")  # type: ignore[arg-type]
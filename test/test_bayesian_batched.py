@@ -0,0 +1,195 @@
+"""Tests for the shape-bucketed and batched (vmapped) NUTS paths of ``fit_groups``.
+
+Skipped automatically when the ``[bayesian]`` extra is not installed. The
+sampler runs are tiny (one shape bucket, short chains) so the tests are
+dominated by a couple of compiles.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    Normal,
+    PosteriorDraws,
+    Uniform,
+    clear_sampler_cache,
+    fit_groups,
+    get_model,
+    sampler_cache_info,
+)
+from fairfluids.analysis.bayesian import batched  # noqa: E402
+from fairfluids.analysis.bayesian.data import bucket_size  # noqa: E402
+
+
+def _vft_group(label: str, n: int, shift: float, *, with_uncertainty: bool = True) -> BayesianGroup:
+    T = np.linspace(290.0, 350.0, n)
+    raw = np.exp(-4.0 + (600.0 + 200.0 * shift) / (T - (150.0 + 20.0 * shift)))
+    unc = 0.01 * raw if with_uncertainty else None
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=np.log(raw),
+        observation_uncertainty=None if unc is None else unc / raw,
+        raw_observation=raw,
+        raw_observation_uncertainty=unc,
+        dataframe=pd.DataFrame({"temperature": T, "viscosity_value": raw}),
+    )
+
+
+def _vft_model():
+    model = get_model("vft")
+    model.set_priors(
+        ln_eta0=Normal(mu=-4.0, sigma=2.0),
+        B=Normal(mu=700.0, sigma=300.0),
+        T0=Uniform(low=50.0, high=250.0),
+    )
+    return model
+
+
+# --- helpers ------------------------------------------------------------------
+
+
+def _dataset(groups: list[BayesianGroup]) -> BayesianDataset:
+    return BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=groups,
+    )
+
+
+def test_padded_groups_and_buckets_preserve_ranges():
+    assert [bucket_size(n) for n in (1, 2, 3, 5, 8, 9)] == [1, 2, 4, 8, 8, 16]
+
+    group = _vft_group("b", 7, 1.0, with_uncertainty=False)
+    padded = group.padded()
+    assert padded["observation"].shape == (8,)
+    assert padded["mask"].tolist() == [True] * 7 + [False]
+    assert np.all(padded["observation_uncertainty"] == 0.0)
+    with pytest.raises(ValueError, match="Cannot pad"):
+        group.padded(4)
+
+    groups = [_vft_group("a", 5, 0.0), group, _vft_group("c", 12, 0.5)]
+    assert _dataset(groups).buckets() == {8: [0, 1], 16: [2]}
+    data = batched.pad_groups(groups[:2], 8)
+    T = data["features"]["temperature"]
+    assert T.shape == (2, 8)
+    # Edge padding keeps min/max, so data-dependent prior bounds are unchanged.
+    assert T[0].min() == 290.0 and T[0].max() == 350.0
+    assert data["mask"].sum(axis=1).tolist() == [5, 7]
+
+
+def test_stack_bound_state_stacks_or_refuses():
+    assert batched.stack_bound_state([{}, {}]) == {}
+    stacked = batched.stack_bound_state(
+        [{"resolved_constants": {"T0": 300.0}}, {"resolved_constants": {"T0": 310.0}}]
+    )
+    assert stacked["resolved_constants"]["T0"].tolist() == [300.0, 310.0]
+    assert batched.stack_bound_state([{"a": 1.0}, {"b": 1.0}]) is None
+    assert batched.stack_bound_state([{"a": "x"}, {"a": "y"}]) is None
+
+
+def test_posterior_draws_mirrors_mcmc_accessors():
+    draws = PosteriorDraws(
+        samples={"B": np.arange(6.0).reshape(2, 3), "mu": np.zeros((2, 3, 4))},
+        extra_fields={"diverging": np.zeros((2, 3), dtype=bool)},
+    )
+    assert draws.num_chains == 2 and draws.num_samples == 3
+    assert draws.get_samples()["B"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert draws.get_samples()["mu"].shape == (6, 4)
+    assert draws.get_samples(group_by_chain=True)["mu"].shape == (2, 3, 4)
+    assert draws.get_extra_fields()["diverging"].shape == (6,)
+
+
+def test_trim_padding_trims_pointwise_sites_by_name():
+    # A vector parameter whose length happens to equal the padded size is kept.
+    samples = {"coef": np.zeros((2, 3, 8)), "mu": np.zeros((2, 3, 8)), "B": np.zeros((2, 3))}
+    draws, log_lik = batched.trim_padding(
+        samples, {"diverging": np.zeros((2, 3), dtype=bool)}, np.zeros((2, 3, 8)), 5, 8
+    )
+    assert draws.samples["coef"].shape == (2, 3, 8)
+    assert draws.samples["mu"].shape == (2, 3, 5)
+    assert draws.samples["B"].shape == (2, 3)
+    assert log_lik.shape == (2, 3, 5)
+    with pytest.raises(ValueError, match="padded size"):
+        batched.trim_padding({"mu": np.zeros((2, 3, 4))}, {}, np.zeros((2, 3, 8)), 5, 8)
+
+
+# --- bucketed fit -------------------------------------------------------------
+
+
+def test_bucketed_and_batched_fits_share_one_compiled_sampler():
+    groups = [_vft_group("a", 5, 0.0), _vft_group("b", 7, 1.0)]
+    model = _vft_model()
+    settings = dict(num_warmup=50, num_samples=40, num_chains=2)
+    clear_sampler_cache()
+
+    # Both groups share one shape bucket: one sampler, compiled once for both.
+    fit = fit_groups(_dataset(groups), [model], bucketed=True, **settings)
+    assert sampler_cache_info().misses == 1 and sampler_cache_info().currsize == 1
+    assert 0 < fit.compile_count < 15
+
+    for group in groups:
+        gfit = fit.get("vft", group.group_id)
+        assert isinstance(gfit.mcmc, PosteriorDraws)
+        idata = gfit.inference_data
+        assert idata.posterior["mu"].shape == (2, 40, group.n_points)
+        assert idata.log_likelihood["obs"].shape == (2, 40, group.n_points)
+        assert set(idata.sample_stats.data_vars) == {"diverging", "energy"}
+        np.testing.assert_allclose(idata.observed_data["obs"].values, group.observation)
+        assert set(gfit.rhat) == {"B", "T0", "ln_eta0", "model_sigma"}
+        samples = gfit.samples()
+        assert samples["T0"].shape == (80,)
+        assert np.all(samples["T0"] < 290.0)
+        assert np.all(np.isfinite(idata.log_likelihood["obs"].values))
+
+    # The vmapped run reuses the cached sampler and, with the same fold-in keys,
+    # reproduces the one-group-at-a-time draws.
+    vmapped = fit_groups(_dataset(groups), [model], batched=True, **settings)
+    assert sampler_cache_info().hits == 1
+    assert list(vmapped.fits) == list(fit.fits)
+    for key, gfit in fit.fits.items():
+        np.testing.assert_allclose(
+            vmapped.fits[key].samples()["B"], gfit.samples()["B"], rtol=1e-4
+        )
+
+
+def test_fits_record_sampler_timing_and_rank_throughput():
+    groups = [_vft_group("a", 5, 0.0), _vft_group("b", 7, 1.0)]
+    settings = dict(num_warmup=30, num_samples=30, num_chains=1)
+    serial = fit_groups(_dataset(groups), [_vft_model()], **settings)
+    bucketed = fit_groups(_dataset(groups), [_vft_model()], bucketed=True, **settings)
+
+    timing = serial.get("vft", ("a",)).timing
+    assert timing.warmup_seconds > 0 and timing.sampling_seconds > 0
+    assert timing.grad_evals >= 30 and timing.mean_tree_depth >= 1
+    # Warmup and sampling run as one program in a bucket; both paths count
+    # the gradients of the post-warmup draws only.
+    serial_steps = np.asarray(serial.get("vft", ("a",)).mcmc.get_extra_fields()["num_steps"])
+    assert serial_steps.size == 30 and timing.grad_evals == serial_steps.sum()
+    bucketed_fit = bucketed.get("vft", ("a",))
+    bucketed_steps = np.asarray(bucketed_fit.mcmc.extra_fields["num_steps"])
+    assert bucketed_fit.timing.warmup_seconds is None
+    assert bucketed_steps.shape == (1, 30)
+    assert bucketed_fit.timing.grad_evals == bucketed_steps.sum()
+
+    diag = serial.diagnostics()
+    assert {"compile_seconds", "grad_evals", "ess_bulk_per_second"} <= set(diag.columns)
+    assert (diag["ess_bulk_per_second"] > 0).all()
+
+    jobs = serial.throughput(slowest=1)
+    assert jobs["slow"].tolist() == [True, False]
+    assert jobs["ess_per_second"].is_monotonic_increasing
+    models = serial.throughput(by="model")
+    assert models["n_groups"].tolist() == [2]
@@ -0,0 +1,137 @@
+"""Tests for the content-addressed on-disk fit cache (``fit_groups(cache=...)``).
+
+Skipped automatically when the ``[bayesian]`` extra (or a NetCDF backend for
+ArviZ) is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    FitCache,
+    Normal,
+    PosteriorDraws,
+    Uniform,
+    fit_groups,
+    get_model,
+)
+from fairfluids.analysis.bayesian import cache as cache_mod  # noqa: E402
+from fairfluids.analysis.bayesian.cache import fit_key  # noqa: E402
+
+
+def _vft_group(label: str, n: int, shift: float) -> BayesianGroup:
+    T = np.linspace(290.0, 350.0, n)
+    raw = np.exp(-4.0 + (600.0 + 200.0 * shift) / (T - (150.0 + 20.0 * shift)))
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=np.log(raw),
+        observation_uncertainty=np.full(n, 0.01),
+        raw_observation=raw,
+        raw_observation_uncertainty=0.01 * raw,
+        dataframe=pd.DataFrame({"temperature": T, "viscosity_value": raw}),
+    )
+
+
+def _vft_model(B_mu: float = 700.0):
+    model = get_model("vft")
+    model.set_priors(
+        ln_eta0=Normal(mu=-4.0, sigma=2.0),
+        B=Normal(mu=B_mu, sigma=300.0),
+        T0=Uniform(low=50.0, high=250.0),
+    )
+    return model
+
+
+def _dataset(groups: list[BayesianGroup]) -> BayesianDataset:
+    return BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=groups,
+    )
+
+
+def test_fit_key_tracks_priors_data_settings_and_key():
+    import jax.random as random
+
+    group = _vft_group("a", 6, 0.0)
+    model = _vft_model()
+    key = random.PRNGKey(0)
+    base = fit_key(model, group, model.prior_set(), key, sampler="mcmc", num_samples=10)
+    assert base == fit_key(model, group, model.prior_set(), key, sampler="mcmc", num_samples=10)
+
+    other = _vft_model(B_mu=800.0)
+    assert base != fit_key(other, group, other.prior_set(), key, sampler="mcmc", num_samples=10)
+    shifted = _vft_group("a", 6, 0.1)
+    assert base != fit_key(model, shifted, model.prior_set(), key, sampler="mcmc", num_samples=10)
+    assert base != fit_key(model, group, model.prior_set(), key, sampler="mcmc", num_samples=11)
+    assert base != fit_key(model, group, model.prior_set(), key, sampler="bucketed", num_samples=10)
+    assert base != fit_key(
+        model, group, model.prior_set(), random.PRNGKey(1), sampler="mcmc", num_samples=10
+    )
+
+
+class _HandwrittenModel:
+    """Stands in for a non-symbolic ``BayesianModel`` subclass."""
+
+
+def test_model_definition_hashes_the_class_source(monkeypatch):
+    path = f"{__name__}._HandwrittenModel"
+    definition = cache_mod._model_definition(_HandwrittenModel())
+    assert definition.startswith(path + ":")
+    assert definition == cache_mod._model_definition(_HandwrittenModel())
+
+    # Editing the class body changes the definition.
+    monkeypatch.setattr(cache_mod.inspect, "getsource", lambda cls: "class Edited: ...")
+    assert cache_mod._model_definition(_HandwrittenModel()) not in (definition, path)
+
+    def no_source(cls):
+        raise OSError("source not available")
+
+    monkeypatch.setattr(cache_mod.inspect, "getsource", no_source)
+    assert cache_mod._model_definition(_HandwrittenModel()) == path
+
+
+def test_cached_groups_are_loaded_and_only_missing_ones_sampled(tmp_path):
+    pytest.importorskip("scipy", reason="ArviZ needs a NetCDF backend.")
+    groups = [_vft_group("a", 5, 0.0), _vft_group("b", 7, 1.0)]
+    model = _vft_model()
+    settings = dict(num_warmup=30, num_samples=20, num_chains=1, seed=5, bucketed=True)
+    cache = FitCache(tmp_path / "fits")
+
+    first = fit_groups(_dataset(groups[:1]), [model], cache=cache, **settings)
+    assert len(cache) == 1 and cache.misses == 1
+
+    # Same seed and fold-in position for group "a": it is loaded, "b" is sampled.
+    second = fit_groups(_dataset(groups), [model], cache=cache, **settings)
+    assert cache.hits == 1 and len(cache) == 2
+    assert list(second.fits) == [("vft", ("a",)), ("vft", ("b",))]
+
+    loaded = second.get("vft", ("a",))
+    fresh = first.get("vft", ("a",))
+    assert isinstance(loaded.mcmc, PosteriorDraws)
+    assert loaded.group_id == ("a",)
+    assert loaded.priors == fresh.priors
+    assert loaded.num_divergences == fresh.num_divergences
+    assert loaded.rhat == pytest.approx(fresh.rhat, nan_ok=True)
+    np.testing.assert_allclose(loaded.samples()["B"], fresh.samples()["B"])
+    np.testing.assert_allclose(
+        loaded.inference_data.log_likelihood["obs"].values,
+        fresh.inference_data.log_likelihood["obs"].values,
+    )
+
+    # A new seed misses every entry.
+    fit_groups(_dataset(groups), [model], cache=cache, **{**settings, "seed": 6})
+    assert len(cache) == 4
@@ -0,0 +1,99 @@
+"""Tests for checkpoint / resume of ``fit_groups`` runs.
+
+Skipped automatically when the ``[bayesian]`` extra (or a NetCDF backend for
+ArviZ) is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    Checkpoint,
+    Normal,
+    Uniform,
+    fit_groups,
+    get_model,
+)
+from fairfluids.analysis.bayesian import inference  # noqa: E402
+from fairfluids.analysis.bayesian.checkpoint import MANIFEST_COLUMNS  # noqa: E402
+
+
+def _vft_group(label: str, n: int, shift: float) -> BayesianGroup:
+    T = np.linspace(290.0, 350.0, n)
+    raw = np.exp(-4.0 + (600.0 + 200.0 * shift) / (T - (150.0 + 20.0 * shift)))
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=np.log(raw),
+        observation_uncertainty=np.full(n, 0.01),
+        raw_observation=raw,
+        raw_observation_uncertainty=0.01 * raw,
+    )
+
+
+def _vft_model():
+    model = get_model("vft")
+    model.set_priors(
+        ln_eta0=Normal(mu=-4.0, sigma=2.0),
+        B=Normal(mu=700.0, sigma=300.0),
+        T0=Uniform(low=50.0, high=250.0),
+    )
+    return model
+
+
+def test_interrupted_run_resumes_from_checkpoint(tmp_path, monkeypatch):
+    pytest.importorskip("netCDF4", reason="NetCDF backend not installed.")
+    ds = BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=[_vft_group("a", 8, 0.0), _vft_group("b", 8, 1.0)],
+    )
+    settings = dict(num_warmup=30, num_samples=30, num_chains=1, seed=3)
+    checkpoint = Checkpoint(tmp_path / "run")
+
+    real = inference._sample_group
+    calls: list[tuple] = []
+
+    def crash_on_second(run_model, group, *args, **kwargs):
+        calls.append(group.group_id)
+        if group.group_id == ("b",):
+            raise KeyboardInterrupt
+        return real(run_model, group, *args, **kwargs)
+
+    monkeypatch.setattr(inference, "_sample_group", crash_on_second)
+    with pytest.raises(KeyboardInterrupt):
+        fit_groups(ds, [_vft_model()], checkpoint=checkpoint, **settings)
+    manifest = checkpoint.manifest()
+    assert list(manifest.columns) == MANIFEST_COLUMNS
+    assert manifest["group_label"].tolist() == ["a"]
+    assert manifest["wall_seconds"].iloc[0] > 0
+
+    def counting(run_model, group, *args, **kwargs):
+        calls.append(group.group_id)
+        return real(run_model, group, *args, **kwargs)
+
+    calls.clear()
+    monkeypatch.setattr(inference, "_sample_group", counting)
+    fit = fit_groups(ds, [_vft_model()], checkpoint=checkpoint, **settings)
+    assert calls == [("b",)]
+    assert list(fit.fits) == [("vft", ("a",)), ("vft", ("b",))]
+    assert len(checkpoint.manifest()) == 2 and len(checkpoint) == 2
+
+    notes = tmp_path / "run" / "my_notes.txt"
+    notes.write_text("keep me")
+    calls.clear()
+    fit_groups(ds, [_vft_model()], checkpoint=checkpoint, resume=False, **settings)
+    assert calls == [("a",), ("b",)]
+    assert notes.read_text() == "keep me"
+    assert len(checkpoint.manifest()) == 2
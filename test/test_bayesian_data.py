@@ -0,0 +1,134 @@
+"""Tests for columnar dataset construction and ``.npz`` persistence.
+
+Skipped automatically when the ``[bayesian]`` extra is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import BayesianDataset  # noqa: E402
+
+
+def _extracted_rows(seed: int = 0) -> pd.DataFrame:
+    """Shuffled rows shaped like ``extract_property_dataframe`` output."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for doi, x_water, n in [("10.1/a", 0.2, 6), ("10.1/a", 0.8, 5), ("10.1/b", 0.5, 2)]:
+        T = np.linspace(290.0, 340.0, n)
+        value = np.exp(-3.0 + 900.0 / T) * (1.0 + x_water)
+        for t, v in zip(T, value):
+            rows.append(
+                {
+                    "source_doi": doi,
+                    "mole_fraction_water": x_water,
+                    "temperature": t,
+                    "viscosity_value": v,
+                    "viscosity_uncertainty": 0.02 * v if doi == "10.1/a" else np.nan,
+                    "fluid_compounds": ["water", "ethanol"],
+                }
+            )
+    # One row without a temperature is dropped before grouping.
+    rows.append({**rows[0], "temperature": np.nan})
+    df = pd.DataFrame(rows)
+    return df.iloc[rng.permutation(len(df))].reset_index(drop=True)
+
+
+def _build(df: pd.DataFrame, **kwargs) -> BayesianDataset:
+    return BayesianDataset.from_columns(
+        df,
+        property="viscosity",
+        features=("temperature",),
+        group_by=("source_doi", "mole_fraction_water"),
+        min_points=3,
+        **kwargs,
+    )
+
+
+def test_from_columns_matches_groupby_reference() -> None:
+    df = _extracted_rows()
+    ds = _build(df)
+
+    assert [g.group_id for g in ds.groups] == [("10.1/a", 0.2), ("10.1/a", 0.8)]
+    assert ds.dropped_groups == [
+        {"group_id": ("10.1/b", 0.5), "n_points": 2, "reason": "min_points"}
+    ]
+    ref = df.dropna(subset=["temperature"]).sort_values(
+        ["source_doi", "mole_fraction_water", "temperature"]
+    )
+    for grp in ds.groups:
+        sub = ref[
+            (ref["source_doi"] == grp.group_id[0])
+            & (ref["mole_fraction_water"] == grp.group_id[1])
+        ]
+        np.testing.assert_array_equal(grp.features["temperature"], sub["temperature"])
+        np.testing.assert_allclose(grp.observation, np.log(sub["viscosity_value"]))
+        np.testing.assert_allclose(grp.observation_uncertainty, 0.02)
+        assert grp.metadata["fluid_compounds"] == ["water", "ethanol"]
+        assert grp.metadata["group_by"] == {
+            "source_doi": grp.group_id[0],
+            "mole_fraction_water": grp.group_id[1],
+        }
+        assert grp.dataframe is None
+
+
+def test_from_columns_groups_are_views_of_shared_arrays() -> None:
+    ds = _build(_extracted_rows())
+    a, b = ds.groups
+    # Disjoint slices never overlap; they are views of one sorted base array.
+    assert a.observation.base is not None and a.observation.base is b.observation.base
+    temperature = a.features["temperature"], b.features["temperature"]
+    assert temperature[0].base is not None and temperature[0].base is temperature[1].base
+
+    mapping = {col: _extracted_rows()[col].to_numpy() for col in _extracted_rows().columns}
+    from_mapping = _build(mapping)
+    for g1, g2 in zip(ds.groups, from_mapping.groups):
+        assert g1.group_id == g2.group_id
+        np.testing.assert_array_equal(g1.observation, g2.observation)
+
+
+def test_from_columns_keeps_dataframes_on_request() -> None:
+    ds = _build(_extracted_rows(), keep_dataframes=True)
+    for grp in ds.groups:
+        assert len(grp.dataframe) == grp.n_points
+        np.testing.assert_array_equal(
+            grp.dataframe["temperature"].to_numpy(), grp.features["temperature"]
+        )
+
+
+def test_dataset_npz_round_trip(tmp_path) -> None:
+    df = _extracted_rows()
+    df.loc[df["mole_fraction_water"] == 0.8, "viscosity_uncertainty"] = np.nan
+    with pytest.warns(UserWarning, match="uncertainty missing"):
+        ds = _build(df)
+    path = ds.save(tmp_path / "viscosity.npz")
+    loaded = BayesianDataset.load(path)
+
+    assert loaded.property == ds.property
+    assert loaded.feature_names == ds.feature_names
+    assert loaded.group_by == ds.group_by
+    assert loaded.dropped_groups == ds.dropped_groups
+    assert len(loaded) == len(ds)
+    for g1, g2 in zip(ds.groups, loaded.groups):
+        assert g1.group_id == g2.group_id
+        assert repr(g1.group_id) == repr(g2.group_id)
+        assert g1.group_label == g2.group_label
+        np.testing.assert_equal(g1.metadata, g2.metadata)
+        np.testing.assert_array_equal(g1.features["temperature"], g2.features["temperature"])
+        np.testing.assert_array_equal(g1.observation, g2.observation)
+        np.testing.assert_array_equal(g1.raw_observation, g2.raw_observation)
+    assert ds.groups[1].observation_uncertainty is None
+    assert loaded.groups[1].observation_uncertainty is None
+    np.testing.assert_array_equal(
+        loaded.groups[0].observation_uncertainty, ds.groups[0].observation_uncertainty
+    )
+
+    with pytest.raises(ValueError, match="suffix"):
+        ds.save(tmp_path / "viscosity.json")
@@ -0,0 +1,99 @@
+"""Tests for the process-pool executor of ``fit_groups``.
+
+Skipped automatically when the ``[bayesian]`` extra is not installed. Workers
+are spawned processes, so the pool test pays a JAX import per worker; chains
+are kept tiny.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    Normal,
+    PosteriorDraws,
+    Uniform,
+    fit_groups,
+    get_model,
+)
+from fairfluids.analysis.bayesian.executor import model_payload, rebuild_model  # noqa: E402
+
+
+def _vft_group(label: str, n: int, shift: float) -> BayesianGroup:
+    T = np.linspace(290.0, 350.0, n)
+    raw = np.exp(-4.0 + (600.0 + 200.0 * shift) / (T - (150.0 + 20.0 * shift)))
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=np.log(raw),
+        observation_uncertainty=np.full(n, 0.01),
+        raw_observation=raw,
+        raw_observation_uncertainty=0.01 * raw,
+        dataframe=pd.DataFrame({"temperature": T, "viscosity_value": raw}),
+    )
+
+
+def _vft_model():
+    model = get_model("vft")
+    model.set_priors(
+        ln_eta0=Normal(mu=-4.0, sigma=2.0),
+        B=Normal(mu=700.0, sigma=300.0),
+        T0=Uniform(low=50.0, high=250.0),
+    )
+    return model
+
+
+def _dataset(groups: list[BayesianGroup]) -> BayesianDataset:
+    return BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=groups,
+    )
+
+
+def test_model_payload_round_trips_priors_and_symbolic_definition():
+    model = _vft_model()
+    payload = model_payload(model)
+    assert payload["name"] == "vft"
+    assert payload["symbolic"] is not None
+
+    rebuilt = rebuild_model(payload)
+    assert type(rebuilt) is type(model)
+    assert rebuilt.model_dump() == model.model_dump()
+
+
+def test_executor_option_is_validated():
+    dataset = _dataset([_vft_group("a", 5, 0.0)])
+    with pytest.raises(ValueError, match="Unknown executor"):
+        fit_groups(dataset, [_vft_model()], executor="threads")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="batched"):
+        fit_groups(dataset, [_vft_model()], executor="process", batched=True)
+
+
+def test_process_pool_matches_serial_draws_for_any_worker_count():
+    groups = [_vft_group("a", 5, 0.0), _vft_group("b", 7, 1.0), _vft_group("c", 6, 0.5)]
+    model = _vft_model()
+    settings = dict(num_warmup=30, num_samples=20, num_chains=1, seed=3, bucketed=True)
+
+    serial = fit_groups(_dataset(groups), [model], **settings)
+    for workers in (1, 2):
+        pooled = fit_groups(
+            _dataset(groups), [model], executor="process", max_workers=workers, **settings
+        )
+        assert list(pooled.fits) == list(serial.fits)
+        for key, gfit in serial.fits.items():
+            other = pooled.fits[key]
+            assert isinstance(other.mcmc, PosteriorDraws)
+            assert other.group is gfit.group or other.group.group_id == gfit.group_id
+            np.testing.assert_allclose(other.samples()["B"], gfit.samples()["B"], rtol=1e-6)
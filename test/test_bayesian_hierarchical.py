@@ -0,0 +1,111 @@
+"""Tests for hierarchical (composition-pooled) fits through ``fit_groups``.
+
+Skipped automatically when the ``[bayesian]`` extra is not installed. Chains are
+very short; the tests check structure, not posterior accuracy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    Hierarchical,
+    Normal,
+    PopulationFit,
+    Uniform,
+    fit_groups,
+    get_model,
+    predict,
+)
+from fairfluids.analysis.bayesian.bridge import R_GAS  # noqa: E402
+
+_SETTINGS = dict(num_warmup=100, num_samples=100, num_chains=1, seed=0)
+
+
+def _group(system: str, x_water: float, n: int, seed: int) -> BayesianGroup:
+    rng = np.random.default_rng(seed)
+    T = np.linspace(280.0, 360.0, n)
+    # logA and Ea drift smoothly with composition.
+    log_eta = (-20.0 + 2.0 * x_water) + (30000.0 - 5000.0 * x_water) / (R_GAS * T)
+    log_eta = log_eta + rng.normal(0.0, 0.02, n)
+    return BayesianGroup(
+        group_id=(system, x_water),
+        group_label=f"{system} x={x_water}",
+        metadata={"system_name": system, "mole_fraction_water": x_water},
+        features={"temperature": T},
+        observation=log_eta,
+        observation_uncertainty=np.full(n, 0.02),
+        raw_observation=np.exp(log_eta),
+    )
+
+
+def _dataset() -> BayesianDataset:
+    groups = [
+        _group(system, x, n, seed)
+        for seed, (system, x, n) in enumerate(
+            [("a", 0.1, 8), ("a", 0.4, 5), ("a", 0.7, 11), ("b", 0.2, 6), ("b", 0.6, 9)]
+        )
+    ]
+    return BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("system_name", "mole_fraction_water"),
+        groups=groups,
+    )
+
+
+def _arrhenius():
+    return get_model("arrhenius").set_priors(
+        logA=Uniform(low=-30.0, high=-10.0), Ea=Normal(mu=30000.0, sigma=10000.0)
+    )
+
+
+def test_hierarchical_fit_splits_joint_posterior_per_group() -> None:
+    ds = _dataset()
+    spec = Hierarchical(system_by=("system_name",), composition="mole_fraction_water")
+    fit = fit_groups(ds, [_arrhenius()], hierarchical=spec, **_SETTINGS)
+
+    assert list(fit.fits) == [("arrhenius", g.group_id) for g in ds.groups]
+    assert set(fit.populations) == {("arrhenius", ("a",)), ("arrhenius", ("b",))}
+    for grp in ds.groups:
+        gfit = fit.get("arrhenius", grp.group_id)
+        samples = gfit.samples()
+        assert samples["logA"].shape == (100,)
+        assert samples["mu"].shape == (100, grp.n_points)
+        assert gfit.inference_data["log_likelihood"]["obs"].shape[-1] == grp.n_points
+        assert "logA_z" not in samples
+        # logA has a Uniform prior: pooling on the unconstrained scale keeps
+        # every group inside its support.
+        assert np.all((samples["logA"] > -30.0) & (samples["logA"] < -10.0))
+
+    population = fit.populations[("arrhenius", ("a",))]
+    assert isinstance(population, PopulationFit)
+    assert population.group_ids == tuple(g.group_id for g in ds.groups[:3])
+    assert {"logA_loc", "logA_scale", "Ea_loc", "Ea_scale"} <= set(population.rhat)
+    assert population.location("logA").shape == (100,)
+    assert population.location("Ea", np.linspace(0.0, 1.0, 7)).shape == (100, 7)
+    trend = population.location("logA", np.linspace(-5.0, 5.0, 7))
+    assert np.all((trend > -30.0) & (trend < -10.0))
+
+    # The per-group posteriors plug into the ordinary predictive machinery.
+    grid = {"temperature": np.linspace(290.0, 350.0, 4)}
+    pred = predict(fit, "arrhenius", grid, group_id=ds.groups[0].group_id)
+    assert np.all(np.isfinite(pred["mean"]))
+
+
+def test_hierarchical_rejects_unsupported_combinations() -> None:
+    ds = _dataset()
+    with pytest.raises(ValueError, match="hierarchical"):
+        fit_groups(ds, [_arrhenius()], hierarchical=True, batched=True, **_SETTINGS)
+    with pytest.raises(KeyError, match="unknown parameter"):
+        fit_groups(ds, [_arrhenius()], hierarchical=Hierarchical(pooled=("nope",)), **_SETTINGS)
+    with pytest.raises(ValueError, match="degree"):
+        Hierarchical(degree=0)
@@ -0,0 +1,123 @@
+"""Tests for the batched, cached posterior predictive (``predictive_draws``).
+
+Skipped automatically when the ``[bayesian]`` extra is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    Normal,
+    Uniform,
+    clear_predictive_cache,
+    fit_groups,
+    get_model,
+    predict,
+    predictive_cache_info,
+    predictive_draws,
+)
+
+
+def _vft_group(label: str, n: int, shift: float) -> BayesianGroup:
+    T = np.linspace(290.0, 350.0, n)
+    raw = np.exp(-4.0 + (600.0 + 200.0 * shift) / (T - (150.0 + 20.0 * shift)))
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=np.log(raw),
+        observation_uncertainty=np.full(n, 0.01),
+        raw_observation=raw,
+        raw_observation_uncertainty=0.01 * raw,
+    )
+
+
+def _fit():
+    model = get_model("vft")
+    model.set_priors(
+        ln_eta0=Normal(mu=-4.0, sigma=2.0),
+        B=Normal(mu=700.0, sigma=300.0),
+        T0=Uniform(low=50.0, high=250.0),
+    )
+    ds = BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=[_vft_group("a", 7, 0.0), _vft_group("b", 11, 1.0), _vft_group("c", 9, 0.5)],
+    )
+    return fit_groups(ds, [model], num_warmup=40, num_samples=40, num_chains=1)
+
+
+def test_predictive_draws_batches_groups_and_matches_predict():
+    fit = _fit()
+    clear_predictive_cache()
+
+    observed = predictive_draws(fit, "vft", num_draws=25)
+    assert list(observed) == [("a",), ("b",), ("c",)]
+    assert observed[("b",)]["obs"].shape == (25, 11)
+    assert observed[("a",)]["mu"].shape == (25, 7)
+    assert predictive_cache_info().misses == 1
+
+    grid = {"temperature": np.linspace(300.0, 340.0, 5)}
+    shared = predictive_draws(fit, "vft", features=grid, sites=("obs",))
+    assert all(d["obs"].shape == (40, 5) for d in shared.values())
+
+    # ``predict`` goes through the same cache and reproduces the batched draws.
+    single = predict(fit, "vft", grid, group_id=("c",), return_samples=True)
+    np.testing.assert_allclose(single["samples"], shared[("c",)]["obs"], rtol=1e-6)
+    info = predictive_cache_info()
+    assert info.misses == 2 and info.hits >= 1
+
+
+class _OffsetVFT(type(get_model("vft"))):
+    """VFT with an extra latent ``offset`` on the mean (not in ``param_names``)."""
+
+    name = "_test_vft_offset"
+
+    def sample_parameters(self, priors, features):
+        import numpyro
+        import numpyro.distributions as dist
+
+        params = super().sample_parameters(priors, features)
+        params["offset"] = numpyro.sample("offset", dist.Normal(0.0, 100.0))
+        return params
+
+    def mean(self, features, params):
+        return super().mean(features, params) + params["offset"]
+
+
+def test_predictive_draws_uses_the_given_model_and_all_latent_sites(monkeypatch):
+    from fairfluids.analysis.bayesian import models
+
+    model = _OffsetVFT()
+    model.set_priors(
+        ln_eta0=Normal(mu=-4.0, sigma=2.0),
+        B=Normal(mu=700.0, sigma=300.0),
+        T0=Uniform(low=50.0, high=250.0),
+    )
+    ds = BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=[_vft_group("a", 9, 0.0)],
+    )
+    fit = fit_groups(ds, [model], num_warmup=60, num_samples=60, num_chains=1)
+
+    def unregistered(name, **kwargs):
+        raise KeyError(name)
+
+    monkeypatch.setattr(models, "get_model", unregistered)
+    draws = predictive_draws(fit, model.name, model=model, sites=("mu",))[("a",)]
+    # ``offset`` is conditioned on its posterior, not redrawn from its wide prior.
+    assert draws["mu"].std(axis=0).max() < 5.0
+    with pytest.raises(ValueError, match="does not match"):
+        predictive_draws(fit, "vft", model=model)
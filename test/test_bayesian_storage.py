@@ -0,0 +1,155 @@
+"""Tests for the ``GroupFit`` storage policies (``fit_groups(storage=...)``).
+
+Skipped automatically when the ``[bayesian]`` extra is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    Normal,
+    PosteriorDraws,
+    StoragePolicy,
+    Uniform,
+    compare_models,
+    fit_groups,
+    get_model,
+)
+from fairfluids.analysis.bayesian.storage import has_log_likelihood  # noqa: E402
+
+
+def _vft_group(label: str, n: int, shift: float) -> BayesianGroup:
+    T = np.linspace(290.0, 350.0, n)
+    raw = np.exp(-4.0 + (600.0 + 200.0 * shift) / (T - (150.0 + 20.0 * shift)))
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=np.log(raw),
+        observation_uncertainty=np.full(n, 0.01),
+        raw_observation=raw,
+        raw_observation_uncertainty=0.01 * raw,
+        dataframe=pd.DataFrame({"temperature": T, "viscosity_value": raw}),
+    )
+
+
+def _vft_model():
+    model = get_model("vft")
+    model.set_priors(
+        ln_eta0=Normal(mu=-4.0, sigma=2.0),
+        B=Normal(mu=700.0, sigma=300.0),
+        T0=Uniform(low=50.0, high=250.0),
+    )
+    return model
+
+
+def _dataset(groups: list[BayesianGroup]) -> BayesianDataset:
+    return BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=groups,
+    )
+
+
+def test_storage_policy_validation_and_presets():
+    assert StoragePolicy().is_full
+    lean = StoragePolicy.lean(thin=2)
+    assert not lean.is_full and lean.dtype == "float32" and lean.thin == 2
+    assert not lean.keep_mcmc and not lean.keep_log_likelihood
+    with pytest.raises(ValueError, match="thin"):
+        StoragePolicy(thin=0)
+    with pytest.raises(ValueError, match="dtype"):
+        StoragePolicy(dtype="float16")  # type: ignore[arg-type]
+
+
+def test_lean_storage_shrinks_fits_and_recomputes_log_likelihood():
+    groups = [_vft_group("a", 12, 0.0)]
+    settings = dict(num_warmup=40, num_samples=40, num_chains=2, seed=1)
+    full = fit_groups(_dataset(groups), [_vft_model()], **settings)
+    lean = fit_groups(
+        _dataset(groups), [_vft_model()], storage=StoragePolicy.lean(thin=2), **settings
+    )
+
+    fresh = full.get("vft", ("a",))
+    small = lean.get("vft", ("a",))
+    assert isinstance(small.mcmc, PosteriorDraws)
+    assert small.group.dataframe is None and fresh.group.dataframe is not None
+    assert small.samples()["B"].dtype == np.float32
+    assert small.samples()["B"].shape == (40,)
+    # Diagnostics come from the full chains, before thinning.
+    assert small.rhat == pytest.approx(fresh.rhat, nan_ok=True)
+
+    before = full.memory_usage()["total_bytes"].iloc[0]
+    after = lean.memory_usage()["total_bytes"].iloc[0]
+    assert after < before / 4
+
+    assert not has_log_likelihood(small.inference_data)
+    idata = small.ensure_log_likelihood()
+    assert has_log_likelihood(idata)
+    np.testing.assert_allclose(
+        idata.log_likelihood["obs"].values,
+        fresh.inference_data.log_likelihood["obs"].values[:, ::2],
+        rtol=1e-3,
+        atol=1e-3,
+    )
+    # LOO consumers rebuild the log-likelihood on their own.
+    assert len(compare_models(lean).per_group_model) == 1
+
+
+def test_loo_is_memoised_per_fit_and_reused_by_compare(monkeypatch):
+    import arviz as az
+
+    groups = [_vft_group("a", 8, 0.0), _vft_group("b", 8, 1.0)]
+    fit = fit_groups(
+        _dataset(groups), [_vft_model()], num_warmup=40, num_samples=40, num_chains=1
+    )
+    calls = []
+    real_loo = az.loo
+    monkeypatch.setattr(az, "loo", lambda *a, **k: calls.append(1) or real_loo(*a, **k))
+
+    first = fit.loo(max_workers=2)
+    assert len(calls) == 2
+    assert fit.loo() == first and len(calls) == 2
+    compare_models(fit)
+    assert len(calls) == 2
+
+    # A new InferenceData (e.g. a recomputed posterior) invalidates the entry.
+    gfit = fit.get("vft", ("a",))
+    gfit.inference_data = gfit.inference_data.copy()
+    gfit.loo()
+    assert len(calls) == 3
+
+
+def test_default_fit_keeps_its_log_likelihood_for_loo(monkeypatch):
+    from fairfluids.analysis.bayesian import storage
+
+    fit = fit_groups(
+        _dataset([_vft_group("a", 8, 0.0)]),
+        [_vft_model()],
+        num_warmup=40,
+        num_samples=40,
+        num_chains=1,
+    )
+    gfit = fit.get("vft", ("a",))
+    idata = gfit.inference_data
+    assert has_log_likelihood(idata)
+    assert {"posterior", "log_likelihood"} <= set(storage.idata_group_names(idata))
+
+    def _no_recompute(_gfit):
+        raise AssertionError("log-likelihood should not be recomputed")
+
+    monkeypatch.setattr(storage, "with_log_likelihood", _no_recompute)
+    assert gfit.ensure_log_likelihood() is idata
+    assert np.isfinite(fit.loo()[("vft", ("a",))].elpd)
+    assert len(compare_models(fit).per_group_model) == 1
@@ -0,0 +1,95 @@
+"""Tests for the PSIS shortcuts of :class:`BayesianWorkflow`.
+
+Skipped automatically when the ``[bayesian]`` extra is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+bayesian = pytest.importorskip(
+    "fairfluids.analysis.bayesian",
+    reason="Bayesian extras (numpyro / jax / arviz) not installed.",
+)
+
+from fairfluids.analysis.bayesian import (  # noqa: E402
+    BayesianDataset,
+    BayesianGroup,
+    BayesianWorkflow,
+    Uniform,
+    get_model,
+)
+from fairfluids.analysis.bayesian.bridge import R_GAS  # noqa: E402
+
+
+def _arrhenius_group(label: str, logA: float, Ea: float, seed: int) -> BayesianGroup:
+    rng = np.random.default_rng(seed)
+    T = np.linspace(280.0, 360.0, 10)
+    obs = logA + Ea / (R_GAS * T) + rng.normal(0.0, 0.05, T.size)
+    return BayesianGroup(
+        group_id=(label,),
+        group_label=label,
+        features={"temperature": T},
+        observation=obs,
+        raw_observation=np.exp(obs),
+        dataframe=pd.DataFrame({"temperature": T, "viscosity_value": np.exp(obs)}),
+    )
+
+
+def _workflow() -> BayesianWorkflow:
+    dataset = BayesianDataset(
+        property="viscosity",
+        feature_names=("temperature",),
+        group_by=("source_doi",),
+        groups=[
+            _arrhenius_group("10.x/a", -20.0, 30000.0, seed=1),
+            _arrhenius_group("10.x/b", -22.0, 35000.0, seed=2),
+        ],
+    )
+    model = get_model("arrhenius")
+    model.set_priors(logA=Uniform(low=-30.0, high=-10.0), Ea=Uniform(low=10000.0, high=60000.0))
+    return BayesianWorkflow(dataset=dataset, models=[model])
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_prior_sensitivity_psis_reweights_and_refits_widened_supports() -> None:
+    wf = _workflow()
+    wf.fit(num_warmup=80, num_samples=80, num_chains=1, progress_bar=False)
+    df = wf.prior_sensitivity(
+        scales=(0.75, 1.0, 1.5),
+        method="psis",
+        num_warmup=60,
+        num_samples=60,
+        num_chains=1,
+    )
+    assert {"scale", "parameter", "median", "pareto_k", "method"}.issubset(df.columns)
+    # Narrowed/unchanged Uniform priors are reweighted; widened ones need a refit.
+    assert set(df.loc[df["scale"] == 1.0, "method"]) == {"psis"}
+    assert (df.loc[df["scale"] == 1.0, "pareto_k"] == 0.0).all()
+    assert set(df.loc[df["scale"] == 1.5, "method"]) == {"refit"}
+    assert set(df.loc[df["scale"] == 0.75, "method"]) <= {"psis", "refit"}
+    assert len(df) == 3 * len(wf.dataset.groups) * 3  # scales x groups x (logA, Ea, model_sigma)
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_refit_without_influential_warm_starts() -> None:
+    wf = _workflow()
+    wf.fit(num_warmup=80, num_samples=80, num_chains=1, progress_bar=False)
+
+    # Threshold just below the largest Pareto-k so exactly one point is dropped.
+    kwargs = dict(num_warmup=60, num_samples=60, num_chains=1)
+    influential = wf.influential_points(k_threshold=-1.0)
+    threshold = float(influential["pareto_k"].max()) - 1e-9
+    refit, log = wf.refit_without_influential(k_threshold=threshold, **kwargs)
+    assert set(log["method"]) == {"warm_refit"}
+    for (_, gid), gfit in refit.fits.items():
+        original = wf.fit_result.get("arrhenius", gid)
+        assert gfit.group.n_points == original.group.n_points - 1
+        assert gfit.mcmc.num_warmup == 200
+
+    _, log = wf.refit_without_influential(
+        k_threshold=threshold, warm_start=False, progress_bar=True, **kwargs
+    )
+    assert set(log["method"]) == {"refit"}
@@ -0,0 +1,92 @@
+"""Import-time budget for the top-level package.
+
+``import fairfluids`` resolves its public names lazily; these tests keep it that
+way. They run ``python -X importtime`` in a fresh interpreter, so they measure a
+cold import of this source tree. The wall-clock budget is a ``benchmark`` test,
+deselected by default (``pytest -m benchmark`` runs it); the check that no heavy
+dependency is loaded always runs.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative microseconds allowed for ``import fairfluids`` (including the
+# stdlib modules it pulls in). The eager package took seconds.
+IMPORT_BUDGET_US = 150_000
+
+HEAVY_MODULES = ("numpy", "pandas", "requests", "pydantic", "matplotlib", "sympy")
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = [f.strip() for f in line[len("import time:"):].split("|")]
+        if fields[2] == module:
+            return int(fields[1])
+    raise AssertionError(f"{module!r} not found in -X importtime output")
+
+
+@pytest.mark.benchmark
+def test_import_fairfluids_within_budget() -> None:
+    proc = _run("import fairfluids")
+    elapsed = _cumulative_us(proc.stderr, "fairfluids")
+    assert elapsed <= IMPORT_BUDGET_US, (
+        f"import fairfluids took {elapsed / 1000:.1f} ms "
+        f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms)"
+    )
+
+
+def test_import_fairfluids_loads_no_heavy_dependency() -> None:
+    proc = _run(
+        "import sys, fairfluids, fairfluids.core; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert proc.stdout.strip() == ""
+
+
+def test_lazy_names_resolve_on_access() -> None:
+    pytest.importorskip("pydantic")
+    import fairfluids
+
+    assert set(fairfluids.__all__) <= set(dir(fairfluids))
+    assert fairfluids.Method is fairfluids.core.lib.Method
+    assert hasattr(fairfluids.FAIRFluidsDocument, "save_to_json")
+    with pytest.raises(AttributeError, match="no attribute"):
+        fairfluids.not_a_public_name
+
+
+def test_save_to_json_shim_on_every_import_path() -> None:
+    pytest.importorskip("pydantic")
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import fairfluids; from fairfluids.core.lib import FAIRFluidsDocument; "
+            "import fairfluids.core as core; "
+            "print(hasattr(FAIRFluidsDocument, 'save_to_json'), "
+            "hasattr(core.FAIRFluidsDocument, 'save_to_json'))",
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert proc.stdout.split() == ["True", "True"]
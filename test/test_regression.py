@@ -0,0 +1,330 @@
+"""Tests for the model-agnostic regression engine (``analysis.regression``).
+
+A counting linear kernel is registered directly with the engine's registry so
+the grouping and bookkeeping logic is exercised independently of the symbolic
+store and of any nonlinear optimiser.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import pickle
+import time
+import tracemalloc
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairfluids.analysis import regression as reg
+
+
+# --- fixtures -----------------------------------------------------------------
+
+
+_CALLS: list[int] = []
+
+
+def _counting_kernel(
+    temperatures: np.ndarray, y: np.ndarray, sigma: Optional[np.ndarray]
+) -> reg.RawFit:
+    """Ordinary least squares of ``y = A + B / T``; records every call."""
+    _CALLS.append(len(temperatures))
+    X = np.column_stack([np.ones_like(temperatures), 1.0 / temperatures])
+    coef, *_ = np.linalg.lstsq(X, y, rcond=None)
+    return reg.RawFit(params={"A": (float(coef[0]), None), "B": (float(coef[1]), None)})
+
+
+_SPEC = reg.RegressionModelSpec(
+    name="_test_linear_arrhenius",
+    kind="linear",
+    param_names=("A", "B"),
+    min_points=3,
+    n_fitted=2,
+    version="v1",
+)
+reg.register_model(_SPEC, _counting_kernel)
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    _CALLS.clear()
+    yield
+    _CALLS.clear()
+
+
+def _frame(*, n_groups: int = 3, n_points: int = 6, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for g in range(n_groups):
+        x = round(0.1 * (g + 1), 3)
+        for T in np.linspace(290.0, 350.0, n_points):
+            rows.append(
+                {
+                    "source_doi": "10.1/test",
+                    "mole_fractions": [x, 1.0 - x],
+                    "fluid_compounds": ["choline chloride", "water"],
+                    "temperature": T,
+                    "viscosity_value": float(np.exp(-5.0 + 900.0 * (1 + g) / T))
+                    * (1 + 0.01 * rng.standard_normal()),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+
+# --- grouping -----------------------------------------------------------------
+
+
+def test_grouping_factorizes_doi_and_composition():
+    df = _frame(n_groups=2)
+    # Same composition as an array, rounding noise, a different DOI, a ternary
+    # mixture and rows that must be dropped (invalid fractions, bad values).
+    extra = _frame(n_groups=1)
+    extra["mole_fractions"] = [np.array([0.1 + 1e-9, 0.9]) for _ in range(len(extra))]
+    other_doi = _frame(n_groups=1).assign(source_doi="10.1/other")
+    ternary = _frame(n_groups=1).assign(
+        mole_fractions=[[0.1, 0.8, 0.1]] * 6, fluid_compounds=[["a", "water", "b"]] * 6
+    )
+    junk = _frame(n_groups=1).assign(mole_fractions=["x"] * 6)
+    bad = _frame(n_groups=1).assign(viscosity_value=-1.0)
+    frame = pd.concat([df, extra, other_doi, ternary, junk, bad], ignore_index=True)
+
+    stack = reg.fit_model(_SPEC.name, frame, value_col="viscosity_value",
+                          include_water_mole_fraction=True)
+    keys = [(r.group_key.source_doi, r.group_key.mole_fractions, r.n_points) for r in stack]
+    assert keys == [
+        ("10.1/other", (0.1, 0.9), 6),
+        ("10.1/test", (0.1, 0.8, 0.1), 6),
+        ("10.1/test", (0.1, 0.9), 12),
+        ("10.1/test", (0.2, 0.8), 6),
+    ]
+    assert stack.results[2].group_key.fluid_compounds == ("choline chloride", "water")
+    assert stack.results[2].meta["mole_fraction_water"] == pytest.approx(0.9)
+
+    # Non-numeric entries inside a sequence take the per-row fallback path.
+    frame.at[0, "mole_fractions"] = ["a", "b"]
+    assert len(reg.fit_model(_SPEC.name, frame, value_col="viscosity_value")) == 4
+
+
+def _large_frame(n_dois: int, n_compositions: int, n_points: int) -> pd.DataFrame:
+    """``n_dois x n_compositions`` groups of ``n_points`` rows, built without a row loop."""
+    n_groups = n_dois * n_compositions
+    T = np.tile(np.linspace(290.0, 350.0, n_points), n_groups)
+    doi = np.repeat([f"10.1/doi{i}" for i in range(n_dois)], n_compositions * n_points)
+    fractions = [[0.005 * (c + 1), 1.0 - 0.005 * (c + 1)] for c in range(n_compositions)]
+    comp = np.tile(np.repeat(np.arange(n_compositions), n_points), n_dois)
+    mole_fractions = np.empty(n_groups * n_points, dtype=object)
+    mole_fractions[:] = [fractions[c] for c in comp]
+    compounds = np.empty(n_groups * n_points, dtype=object)
+    compounds[:] = [["choline chloride", "water"]] * len(compounds)
+    return pd.DataFrame(
+        {
+            "source_doi": doi,
+            "mole_fractions": mole_fractions,
+            "fluid_compounds": compounds,
+            "temperature": T,
+            "viscosity_value": np.exp(-5.0 + 900.0 / T),
+        }
+    )
+
+
+@pytest.mark.benchmark
+def test_grouping_a_million_rows_time_and_memory():
+    # 100 DOIs x 100 compositions x 100 points; the kernel is cheap, so this
+    # measures the grouping. Run with ``pytest -m benchmark -s``.
+    df = _large_frame(100, 100, 100)
+    tracemalloc.start()
+    started = time.perf_counter()
+    stack = reg.fit_model(
+        _SPEC.name, df, value_col="viscosity_value", include_water_mole_fraction=True
+    )
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{len(df):,} rows, {len(stack):,} groups: {seconds:.1f} s, peak {peak / 2**20:.0f} MiB")
+    assert len(stack) == 10_000
+    assert all(r.n_points == 100 for r in stack)
+    # Measured here: ~241 MiB; the frame-copy grouping this replaced: ~293 MiB.
+    assert peak < 270 * 2**20
+
+# --- incremental refit --------------------------------------------------------
+
+
+def test_fit_records_a_data_fingerprint_per_group():
+    stack = reg.fit_model(_SPEC.name, _frame(), value_col="viscosity_value")
+    assert len(stack) == 3
+    fingerprints = {r.meta["data_fingerprint"] for r in stack}
+    assert len(fingerprints) == 3
+    assert len(_CALLS) == 3
+
+
+def test_incremental_refit_only_fits_changed_groups():
+    df = _frame()
+    first = reg.fit_model(_SPEC.name, df, value_col="viscosity_value")
+    _CALLS.clear()
+
+    again = reg.fit_model(_SPEC.name, df, value_col="viscosity_value", previous=first)
+    assert _CALLS == []
+    assert [r for r in again] == [r for r in first]
+
+    # Perturb one value in the second group and add a brand-new fourth group.
+    changed = df.copy()
+    changed.loc[7, "viscosity_value"] *= 1.05
+    extra = _frame(n_groups=4).iloc[-6:]
+    changed = pd.concat([changed, extra], ignore_index=True)
+    updated = reg.fit_model(_SPEC.name, changed, value_col="viscosity_value", previous=first)
+    assert len(_CALLS) == 2
+    assert len(updated) == 4
+    assert updated.results[0] is first.results[0]
+    assert updated.results[2] is first.results[2]
+    assert updated.results[1] is not first.results[1]
+
+
+def test_model_version_change_invalidates_previous_results():
+    df = _frame()
+    first = reg.fit_model(_SPEC.name, df, value_col="viscosity_value")
+    _CALLS.clear()
+
+    bumped = dataclasses.replace(_SPEC, version="v2")
+    reg.spec.ModelRegistry._specs[_SPEC.name] = bumped
+    try:
+        reg.fit_model(_SPEC.name, df, value_col="viscosity_value", previous=first)
+    finally:
+        reg.spec.ModelRegistry._specs[_SPEC.name] = _SPEC
+    assert len(_CALLS) == 3
+
+
+# --- warm start ---------------------------------------------------------------
+
+
+def test_warm_start_seeds_from_nearest_composition_and_falls_back_cold():
+    seeds: list[Optional[dict]] = []
+
+    def kernel(temperatures, y, sigma, p0=None):
+        seeds.append(None if p0 is None else dict(p0))
+        if p0 is not None and len(seeds) == 3:
+            # Fail one warm-started fit; the engine must retry from a cold start.
+            return reg.RawFit(params={}, success=False, nfev=5)
+        fit = _counting_kernel(temperatures, y, sigma)
+        params = {k: (v, 0.01 * abs(v)) for k, (v, _s) in fit.params.items()}
+        return reg.RawFit(params=params, nfev=7)
+
+    spec = dataclasses.replace(_SPEC, name="_test_warm", kind="nonlinear")
+    reg.register_model(spec, kernel)
+    stack = reg.fit_model(spec.name, _frame(), value_col="viscosity_value", warm_start=True)
+
+    assert len(stack) == 3
+    assert seeds[0] is None
+    assert seeds[1] == {k: p.value for k, p in stack.results[0].parameters.items()}
+    # Third group: warm attempt fails, then a cold retry with no seed.
+    assert seeds[2] is not None and seeds[3] is None
+    flags = [r.meta["warm_start"] for r in stack]
+    assert flags == [False, True, False]
+    assert [r.meta["nfev"] for r in stack] == [7, 7, 12]
+
+
+def test_warm_start_fits_three_argument_kernels_cold():
+    def kernel(temperatures, y, sigma):
+        fit = _counting_kernel(temperatures, y, sigma)
+        return reg.RawFit(params={k: (v, 0.01 * abs(v)) for k, (v, _s) in fit.params.items()})
+
+    assert not reg.spec.accepts_p0(kernel)
+    assert reg.spec.accepts_p0(lambda T, y, sigma, *, p0=None: None)
+    spec = dataclasses.replace(_SPEC, name="_test_cold_only", kind="nonlinear")
+    reg.register_model(spec, kernel)
+    stack = reg.fit_model(spec.name, _frame(), value_col="viscosity_value", warm_start=True)
+    assert len(stack) == 3 and len(_CALLS) == 3
+    assert [r.meta["warm_start"] for r in stack] == [False, False, False]
+
+
+# --- columnar ParameterStack --------------------------------------------------
+
+
+def _mixed_stack() -> reg.ParameterStack:
+    stack = reg.fit_model(
+        _SPEC.name, _frame(), value_col="viscosity_value", include_water_mole_fraction=True
+    )
+    extra = reg.FitResult(
+        model_name="other",
+        group_key=reg.GroupKey(source_doi=None, mole_fractions=(1.0,)),
+        parameters={"C": reg.FittedParameter("C", 2.5, 0.1, "K")},
+        n_points=4,
+        measurement_ids=("m1", "m2"),
+        meta={"flag": True, "nfev": 12, "bounds": [0.0, 1.0]},
+    )
+    return reg.ParameterStack(results=[*stack, extra])
+
+
+def test_parameter_stack_filter_and_cached_frame():
+    stack = _mixed_stack()
+    assert stack.model_names() == ["_test_linear_arrhenius", "other"]
+
+    df = stack.to_dataframe()
+    assert list(df.columns[:8]) == [
+        "model_name", "source_doi", "fluid_compounds", "mole_fractions",
+        "n_points", "R_squared", "T_min", "T_max",
+    ]
+    assert df["mole_fractions"].iloc[0] == (0.1, 0.9)
+    assert np.isnan(df["C"].iloc[0]) and df["C"].iloc[-1] == 2.5
+    assert np.isnan(df["mole_fraction_water"].iloc[-1])
+    # The frame is cached, so mutating a returned copy leaves the stack intact.
+    df.loc[0, "A"] = 0.0
+    assert stack.to_dataframe()["A"].iloc[0] != 0.0
+
+    other = stack.filter(model_name="other")
+    assert len(other) == 1 and other.results[0] is stack.results[-1]
+    # A filtered frame only carries the columns of its own results.
+    expected = reg.ParameterStack(results=list(other.results)).to_dataframe()
+    pd.testing.assert_frame_equal(other.to_dataframe(), expected)
+    loaded = reg.ParameterStack._from_columns(stack._store).filter(model_name="other")
+    pd.testing.assert_frame_equal(loaded.to_dataframe(), expected)
+    assert len(stack.filter(source_doi="10.1/test")) == 3
+    assert len(stack.filter(model_name="missing")) == 0
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".parquet"])
+def test_parameter_stack_save_load_roundtrip(tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    stack = _mixed_stack()
+    path = stack.save(tmp_path / f"stack{suffix}")
+
+    loaded = reg.ParameterStack.load(path)
+    assert len(loaded) == len(stack)
+    pd.testing.assert_frame_equal(loaded.to_dataframe(), stack.to_dataframe())
+    assert loaded.filter(model_name="other").results == stack.filter(model_name="other").results
+    assert loaded == stack
+    assert loaded.results[-1].meta["bounds"] == [0.0, 1.0]
+
+    # A fitted NaN stays a present parameter instead of reading back as absent.
+    nan_fit = dataclasses.replace(
+        stack.results[-1], parameters={"C": reg.FittedParameter("C", float("nan"), float("nan"))}
+    )
+    reloaded = reg.ParameterStack.load(
+        reg.ParameterStack(results=[nan_fit]).save(tmp_path / f"nan{suffix}")
+    )
+    param = reloaded.results[0].parameters["C"]
+    assert np.isnan(param.value) and np.isnan(param.std)
+
+
+def test_parameter_stack_results_mutations_invalidate_the_columns():
+    stack = _mixed_stack()
+    extra = stack.results[-1]
+    assert stack.model_names() == ["_test_linear_arrhenius", "other"]
+    stack.results.pop()
+    assert stack.model_names() == ["_test_linear_arrhenius"]
+    stack.results.append(extra)
+    assert stack.to_dataframe()["model_name"].iloc[-1] == "other"
+    stack.results[-1] = dataclasses.replace(extra, model_name="renamed")
+    assert stack.model_names() == ["_test_linear_arrhenius", "renamed"]
+    copied = pickle.loads(pickle.dumps(stack))
+    del copied.results[-1]
+    assert copied.model_names() == ["_test_linear_arrhenius"]
+
+    reordered = dataclasses.replace(stack, results=stack.results[::-1])
+    assert reordered.filter(model_name="renamed").results == [stack.results[-1]]
+    stack.results = stack.results[:1]
+    assert stack.model_names() == ["_test_linear_arrhenius"]
+    assert dataclasses.asdict(stack)["results"][0]["model_name"] == "_test_linear_arrhenius"
@@ -84,6 +84,35 @@ def test_compile_numpy_matches_manual():
     np.testing.assert_allclose(got, expected)
 
 
+def test_compile_cache_keys_on_fingerprint_and_evicts():
+    fx.clear_cache()
+    m = _vft_model()
+    first = fx.compile_numpy(m)
+    # A separately defined but mathematically identical model reuses the kernel.
+    twin = fx.define_model(
+        "vft_twin", property="viscosity", expr="exp(A + B/(T - T0))",
+        features=["T"], register=False,
+    )
+    assert twin.fingerprint == m.fingerprint
+    assert fx.compile_numpy(twin) is first
+    info = fx.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    fx.set_cache_size(1)
+    try:
+        T, a = sp.symbols("T a")
+        other = fx.define_model(
+            "lin", property="x", expr=a * T, features=["T"],
+            log_observation=False, register=False,
+        )
+        fx.compile_numpy(other)
+        assert fx.cache_info().currsize == 1
+        assert fx.compile_numpy(m) is not first  # evicted, recompiled
+    finally:
+        fx.set_cache_size(256)
+        fx.clear_cache()
+
+
 # --- registry / authoring -----------------------------------------------------
 
 
@@ -128,6 +157,56 @@ def test_parse_expression_rejects_unknown_function():
         fx.parse_expression("foo(A + B)")
 
 
+# --- built-in store -----------------------------------------------------------
+
+
+def test_builtin_store_loads_lazily_and_from_precompiled_artifact(tmp_path, monkeypatch):
+    from fairfluids.analysis.models import builtin
+    from fairfluids.analysis.models import compile as _compile_mod
+
+    fx.registry.defer(fx.load_builtin_models)
+    assert fx.registry._pending  # nothing parsed yet
+    reference = fx.get_model("arrhenius")
+    assert not fx.registry._pending
+
+    path = builtin.build_precompiled_store(tmp_path / "store.pickle")
+    fx.registry.clear()
+    fx.clear_cache()
+    names = fx.load_builtin_models(precompiled=path)
+    assert sorted(names) == fx.list_models()
+
+    loaded = fx.get_model("arrhenius")
+    assert "_fingerprint_cache" in loaded.__dict__
+    assert loaded.fingerprint == reference.fingerprint
+    expected = _compile_mod._lambdify(reference, "numpy")
+
+    # The kernel comes from the stored source, not from a fresh ``lambdify``.
+    def _no_lambdify(model, backend):
+        raise AssertionError("lambdify should not run")
+
+    monkeypatch.setattr(_compile_mod, "_lambdify", _no_lambdify)
+    fn = fx.compile_numpy(loaded)
+    T = np.linspace(280.0, 360.0, 5)
+    args = ({"T": T}, {"R": 8.314462618}, {"logA": -10.0, "Ea": 15000.0})
+    np.testing.assert_array_equal(
+        _compile_mod.evaluate(loaded, fn, *args),
+        _compile_mod.evaluate(reference, expected, *args),
+    )
+    fx.clear_cache()
+
+    # A store edit (different JSON hash) invalidates the artifact.
+    monkeypatch.setattr(builtin, "_store_hashes", lambda: {"viscosity.json": "0" * 64})
+    assert builtin._load_precompiled(path) is None
+    monkeypatch.undo()
+
+    # A stale key is rejected from the header, before anything is unpickled.
+    unpickled = []
+    monkeypatch.setattr(builtin, "_source_hashes", lambda: {"model.py": "0" * 64})
+    monkeypatch.setattr(builtin.pickle, "load", lambda fh: unpickled.append(fh))
+    assert builtin._load_precompiled(path) is None
+    assert not unpickled
+
+
 # --- constants (the density-anchored case) ------------------------------------
 
 
@@ -190,6 +269,87 @@ def test_least_squares_with_fixed_constant():
     assert fit.values()["A1"] == pytest.approx(A1_true, rel=1e-4)
 
 
+def test_lsq_hints_compile_once_per_model_without_eval():
+    T, A, B, T0 = sp.symbols("T A B T0")
+    lsq = {
+        "p0": {"A": "min(y)", "T0": "min(T) - 50.0"},
+        "bounds": {"B": {"lower": 0.0}, "T0": {"upper": "min(T) - 1e-6"}},
+    }
+    m = fx.define_model(
+        "vft_hinted", property="viscosity",
+        expr=sp.exp(A + B / (T - T0)), features=["T"],
+        p0={"B": 700.0}, metadata={"lsq": lsq}, overwrite=True,
+    )
+    Tarr = np.linspace(280.0, 360.0, 40)
+    eta = np.exp(-5.0 + 700.0 / (Tarr - 150.0))
+    fit = fx.fit_least_squares(m, {"T": Tarr}, eta)
+    assert fit.success
+    assert fit.values()["T0"] == pytest.approx(150.0, abs=1e-2)
+
+    hint = m.compiled_hint("min(T) - 50.0")
+    assert hint is m.compiled_hint("min(T) - 50.0")
+    assert hint.names == {"T"}
+    assert hint(Tarr) == pytest.approx(230.0)
+    assert m.compiled_hint("-inf")(Tarr) == -np.inf
+    mixed = fx.compile_hint("2 * mean(y) + max(T) ** 0.5")
+    assert mixed(Tarr, np.array([1.0, 3.0])) == pytest.approx(4.0 + 360.0 ** 0.5)
+
+    for bad in ("__import__('os').getcwd()", "T.shape", "abs(T)", "min(T, y)"):
+        with pytest.raises(ValueError, match="Unsupported hint expression"):
+            fx.compile_hint(bad)
+    with pytest.raises(ValueError, match="needs 'y'"):
+        fx.compile_hint("min(y)")(Tarr)
+
+
+# --- derived curves -----------------------------------------------------------
+
+
+def test_derived_curves_broadcast_fits_over_grid_with_delta_method_band():
+    m = fx.define_model(
+        "rho_alpha", property="density",
+        expr="rho0*exp(-(A1*(T - T0) + A2*(T**2 - T0**2)/2))", features=["T"],
+        constants={"T0": 298.15}, p0={"A1": 7e-4, "A2": 1e-6, "rho0": 1000.0},
+        derived={"alpha_p": "A2*T + A1", "A1_scaled": "A1*1000"}, overwrite=True,
+    )
+    assert fx.curve_derived_names(m) == ("alpha_p",)
+    assert fx.scalar_derived_names(m) == ("A1_scaled",)
+
+    rng = np.random.default_rng(0)
+    T = np.linspace(283.0, 343.0, 25)
+    fits = []
+    for A1, A2 in [(6e-4, 1.5e-6), (7e-4, 1.0e-6), (8e-4, 0.5e-6)]:
+        rho = 1000.0 * np.exp(-(A1 * (T - 298.15) + A2 * (T**2 - 298.15**2) / 2))
+        fits.append(fx.fit_least_squares(m, {"T": T}, rho * (1 + rng.normal(0, 1e-5, T.size))))
+    fits.append(fx.SymbolicFit("rho_alpha", {}, {}, None, False))
+
+    grid = np.linspace(290.0, 330.0, 7)
+    curves = fx.evaluate_derived_curves(m, fits, {"T": grid})
+    alpha = curves["alpha_p"]
+    assert alpha.value.shape == alpha.std.shape == (4, 7)
+    assert np.all(np.isnan(alpha.value[3]))
+
+    idx = [m.param_names.index(p) for p in ("A1", "A2")]
+    for fit, value, std in zip(fits[:3], alpha.value, alpha.std):
+        vals = fit.values()
+        np.testing.assert_allclose(value, vals["A2"] * grid + vals["A1"], rtol=1e-12)
+        cov = fit.covariance[np.ix_(idx, idx)]
+        expected = np.sqrt(cov[0, 0] + grid**2 * cov[1, 1] + 2 * grid * cov[0, 1])
+        np.testing.assert_allclose(std, expected, rtol=1e-8)
+    lo, hi = alpha.band(2.0)
+    np.testing.assert_allclose(hi - lo, 4.0 * alpha.std)
+
+    # Raw parameter arrays work too; no covariance gives a NaN band.
+    raw = fx.evaluate_derived_curves(
+        m, {"A1": [7e-4, 8e-4], "A2": 1e-6, "rho0": 1000.0}, {"T": grid},
+        constants={"T0": 298.15}, names=["alpha_p", "A1_scaled"],
+    )
+    np.testing.assert_allclose(raw["alpha_p"].value[1], 1e-6 * grid + 8e-4)
+    np.testing.assert_allclose(raw["A1_scaled"].value, [[0.7] * 7, [0.8] * 7])
+    assert np.all(np.isnan(raw["alpha_p"].std))
+    with pytest.raises(KeyError, match="Grid is missing"):
+        fx.evaluate_derived_curves(m, fits, {"P": grid})
+
+
 # --- convenience adapters (fit_group / fit_dataset) ---------------------------
 
 
@@ -0,0 +1,101 @@
+"""Fused kernels (``compile_fused``) against the ``lambdify`` kernels.
+
+Every built-in model is evaluated on a million points with both backends: the
+fused numpy kernel must reproduce ``compile_numpy`` bit for bit. The
+``benchmark``-marked test times both backends per model (``pytest -m benchmark -s``).
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from fairfluids.analysis import models as fm
+from fairfluids.analysis.models import compile as _compile_mod
+from fairfluids.analysis.models.builtin import STORE_DIR
+from fairfluids.analysis.models.fused import fused_source
+
+BUILTIN = [m for path in sorted(STORE_DIR.glob("*.json")) for m in fm.load_models(path)]
+N_POINTS = 1_000_000
+
+# Representative values for the data-resolved constants of the density models.
+_CONSTANTS = {"T0": 298.15, "rho0": 1000.0}
+
+
+def _args(model, T: np.ndarray) -> tuple:
+    consts = {}
+    for name in model.constant_names:
+        resolver = model.constants[name]
+        consts[name] = (
+            resolver.resolve({}, None) if isinstance(resolver, fm.FixedConstant) else _CONSTANTS[name]
+        )
+    params = {p: float(model.p0.get(p, 1.0)) for p in model.param_names}
+    features = {name: T for name in model.features}
+    return tuple(
+        [features[n] for n in model.features]
+        + [consts[n] for n in model.constant_names]
+        + [params[n] for n in model.param_names]
+    )
+
+
+@pytest.mark.parametrize("model", BUILTIN, ids=lambda m: m.name)
+def test_fused_kernel_is_bit_identical_to_lambdify(model) -> None:
+    naive = fm.compile_numpy(model)
+    fused = fm.compile_fused(model, jit=None)
+    assert fused_source(model) is not None
+
+    T = np.linspace(260.0, 380.0, 2001)
+    args = _args(model, T)
+    np.testing.assert_array_equal(fused(*args), naive(*args))
+
+    # Inputs the in-place path cannot take fall back to the printed expression.
+    for other in (T.astype(np.float32), 300.0):
+        fallback = _args(model, other)
+        np.testing.assert_array_equal(fused(*fallback), naive(*fallback))
+
+
+def test_compile_fused_rejects_unknown_jit() -> None:
+    with pytest.raises(ValueError, match="Unknown jit"):
+        fm.compile_fused(BUILTIN[0], jit="cuda")
+
+
+def test_numba_kernel_matches_to_rounding() -> None:
+    pytest.importorskip("numba")
+    model = next(m for m in BUILTIN if m.name == "extended_arrhenius")
+    args = _args(model, np.linspace(260.0, 380.0, 1001))
+    np.testing.assert_allclose(
+        fm.compile_fused(model, jit="numba")(*args), fm.compile_numpy(model)(*args), rtol=1e-13
+    )
+
+
+def test_fused_kernels_match_on_a_million_points() -> None:
+    T = np.linspace(260.0, 380.0, N_POINTS)
+    for model in BUILTIN:
+        args = _args(model, T)
+        np.testing.assert_array_equal(
+            fm.compile_fused(model)(*args), fm.compile_numpy(model)(*args)
+        )
+    _compile_mod.clear_cache()
+
+
+def _best_of(kernel, args: tuple, repeat: int = 7) -> float:
+    kernel(*args)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        kernel(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("model", BUILTIN, ids=lambda m: m.name)
+def test_fused_kernel_timing_on_a_million_points(model) -> None:
+    args = _args(model, np.linspace(260.0, 380.0, N_POINTS))
+    naive = _best_of(fm.compile_numpy(model), args)
+    fused = _best_of(fm.compile_fused(model), args)
+    print(f"{model.name}: numpy {naive * 1e3:.2f} ms, fused {fused * 1e3:.2f} ms, {naive / fused:.2f}x")
+    # No model may get markedly slower; see fused.py for where it is faster.
+    assert fused < 1.25 * naive
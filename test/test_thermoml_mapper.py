@@ -895,6 +895,73 @@ class TestCompositionMolalityToMole:
         assert mole_fractions["solute_b"] == pytest.approx(0.2 / total)
 
 
+class TestDatasetCompositionCompletion:
+    @staticmethod
+    def _dataset():
+        from fairfluids.core.lib import Compound, Parameter, ParameterValue
+
+        refs = ["compound_1", "compound_2", "compound_3"]
+        compounds = [
+            Compound(compoundID=cid, commonName=name)
+            for cid, name in zip(refs, ("water", "ethanol", "methanol"))
+        ]
+        params = [
+            Parameter(parameterID=f"{tag}{k}", parameters=ptype, associated_compounds=[cid])
+            for tag, ptype in (("x", Parameters.MOLE_FRACTION), ("w", Parameters.MASS_FRACTION))
+            for k, cid in enumerate(refs)
+        ]
+        rows = [
+            # Two mole fractions given: complement.
+            [ParameterValue(parameterID="x0", paramValue=0.2),
+             ParameterValue(parameterID="x1", paramValue=0.3)],
+            # Mole fractions off by a common factor: normalized.
+            [ParameterValue(parameterID="x0", paramValue=0.4),
+             ParameterValue(parameterID="x1", paramValue=0.4),
+             ParameterValue(parameterID="x2", paramValue=0.4)],
+            # Two mass fractions given: completed, then converted.
+            [ParameterValue(parameterID="w0", paramValue=0.5),
+             ParameterValue(parameterID="w1", paramValue=0.25)],
+            # Nothing usable: kept as is.
+            [ParameterValue(parameterID="x0", paramValue=0.5)],
+        ]
+        return refs, compounds, params, rows
+
+    def test_matches_per_row_completion_and_resolves_masses_once(self, monkeypatch):
+        import copy
+
+        from fairfluids.io.canonical import composition
+
+        calls = []
+
+        def _fake_resolve_molar_masses(compounds, compound_refs, **kwargs):
+            calls.append(list(compound_refs))
+            return dict(zip(compound_refs, (18.015, 46.07, 32.042)))
+
+        monkeypatch.setattr(composition, "resolve_molar_masses", _fake_resolve_molar_masses)
+        refs, compounds, params, rows = self._dataset()
+
+        per_row = copy.deepcopy(rows)
+        for param_values in per_row:
+            composition.complete_composition_values(param_values, params, refs, compounds)
+        assert len(calls) == len(rows)
+
+        calls.clear()
+        composition.complete_dataset_composition_values(rows, params, refs, compounds)
+        assert len(calls) == 1
+
+        def _dump(dataset):
+            return [[(pv.parameterID, pv.paramValue) for pv in pvs] for pvs in dataset]
+
+        assert _dump(rows) == _dump(per_row)
+        values = [{pv.parameterID: pv.paramValue for pv in pvs} for pvs in rows]
+        assert values[0]["x2"] == pytest.approx(0.5)
+        assert [values[1][f"x{k}"] for k in range(3)] == [pytest.approx(1 / 3)] * 3
+        assert values[2]["w2"] == pytest.approx(0.25)
+        moles = [0.5 / 18.015, 0.25 / 46.07, 0.25 / 32.042]
+        assert values[2]["x0"] == pytest.approx(moles[0] / sum(moles))
+        assert set(values[3]) == {"x0"}
+
+
 class TestJe700300yMoleFractionCompletion:
     @pytest.fixture(scope="class")
     def je700300y_doc(self):